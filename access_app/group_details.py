@@ -14,8 +14,9 @@ class GroupDetailLogic:
 
     def create_new(self):
         """Add a new DisplayGroup to display via factory"""
-        g = DisplayGroup('NewGroup')
-        MDApp.get_running_app().db.groups[g.uid] = g
+        db = MDApp.get_running_app().db
+        g = DisplayGroup('NewGroup', catalog=db.catalog)
+        db.groups[g.uid] = g
         MDApp.get_running_app().refresh_rvs()
         self.refresh_from_data()
 
@@ -34,6 +35,9 @@ class GroupDetailLogic:
             other_group.uid = self.element.uid
             self.element.uid = 'g' + str(index + direction).zfill(z_factor)
             app.db.groups.update({self.element.uid: self.element, other_group.uid: other_group})
+            for group in (self.element, other_group):  # Items refer to their group by uid
+                for item in group.members.values():
+                    app.db.mark_dirty(item)
             return True  # Successfully swapped group uids (and therefore sort order)
 
     def swap(self, value):
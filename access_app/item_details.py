@@ -18,8 +18,10 @@ class ItemDetailLogic(BoxLayout):
 
     def create_new(self):
         """Add a new item to the database via factory"""
-        itm = GroceryItem(name='New Item', group='g00')
-        MDApp.get_running_app().db.items[itm.uid] = itm
+        db = MDApp.get_running_app().db
+        itm = GroceryItem(name='New Item', group='g00', catalog=db.catalog)
+        db.items[itm.uid] = itm
+        db.mark_dirty(itm)
         new_value = next(MDApp.get_running_app().data_factory.get('item_details', (itm,)))
         self.rv_ref.data.append(new_value)
         MDApp.get_running_app().refresh_rvs()
@@ -30,6 +32,7 @@ class ItemDetailLogic(BoxLayout):
         self.item.group = self._convert_group()
         self.item.defaults = self._convert_defaults()
         self.item.note = self.widget_refs['item_note'].text
+        MDApp.get_running_app().db.mark_dirty(self.item)
 
     def update_value(self, gather=True):
         """Save the current row of values"""
@@ -19,6 +19,17 @@ class LocationMapLogic(BoxLayout):
         Factory.MappingAttemptedNewItem().open()
         return True
 
+    def remap(self, location_name):
+        """Move this row's item to the location picked in the spinner, keeping the store's index in sync"""
+        if location_name == self.location_name:
+            return
+        for location in self.store.locations.values():
+            if location.name == location_name:
+                self.store.move_item(self.item_uid, location)
+                self.location_name = location.name
+                self.location_uid = location.uid_short
+                return True
+
 
 class LocationMapData(DataGenerator):
     """This class translates a `GroceryItem`-`Location` pair into a dict representation.
@@ -110,7 +121,11 @@ class ItemLocationContent(BoxLayout):
                     if item:
                         item = app.db.items[item]
                         items.add((store, location, item))
-            # print(len(items))
+
+            # Coverage check: catalog items this store doesn't map yet are listed as unsorted, ready to be placed
+            bits = app.db.catalog.bits
+            for uid in bits.members(store.unmapped(bits.bitset(app.db.items))):
+                items.add((store, store.unsorted, app.db.items[uid]))
 
             container.generate_data(items)
             container.to_layout()
@@ -16,10 +16,8 @@ class LocationDetailLogic:
     def create_new(self):
         """Add a new Location to our store via factory"""
         store = self._find_store(self.element.uid)
-        uid_index = max(int(uid[-2:]) for uid in store.locations)
-        new_uid = store.uid + 'l' + str(uid_index + 1).zfill(2)
-        loc = Location('New Location', uid=new_uid)
-        store.locations[loc.uid] = loc
+        loc = Location('New Location', uid=store.location_uids.next_after_high())  # New aisles go last
+        store.add_location(loc)
         self.refresh_from_data(store)
         MDApp.get_running_app().refresh_rvs()
         return True  # Prevents repeating creation for each tab
@@ -46,6 +44,7 @@ class LocationDetailLogic:
             other_location.uid = self.element.uid
             self.element.uid = store.uid + 'l' + str(index + direction).zfill(z_factor)
             store.locations.update({self.element.uid: self.element, other_location.uid: other_location})
+            store.specials = {loc for loc in store.locations.values() if loc.is_special}  # Hashes follow uids
             return store  # Successfully swapped location uids (and therefore sort order)
 
     def swap(self, value):
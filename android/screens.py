@@ -131,13 +131,11 @@ class ListLoaderScreen(Screen):
     """Load lists over the network"""
 
     def on_enter(self, *args):
-        io = MDApp.get_running_app().io_manager
-        sorted_names = sorted(io.locate_pool(return_names=True), reverse=True)
-
         if self.ids['grid_container'].children:
             return
 
-        for filename in sorted_names:
+        io = MDApp.get_running_app().io_manager
+        for filename in io.latest_pools(self.options):  # Newest first
             if FilePickerButton.instances >= self.options:
                 break
             btn = FilePickerButton(self, filename)
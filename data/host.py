@@ -2,13 +2,104 @@
 """Host script for database, pools, lists, etc."""
 
 import datetime
+import hashlib
+import io
+import json
 import os
 import socket
+import tarfile
 import threading
 from http import server, HTTPStatus
+from urllib.parse import urlsplit
+
+MANIFEST = 'manifest.json'
+BUNDLE = 'bundle.tar.gz'
+ETAG_HEADER = 'GROCERIES.etag'  # Pax header giving each bundled file the ETag it would be served with
+_digests = {}  # File path -> ((mtime_ns, size), sha1 of contents); files are only hashed again when they change
+_digests_lock = threading.Lock()
+
+
+def file_etag(stat):
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def file_info(path):
+    """Size, modification time and content hash of a file; `None` if there is no such file"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    stamp = stat.st_mtime_ns, stat.st_size
+    with _digests_lock:
+        cached = _digests.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path, 'rb') as f:
+            cached = stamp, hashlib.sha1(f.read()).hexdigest()
+        with _digests_lock:
+            _digests[path] = cached
+    return {'size': stat.st_size, 'mtime': stat.st_mtime, 'sha1': cached[1]}
+
+
+def build_manifest(root, user):
+    """Files the app reads, by section, each keyed by its path relative to `root` as it appears in URLs"""
+    def listing(directory):
+        try:
+            return [f'{directory}/{name}' for name in sorted(os.listdir(os.path.join(root, directory)))]
+        except OSError:
+            return []
+
+    sections = {'data': ['groups.txt', f'{user}/{user}.yaml', f'{user}/{user}.journal'],
+                'stores': listing('stores'),
+                'pools': listing(f'{user}/pools'),
+                'lists': listing(f'{user}/lists'),
+                }
+    manifest = {}
+    for section, paths in sections.items():
+        manifest[section] = {}
+        for path in paths:
+            if (info := file_info(os.path.join(root, path))) is not None:
+                manifest[section][path] = info
+    return manifest
+
+
+def bundle_paths(root, user, manifest=None):
+    """Everything the app loads on startup: groups, store files, the item database and its journal, and today's pool.
+    Other files in the stores directory aren't stores, so they are left out.
+    """
+    manifest = manifest or build_manifest(root, user)
+    today = f'{user}/pools/{get_date(3)}itempool.yaml'
+    return [*manifest['data'], *(path for path in manifest['stores'] if path.endswith('.yaml')),
+            *(path for path in manifest['pools'] if path == today)]
+
+
+class ChunkedWriter:
+    """File-like object sending what is written to it as HTTP/1.1 chunks.
+    Used as a context manager, the body is only ended if no exception was raised: a body cut short must not look
+    complete, so its connection has to be closed instead.
+    """
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def write(self, data):
+        if data:
+            self.wfile.write(f'{len(data):x}\r\n'.encode() + bytes(data) + b'\r\n')
+        return len(data)
+
+    def close(self):
+        self.wfile.write(b'0\r\n\r\n')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *_):
+        if exc_type is None:
+            self.close()
 
 
 class MyHandler(server.SimpleHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep connections alive between requests from the app
+    timeout = 30  # Seconds before an idle kept-alive connection is closed
     allowed_ips = ['127.0.0.1',
                    '192.168.1.154',
                    '192.168.1.241',
@@ -16,6 +107,83 @@ class MyHandler(server.SimpleHTTPRequestHandler):
                    '192.168.1.252'
                    ]
 
+    def do_GET(self):
+        """`/<user>/manifest.json` describes that user's files (see `build_manifest`) and `/<user>/bundle.tar.gz`
+        streams the files needed on startup (see `bundle_paths`); anything else is a file
+        """
+        parts = urlsplit(self.path).path.strip('/').split('/')
+        if len(parts) == 2 and parts[0] not in ('', '.', '..'):
+            if parts[1] == MANIFEST:
+                return self.send_manifest(parts[0])
+            if parts[1] == BUNDLE:
+                return self.send_bundle(parts[0])
+        return server.SimpleHTTPRequestHandler.do_GET(self)
+
+    def send_manifest(self, user):
+        body = json.dumps(build_manifest(self.directory, user)).encode()
+        self._etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if self._not_modified():
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_bundle(self, user):
+        """Stream a gzipped tar of the startup files, compressing each file as it is read.
+        The manifest comes first, so the app can tell whether everything it lists arrived.
+        """
+        manifest = build_manifest(self.directory, user)
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'application/gzip')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        try:
+            with ChunkedWriter(self.wfile) as out, \
+                    tarfile.open(fileobj=out, mode='w|gz', format=tarfile.PAX_FORMAT) as bundle:
+                body = json.dumps(manifest).encode()
+                info = tarfile.TarInfo(f'{user}/{MANIFEST}')
+                info.size = len(body)
+                bundle.addfile(info, io.BytesIO(body))
+                for path in bundle_paths(self.directory, user, manifest):
+                    full_path = os.path.join(self.directory, path)
+                    info = bundle.gettarinfo(full_path, arcname=path)
+                    info.pax_headers = {ETAG_HEADER: file_etag(os.stat(full_path))}
+                    with open(full_path, 'rb') as f:
+                        bundle.addfile(info, f)
+        except OSError as e:  # E.g. a file removed while it was being sent
+            self.log_error('Bundle for %s cut short: %s', user, e)
+            self.close_connection = True  # The body was left unterminated, so only closing the connection ends it
+
+    def _not_modified(self):
+        """Send `304 Not Modified` if the client's `If-None-Match` names the current ETag"""
+        tags = self.headers.get('If-None-Match', '')
+        if tags == '*' or self._etag in tags.split(', '):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.end_headers()
+            return True
+        return False
+
+    def send_head(self):
+        """Answer `If-None-Match` with `304 Not Modified` when the file's ETag still matches.
+        `If-Modified-Since` is handled by the base class; both validators are sent with every file.
+        """
+        self._etag = None
+        path = self.translate_path(self.path)
+        if os.path.isfile(path):
+            self._etag = file_etag(os.stat(path))
+            if self._not_modified():
+                return None
+        return server.SimpleHTTPRequestHandler.send_head(self)
+
+    def end_headers(self):
+        if getattr(self, '_etag', None):
+            self.send_header('ETag', self._etag)
+            self.send_header('Cache-Control', 'no-cache')  # Stored copies must be revalidated before use
+            self._etag = None  # Connections are kept alive, so don't carry it over to the next request
+        return server.SimpleHTTPRequestHandler.end_headers(self)
+
     def handle_one_request(self):
         print(self.client_address[0], self.client_address)
         if str(self.client_address[0]) in MyHandler.allowed_ips:
@@ -56,7 +224,7 @@ def listen_to_connection(s):
 def _serve(_):
     handler = MyHandler
     address = ('', 42209)
-    myserver = server.HTTPServer(address, handler)
+    myserver = server.ThreadingHTTPServer(address, handler)  # A kept-alive connection mustn't hold up others
     myserver.serve_forever()
 
 
@@ -68,9 +236,12 @@ def _write(_):
 
     while True:
         message = listen_to_connection(s)
-        relative_path, body = message.split('::')
+        relative_path, body = message.split('::', maxsplit=1)
+        mode = 'w'
+        if relative_path.startswith('+'):  # Append, e.g. records for a change journal
+            relative_path, mode = relative_path[1:], 'a'
         filepath = os.path.join(os.getcwd(), relative_path)
-        with open(filepath, 'w') as f:
+        with open(filepath, mode) as f:
             f.write(body)
 
 
@@ -1,28 +1,38 @@
+import sys
+
+
 class UIDRoot:
     """Comparison and hash values for objects with uids (Group, Item, Location)"""
 
-    uid = None
+    __slots__ = ()  # Lets the compact catalog classes drop their instance `__dict__`
+    _uid = None
+
+    @property
+    def uid(self):
+        return self._uid
+
+    @uid.setter
+    def uid(self, value):
+        """Interned so that comparisons between equal uids are usually an identity check"""
+        self._uid = sys.intern(value) if isinstance(value, str) else value
 
     def __ge__(self, other):
-        return str.__ge__(self.uid, other.uid)
+        return self._uid >= other.uid
 
     def __le__(self, other):
-        return str.__ge__(self.uid, other.uid)
+        return self._uid <= other.uid
 
     def __gt__(self, other):
-        return str.__gt__(self.uid, other.uid)
+        return self._uid > other.uid
 
     def __lt__(self, other):
-        return str.__lt__(self.uid, other.uid)
+        return self._uid < other.uid
 
     def __eq__(self, other):
-        if self.uid == other:
-            return True
-        try:
-            if self.uid == other.uid:
-                return True
-        except (AttributeError, ValueError):
-            return
+        if isinstance(other, UIDRoot):
+            return self._uid == other._uid
+        return self._uid == other
 
     def __hash__(self):
-        return hash(self.__repr__())
+        """Consistent with `__eq__`, which treats an object and its uid string as equal"""
+        return hash(self._uid)
@@ -0,0 +1,104 @@
+"""Laying out one pool for every store at once.
+
+`LocationMatrix` holds, for each store, a row indexed by catalog bit position (see `logical.bitsets`) giving the
+slot of the location an item is mapped to. Resolving a whole pool for a store is then a single `itemgetter` call
+over that row instead of a `Store.__getitem__` lookup per item.
+"""
+import io
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+from logical.bitsets import popcount
+from logical.pools_and_lists import ItemPool, ListWriter
+
+UNMAPPED = -1
+
+
+class LocationMatrix:
+    """Store x item table of location slots; rows are rebuilt only for stores whose mapping has changed"""
+
+    def __init__(self, stores, index):
+        self.index = index  # Catalog `BitIndex`
+        self.stores = list({id(store): store for store in stores}.values())  # `default` duplicates a store
+        self.locations = {}  # Store uid -> locations in slot order
+        self._rows = {}  # Store uid -> (store version, row)
+        self.refresh()
+
+    def refresh(self):
+        for store in self.stores:
+            if self._rows.get(store.uid, (None,))[0] != store.version:
+                self._build(store)
+        return self
+
+    def _build(self, store):
+        position = self.index.position
+        locations = sorted(store.locations.values(), key=lambda loc: loc.uid)
+        mapped = [(n, position(item)) for n, loc in enumerate(locations) for item in loc.items if item]
+        row = array('h', [UNMAPPED]) * len(self.index)
+        for slot, bit in mapped:
+            row[bit] = slot
+        self.locations[store.uid] = locations
+        self._rows[store.uid] = store.version, row
+
+    def row(self, store):
+        """Slots of every indexed item at `store`; grown first if uids were indexed since it was built"""
+        row = self._rows[store.uid][1]
+        if len(row) < len(self.index):
+            row.extend(array('h', [UNMAPPED]) * (len(self.index) - len(row)))
+        return row
+
+    def resolve(self, positions, store):
+        """Slots at `store` for the items at `positions`"""
+        if not positions:
+            return ()
+        slots = itemgetter(*positions)(self.row(store))
+        return slots if len(positions) > 1 else (slots,)
+
+
+def _sections(entries, slots, store, locations):
+    """Group pool entries by location uid; unmapped items go to `Unsorted`"""
+    sections = {}
+    unsorted = store.unsorted.uid
+    for entry, slot in zip(entries, slots):
+        location = unsorted if slot == UNMAPPED else locations[slot].uid
+        try:
+            sections[location].add(entry)
+        except KeyError:
+            sections[location] = {entry}
+    return sections
+
+
+def render_all(pool: ItemPool, stores, matrix=None, fmt='plaintext', workers=None):
+    """Render `pool` for every store in `stores` (e.g. `Database.stores.values()`).
+    Returns two dicts keyed by store name: the rendered lists and the number of unsorted items at each store.
+    Stores are rendered on a thread pool of `workers` threads if given. The stores' mappings are not changed.
+    """
+    stores = list({id(store): store for store in stores}.values())
+    if not stores:
+        return {}, {}
+    if matrix is None:
+        matrix = LocationMatrix(stores, stores[0].catalog.bits)
+    matrix.refresh()
+
+    index = matrix.index
+    entries = list(pool.items_dict.values())
+    positions = [index.position(uid) for uid in pool.items_dict]  # Computed once for all stores
+    bits = index.bitset(pool.items_dict)
+
+    def render(store):
+        slots = matrix.resolve(positions, store)
+        writer = ListWriter(pool, store, sections=_sections(entries, slots, store, matrix.locations[store.uid]))
+        sink = io.StringIO()
+        writer.render(sink, fmt)
+        return sink.getvalue()
+
+    if workers:
+        with ThreadPoolExecutor(workers) as executor:
+            rendered = list(executor.map(render, stores))
+    else:
+        rendered = [render(store) for store in stores]
+
+    lists = {store.name: text for store, text in zip(stores, rendered)}
+    unsorted = {store.name: popcount(store.unsorted_in(bits)) for store in stores}
+    return lists, unsorted
@@ -0,0 +1,53 @@
+"""Sets of catalog uids held as bits of a Python `int`.
+
+Each catalog numbers the uids it sees densely, so a set of items becomes an integer with one bit per item and
+intersections, unions and differences run a machine word at a time instead of probing a hash set per uid.
+"""
+
+
+try:
+    popcount = int.bit_count  # Number of members of a bitset
+except AttributeError:  # Before Python 3.10
+    def popcount(bits):
+        return bin(bits).count('1')
+
+
+class BitIndex:
+    """Dense numbering of uids; a uid gets the next bit position the first time it is seen"""
+
+    def __init__(self):
+        self.positions = {}
+        self.uids = []
+
+    def __len__(self):
+        return len(self.uids)
+
+    def position(self, uid):
+        uid = getattr(uid, 'uid', uid)
+        try:
+            return self.positions[uid]
+        except KeyError:
+            self.positions[uid] = n = len(self.uids)
+            self.uids.append(uid)
+            return n
+
+    def bit(self, uid):
+        return 1 << self.position(uid)
+
+    def bitset(self, uids):
+        """Bitset of uids (or objects with a uid); falsy entries, such as blank YAML items, are skipped"""
+        bits = 0
+        position = self.position
+        for uid in uids:
+            if uid:
+                bits |= 1 << position(uid)
+        return bits
+
+    def members(self, bits):
+        """Uids in a bitset, in bit order"""
+        uids = []
+        while bits:
+            low = bits & -bits
+            uids.append(self.uids[low.bit_length() - 1])
+            bits ^= low
+        return uids
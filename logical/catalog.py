@@ -0,0 +1,65 @@
+"""Registries shared by the objects belonging to one catalog"""
+from array import array
+
+from logical.bitsets import BitIndex
+from logical.uids import UIDAllocator
+
+
+class NoteTable:
+    """Interned note strings, numbered in order of first use; number 0 is the empty note"""
+
+    def __init__(self):
+        self.strings = ['']
+        self.ids = {'': 0}
+
+    def __getitem__(self, n):
+        return self.strings[n]
+
+    def __len__(self):
+        return len(self.strings)
+
+    def intern(self, note):
+        note = note or ''
+        try:
+            return self.ids[note]
+        except KeyError:
+            self.ids[note] = n = len(self.strings)
+            self.strings.append(note)
+            return n
+
+
+class Catalog:
+    """Lookup tables and uid allocators for one household's catalog.
+    Each `Database` owns a `Catalog` and passes it to the groups, items and stores it builds, so several
+    databases can be built and queried independently in one process.
+    """
+
+    default = None  # Used by objects created without an explicit catalog
+
+    def __init__(self):
+        self.groups = {}
+        self.group_names = {}
+        self.items = {}
+        self.new_items = {}
+        self.stores = {}
+        self.store_uids = {}
+        self.item_names = set()
+        self.group_uids = UIDAllocator('g', 2)
+        self.item_uids = UIDAllocator('i', 3)
+        self.bits = BitIndex()  # Bit positions of item uids for bitset views of pools and locations
+        self.packed_defaults = array('q')  # (timestamp, amount) pairs of every compact item, see `CompactGroceryItem`
+        self.notes = NoteTable()  # Note strings of the compact pools built on this catalog
+        self.group_listeners = []  # Called as `listener(item, old_group, new_group)` when an item changes group
+
+    def regrouped(self, item, old, new):
+        """Notify listeners that `item` moved from group `old` to `new`; `old` is `None` for a new item"""
+        for listener in self.group_listeners:
+            listener(item, old, new)
+
+    @classmethod
+    def resolve(cls, catalog):
+        """The given catalog, or the process-wide default one"""
+        return catalog if catalog is not None else cls.default
+
+
+Catalog.default = Catalog()
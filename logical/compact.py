@@ -0,0 +1,196 @@
+"""Slotted versions of the catalog classes for memory-constrained devices.
+
+Behaviour is borrowed from the regular classes so both kinds use the same catalog registries and can be mixed
+freely; only storage differs. The defaults of every item of a catalog are packed into one flat `array` of
+(timestamp, amount) pairs, and pools kept for analysis can be held as columns of integers by `CompactItemPool`.
+"""
+from array import array
+from bisect import bisect_left
+
+from logical import UIDRoot
+from logical.catalog import Catalog
+from logical.groups_and_items import DisplayGroup, GroceryItem, GroupRoot
+from logical.pools_and_lists import ItemPool
+from logical.stores import Location
+
+PLACEHOLDER = -0x8000  # Stored in place of the unicode dot used for an unspecified amount
+AMOUNTS = range(PLACEHOLDER + 1, 0x8000)  # Amounts that fit an int16 column without being taken for PLACEHOLDER
+NO_DEFAULT = -0x8000_0000_0000_0000  # `PLACEHOLDER` of the int64 defaults array, which takes any other amount
+
+
+def pack_amount(amount):
+    """Integer stored for an amount; anything that isn't a number is stored as `PLACEHOLDER`"""
+    try:
+        value = int(amount)
+    except (TypeError, ValueError):
+        return PLACEHOLDER
+    if value not in AMOUNTS:
+        raise ValueError(f'Amount {amount!r} is outside {AMOUNTS.start}..{AMOUNTS.stop - 1}')
+    return value
+
+
+def pack_default(amount):
+    """Integer stored for the amount of a default; anything that isn't a number is stored as `NO_DEFAULT`"""
+    try:
+        return int(amount)
+    except (TypeError, ValueError):
+        return NO_DEFAULT
+
+
+class CompactDisplayGroup(GroupRoot):
+    """`DisplayGroup` without an instance `__dict__`"""
+
+    __slots__ = ('_uid', 'name', 'catalog', 'members')
+
+    __init__ = DisplayGroup.__init__
+
+
+class CompactGroceryItem(UIDRoot):
+    """`GroceryItem` without an instance `__dict__`.
+    Defaults are kept as `_count` pairs from pair `_at` of the catalog's `packed_defaults`; a list no longer than
+    before is rewritten in place, a longer one is appended and its old pairs are left unused.
+    """
+
+    __slots__ = ('_uid', 'name', '_group', '_at', '_count', 'note', 'catalog', 'dirty')
+
+    __init__ = GroceryItem.__init__
+    __str__ = GroceryItem.__str__
+    __repr__ = GroceryItem.__repr__
+    set_defaults = staticmethod(GroceryItem.set_defaults)
+    group = GroceryItem.group
+
+    @property
+    def defaults(self):
+        packed, start = self.catalog.packed_defaults, 2 * self._at
+        return [(packed[i], '\u00B7' if packed[i + 1] == NO_DEFAULT else packed[i + 1])
+                for i in range(start, start + 2 * self._count, 2)]
+
+    @defaults.setter
+    def defaults(self, pairs):
+        flat = array('q')
+        for time_, value in pairs:
+            flat.extend((int(time_), pack_default(value)))
+        packed, count = self.catalog.packed_defaults, len(flat) // 2
+        if count <= getattr(self, '_count', -1):
+            packed[2 * self._at:2 * self._at + len(flat)] = flat
+        else:
+            self._at = len(packed) // 2
+            packed.extend(flat)
+        self._count = count
+
+
+class CompactLocation(UIDRoot):
+    """`Location` without an instance `__dict__`"""
+
+    __slots__ = ('_uid', 'name', 'is_special', 'items', 'store', 'bits')
+
+    __init__ = Location.__init__
+    add_item = Location.add_item
+    remove_item = Location.remove_item
+    uid_short = Location.uid_short
+
+
+class CompactItemPool:
+    """`ItemPool` held as parallel columns sorted by item number: `ids` (uid numbers), `amounts` (int16, with
+    `PLACEHOLDER` for the unicode dot) and `notes` (indices into a `NoteTable`, by default the catalog's).
+    Items are resolved through `catalog` only when converting back with `to_pool`.
+
+    Set operations keep the entries of the left-hand pool for items present in both.
+    """
+
+    __slots__ = ('ids', 'amounts', 'notes', 'note_table', 'catalog')
+
+    def __init__(self, entries=(), catalog=None, note_table=None):
+        """`entries` are `(uid, amount, note)` triples in any order; amounts must be in `AMOUNTS`"""
+        self.catalog = Catalog.resolve(catalog)
+        self.note_table = self.catalog.notes if note_table is None else note_table
+        self.ids, self.amounts, self.notes = array('i'), array('h'), array('i')
+
+        entries = list(entries)
+        self._fill([e[0] for e in entries], [e[1] for e in entries], [e[2] for e in entries])
+
+    def _fill(self, uids, amounts, notes):
+        """Append entries given as columns, sorted by item number; only the first entry for an item is kept"""
+        parse, intern = self.catalog.item_uids.parse, self.note_table.intern
+        keys = [parse(uid) for uid in uids]
+        last = None
+        for i in sorted(range(len(keys)), key=keys.__getitem__):
+            n = keys[i]
+            if n == last:
+                continue
+            last = n
+            self.ids.append(n)
+            self.amounts.append(pack_amount(amounts[i]))
+            self.notes.append(intern(notes[i]))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, uid):
+        n = self.catalog.item_uids.parse(uid)
+        i = bisect_left(self.ids, n)
+        return i < len(self.ids) and self.ids[i] == n
+
+    def __iter__(self):
+        """`(uid, amount, note)` for every entry, in item order"""
+        uid, notes = self.catalog.item_uids.format, self.note_table
+        for n, amount, note in zip(self.ids, self.amounts, self.notes):
+            yield uid(n), '\u00B7' if amount == PLACEHOLDER else amount, notes[note]
+
+    @property
+    def nbytes(self):
+        """Memory held by the columns"""
+        return sum(column.itemsize * len(column) for column in (self.ids, self.amounts, self.notes))
+
+    @classmethod
+    def from_pool(cls, pool: ItemPool, catalog=None, note_table=None):
+        compact = cls(catalog=catalog, note_table=note_table)
+        triples = pool.items_dict.values()
+        compact._fill(list(pool.items_dict), [t[1] for t in triples], [t[2] for t in triples])
+        return compact
+
+    def to_pool(self):
+        """`ItemPool` of the same entries; items are looked up in the catalog's items and new items"""
+        tables = self.catalog.items, self.catalog.new_items
+        items = {}
+        for uid, amount, note in self:
+            item = tables[0][uid] if uid in tables[0] else tables[1][uid]
+            items[uid] = item, amount, note
+        pool = ItemPool.__new__(ItemPool)  # Amounts are already coerced
+        pool._items = items
+        return pool
+
+    def _select(self, keep, other=None, other_keep=()):
+        """New pool of the entries of `self` whose ids are in `keep`, and those of `other` in `other_keep`"""
+        result = CompactItemPool(catalog=self.catalog, note_table=self.note_table)
+        rows = [row for row in zip(self.ids, self.amounts, self.notes) if row[0] in keep]
+        if other_keep:
+            if other.note_table is self.note_table:
+                notes = None
+            else:  # Renumber notes into this pool's table
+                notes = {t: self.note_table.intern(other.note_table[t]) for t in set(other.notes)}
+            rows += [(n, a, t if notes is None else notes[t])
+                     for n, a, t in zip(other.ids, other.amounts, other.notes) if n in other_keep]
+            rows.sort()
+        for column, values in zip((result.ids, result.amounts, result.notes), zip(*rows)):
+            column.extend(values)
+        return result
+
+    def bitset(self, index=None):
+        """Members of the pool as a bitset of `index`, by default the catalog's"""
+        index = self.catalog.bits if index is None else index
+        return index.bitset(map(self.catalog.item_uids.format, self.ids))
+
+    def union(self, other):
+        ids = set(self.ids)
+        return self._select(ids, other, set(other.ids) - ids)
+
+    def intersection(self, other):
+        return self._select(set(self.ids) & set(other.ids))
+
+    def difference(self, other):
+        return self._select(set(self.ids) - set(other.ids))
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
@@ -1,6 +1,8 @@
 import time
 
-from logical.groups_and_items import DisplayGroup, GroceryItem
+from logical.catalog import Catalog
+from logical.compact import CompactDisplayGroup, CompactGroceryItem, CompactLocation
+from logical.groups_and_items import DisplayGroup, GroceryItem, LazyGroceryItem
 from logical.pools_and_lists import ItemPool
 from logical.stores import Store, Location
 
@@ -8,20 +10,27 @@ from logical.stores import Store, Location
 class Database:
     """Handles creation of python objects from data sources"""
 
-    groups = {}
-    items = {}
-    new_items = {}
-    stores = {}
-    _item_names = set()
-
     def __init__(self, **kwargs):
+        self.catalog = kwargs.get('catalog') or Catalog()  # Registries owned by this database alone
+        self.groups = self.catalog.groups
+        self.items = self.catalog.items
+        self.new_items = self.catalog.new_items
+        self.stores = self.catalog.stores
+        self._item_names = self.catalog.item_names
+        self.dirty = set()  # Uids of items created or updated since the last save
+
         self._store_default = kwargs.get('default_store')
+        self._records = kwargs.get('records')  # Lazy catalog: callable returning the full record for an item uid
+        if kwargs.get('compact'):  # Slotted classes for memory-constrained devices
+            self.group_cls, self.item_cls, self.location_cls = CompactDisplayGroup, CompactGroceryItem, CompactLocation
+        else:
+            self.group_cls, self.item_cls, self.location_cls = DisplayGroup, GroceryItem, Location
         if not kwargs.get('build_empty'):
             self.build(**kwargs)
 
     def __getitem__(self, item):
         """Get a reference to any stored object by its UID"""
-        for dict_ in (self.groups, self.items, self.stores, self.new_items,):
+        for dict_ in self._route(item):
             try:
                 return dict_[item]
             except KeyError:
@@ -29,6 +38,39 @@ class Database:
         else:
             raise KeyError(f'No database key present in set(items, groups, stores, new_items) for {item}')
 
+    def _route(self, uid):
+        """Pick the tables which may hold `uid` based on its prefix (`g00`, `i000`, `s00`); anything else
+        is treated as a store name.
+        """
+        key = str(uid)
+        if key[1:].isdigit():
+            kind = key[0]
+            if kind == 'i':
+                return self.items, self.new_items
+            elif kind == 'g':
+                return self.groups,
+            elif kind == 's':
+                return self.catalog.store_uids,
+        return self.stores,
+
+    def get_many(self, uids, default=KeyError):
+        """Look up several uids at once, returning objects in the same order.
+        Missing uids raise `KeyError` unless a `default` value is supplied to stand in for them.
+        """
+        found = []
+        for uid in uids:
+            for dict_ in self._route(uid):
+                try:
+                    found.append(dict_[uid])
+                except KeyError:
+                    continue
+                break
+            else:
+                if default is KeyError:
+                    raise KeyError(f'No database key present in set(items, groups, stores, new_items) for {uid}')
+                found.append(default)
+        return found
+
     def build(self, **kwargs):
         """Create various python objects for use in app"""
         self.build_groups(kwargs.get('groups'))
@@ -40,7 +82,7 @@ class Database:
 
         for i, line in enumerate(source):
             if line:
-                group_ = DisplayGroup(line, uid=i)
+                group_ = self.group_cls(line, uid=i, catalog=self.catalog)
                 self.groups[group_.uid] = group_
 
     def build_stores(self, source):
@@ -56,20 +98,25 @@ class Database:
                 special = values['_is_special']
                 item_pool = set(values['items'])
                 loc_uid = ''.join((store_uid, uid))
-                loc = Location(loc_name, items=item_pool, uid=loc_uid, special=special)
+                loc = self.location_cls(loc_name, items=item_pool, uid=loc_uid, special=special)
                 loc_pool.add(loc)
 
-            self.stores[name] = Store(name, loc_pool, uid=store_uid)
+            self.stores[name] = Store(name, loc_pool, uid=store_uid, catalog=self.catalog)
             n += 1
 
         if self._store_default:
             self.stores['default'] = self.stores[self._store_default]
 
     def build_items(self, source):
-        """Build `GroceryItem` objects from data source"""
+        """Build `GroceryItem` objects from data source.
+        When a `records` callable was given, entries without defaults are headers and become `LazyGroceryItem`s.
+        """
 
         for uid, kwargs in source.items():
-            item = GroceryItem(uid=uid, **kwargs)
+            if self._records is not None and 'defaults' not in kwargs:
+                item = LazyGroceryItem(uid=uid, catalog=self.catalog, records=self._records, **kwargs)
+            else:
+                item = self.item_cls(uid=uid, catalog=self.catalog, **kwargs)
             self.items[item.uid] = item
             self._item_names.add(item.name)
 
@@ -77,43 +124,77 @@ class Database:
     def item_names(self):
         return self._item_names
 
+    def group_items(self, group):
+        """Catalog items of a group, taken from the members it keeps; new items are left out"""
+        items = self.items
+        return [item for item in group.members.values() if item.uid in items]
+
     @property
     def items_by_group(self):
+        """Catalog items of each group that has any; groups keep their own members, so the catalog isn't scanned"""
         by_group = {}
-        for item in self.items.values():
-            try:
-                by_group[item.group].append(item)
-            except KeyError:
-                by_group[item.group] = [item]
+        for group in self.groups.values():
+            if members := self.group_items(group):
+                by_group[group] = members
         return by_group
 
+    def mark_dirty(self, item):
+        """Flag an item as changed so its saved form is rebuilt on the next save"""
+        item.dirty = True
+        self.dirty.add(item.uid)
+
+    def clear_dirty(self):
+        """Called once changes have been saved"""
+        for item in self.get_many(self.dirty, default=None):
+            if item is not None:
+                item.dirty = False
+        self.dirty.clear()
+
     def add_new_item(self, info: dict):
         """Method for creating a new item from dialogs or loading unknown item from pool"""
         name = info['name']
         kwargs = {k: v for k, v in info.items() if k != 'name'}
-        item = GroceryItem(name, **kwargs)
+        item = self.item_cls(name, catalog=self.catalog, **kwargs)
         self.new_items[item.uid] = item
+        self.mark_dirty(item)
         return item
 
+    def add_new_items(self, infos):
+        """Bulk version of `add_new_item`; items without a uid are numbered from one contiguous block"""
+        block = iter(self.catalog.item_uids.reserve(sum(1 for info in infos if not info.get('uid'))))
+        items = []
+        for info in infos:
+            kwargs = {k: v for k, v in info.items() if k != 'name'}
+            if not kwargs.get('uid'):
+                kwargs['uid'] = next(block)
+            item = self.item_cls(info['name'], catalog=self.catalog, **kwargs)
+            self.new_items[item.uid] = item
+            self.mark_dirty(item)
+            items.append(item)
+        return items
+
     def set_new_defaults(self, pool: ItemPool):
         """Update default options and note text based on a newly created list"""
         now = round(time.time())
-        for key, triple in pool.items():
+        triples = pool.items_dict
+        for item, triple in zip(self.get_many(triples), triples.values()):
             _, new_num, new_note = triple
-            item = self[key]
-            defaults_ = [amount for _, amount in sorted(item.defaults, key=lambda d: d[0])]
+            defaults_ = sorted(item.defaults, key=lambda d: d[0])
+            amounts = [amount for _, amount in defaults_]
 
             try:
                 new_num = int(new_num)
             except ValueError:
                 new_num = "\u00B7"
 
-            if new_num in defaults_:
-                item.defaults.pop(defaults_.index(new_num))
+            if new_num in amounts:
+                defaults_.pop(amounts.index(new_num))
             elif len(defaults_) >= 3:
-                item.defaults = defaults_[1:]
+                defaults_ = defaults_[1:]
 
-            item.defaults.append((now, new_num))
+            defaults_.append((now, new_num))
+            item.defaults = defaults_  # Assigned rather than mutated in place so compact items can repack
 
             if new_note:
                 item.note = new_note
+            self.mark_dirty(item)
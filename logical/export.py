@@ -0,0 +1,70 @@
+"""Saving, printing and sending a list from a single rendering.
+
+`ListExport` holds a pool as it is written to disk and, when a list is wanted, the list rendered once as text and
+as an email. `ExportPipeline` prepares that export on a worker thread and hands it to each requested sink, running
+sinks concurrently unless one has to follow another (printing needs the list file written first).
+"""
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+from logical.list_formats import FORMATS
+
+
+class ListExport:
+    """Everything the sinks write, produced once per export"""
+
+    def __init__(self, pool_data, writer=None, fmt='plaintext'):
+        self.pool_data = pool_data  # Yaml-friendly pool, as from `IOManager.format_pool`
+        self.writer = writer
+        self.format = FORMATS[fmt] if isinstance(fmt, str) else fmt
+        self.text = self.email = None
+        if writer is not None:
+            body = io.StringIO()
+            writer.render(body, self.format)
+            self.text = body.getvalue()
+            self.email = writer.email_head(self.format) + self.text
+
+
+class ExportPipeline:
+    """Runs named sinks on a thread pool.
+    `sinks` maps each name to a callable taking a `ListExport` and returning a message for the user, along with the
+    names of the sinks it must follow; those are run as well whenever it is requested.
+    """
+
+    def __init__(self, sinks, workers=4):
+        self.sinks = sinks
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix='export')
+
+    def run(self, prepare, names):
+        """Call `prepare` for the `ListExport`, then pass it to the sinks `names`.
+        Returns a future of the sinks' messages by name, in the order requested.
+        Tasks only ever wait on tasks submitted before them, which the executor starts first, so they can't deadlock.
+        """
+        submit = self._executor.submit
+        prepared = submit(prepare)
+        futures = {}
+
+        def schedule(name):
+            if name not in futures:
+                sink, after = self.sinks[name]
+                waits = [schedule(prior) for prior in after]
+                futures[name] = submit(self._run_sink, sink, prepared, waits)
+            return futures[name]
+
+        for name in names:
+            schedule(name)
+        return submit(self._gather, {name: futures[name] for name in names})
+
+    @staticmethod
+    def _run_sink(sink, prepared, waits):
+        export = prepared.result()
+        for future in waits:
+            future.result()  # Re-raises if an earlier sink failed
+        return sink(export)
+
+    @staticmethod
+    def _gather(futures):
+        return {name: future.result() for name, future in futures.items()}
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
@@ -1,29 +1,33 @@
 import time
 
 from logical import UIDRoot
+from logical.catalog import Catalog
 
 
-class DisplayGroup(UIDRoot):
+class GroupRoot(UIDRoot):
+    """Common base of `DisplayGroup` and `compact.CompactDisplayGroup`"""
+
+    __slots__ = ()
+
+
+class DisplayGroup(GroupRoot):
     """Grouping items for display"""
-    _names = {}
-    _uids = {}
 
-    def __init__(self, name, uid=None):
+    def __init__(self, name, uid=None, catalog=None):
         self.name = name
+        self.catalog = Catalog.resolve(catalog)
+        self.members = {}  # Items in this group by uid; kept current by `GroceryItem.group`
 
-        if not uid:
-            self.uid = 'g' + str(len(self._names)).zfill(2)
-        elif 'g' in str(uid):
-            self.uid = uid
+        if uid is None:
+            self.uid = self.catalog.group_uids.allocate()
         else:
-            self.uid = 'g' + str(uid).zfill(2)
+            self.uid = self.catalog.group_uids.claim(uid, exclusive=False)  # Group uids are positions set by user
 
-        DisplayGroup._names[self.name] = self
-        DisplayGroup._uids[self.uid] = self
+        self.catalog.group_names[self.name] = self
+        self.catalog.groups[self.uid] = self
 
 
 class GroceryItem(UIDRoot):
-    _uids = set()
 
     def __init__(self,
                  name=None,
@@ -31,29 +35,25 @@ class GroceryItem(UIDRoot):
                  defaults=None,
                  note=None,
                  uid=None,
+                 catalog=None,
                  ):
 
         if not name:
             raise ValueError('Item name cannot be `None`')
 
         self.name = name
+        self.catalog = Catalog.resolve(catalog)
 
-        if not uid:
-            self.uid = self._try_uid(0)
-        elif 'i' in str(uid):
-            if uid not in self._uids:
-                self.uid = uid
-            else:
-                self.uid = self._try_uid(int(uid[1:]))
+        if uid is None:
+            self.uid = self.catalog.item_uids.allocate()
         else:
-            self.uid = self._try_uid(uid)
+            self.uid = self.catalog.item_uids.claim(uid)
 
         self._group = None  # Set by @group.setter
         self.group = group  # ibid
         self.defaults = self.set_defaults(defaults)
         self.note = '' if not note else note
-
-        GroceryItem._uids.add(self.uid)  # Needed for uid calc
+        self.dirty = False  # Set through `Database.mark_dirty` when the item changes
 
     def __str__(self):
         return f'{self.name} ({self.uid})'
@@ -69,13 +69,6 @@ class GroceryItem(UIDRoot):
             f')'
         )
 
-    def _try_uid(self, n):
-        uid_ = 'i' + str(len(self._uids) + n).zfill(3)
-        if uid_ not in self._uids:
-            return uid_
-        else:
-            return self._try_uid(n + 1)
-
     @staticmethod
     def set_defaults(old):
         if not old:
@@ -96,15 +89,64 @@ class GroceryItem(UIDRoot):
 
     @group.setter
     def group(self, value):
-        if isinstance(value, DisplayGroup):
-            self._group = value
+        if isinstance(value, GroupRoot):
+            group = value
         else:
-            for dict_ in [DisplayGroup._uids, DisplayGroup._names]:
+            for dict_ in [self.catalog.groups, self.catalog.group_names]:
                 try:
-                    self._group = dict_[value]
+                    group = dict_[value]
                 except KeyError:
                     pass
                 else:
                     break
             else:
                 raise ValueError(self.group)
+
+        old, self._group = self._group, group
+        if group is not old:
+            if old is not None:
+                old.members.pop(self.uid, None)
+            group.members[self.uid] = self
+            self.catalog.regrouped(self, old, group)
+
+
+class LazyGroceryItem(GroceryItem):
+    """`GroceryItem` built from a header (uid, name, group) alone.
+    Defaults and note are fetched by calling `records` with the item's uid the first time either is used.
+    """
+
+    def __init__(self, name=None, group=None, uid=None, catalog=None, records=None):
+        super().__init__(name, group=group, uid=uid, catalog=catalog)
+        self._records = records
+        self._defaults = self._note = None  # Placeholders set by `GroceryItem.__init__` are discarded
+
+    def _load(self):
+        record = self._records(self.uid)
+        if self._defaults is None:
+            self._defaults = self.set_defaults(record.get('defaults'))
+        if self._note is None:
+            self._note = record.get('note') or ''
+
+    @property
+    def loaded(self):
+        return self._defaults is not None and self._note is not None
+
+    @property
+    def defaults(self):
+        if self._defaults is None:
+            self._load()
+        return self._defaults
+
+    @defaults.setter
+    def defaults(self, value):
+        self._defaults = value
+
+    @property
+    def note(self):
+        if self._note is None:
+            self._load()
+        return self._note
+
+    @note.setter
+    def note(self, value):
+        self._note = value
@@ -0,0 +1,169 @@
+"""Reads of a user's files from the host (`data/host.py`) for `NetworkManager`.
+
+The host's manifest lists every file the app reads along with its hash, so unchanged files are taken from the
+response cache without a request and files it leaves out aren't requested at all. On a first start everything
+instead comes in one streamed bundle, led by the manifest so the app can tell whether the bundle is complete.
+"""
+import json
+import logging
+import os
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# As served by `data/host.py`, which runs on its own
+MANIFEST = 'manifest.json'
+BUNDLE = 'bundle.tar.gz'
+ETAG_HEADER = 'GROCERIES.etag'  # Pax header giving each bundled file the ETag it would be served with
+
+
+def is_store(path):
+    """Whether a file of the stores directory is a store; the directory may hold notes and backups as well"""
+    return path.endswith('.yaml')
+
+
+def parse_store(filename, content):
+    """Name and mapping of a store file"""
+    name, ext = filename.split('.')
+    return name, yaml.load(content.decode(), Loader=yaml.Loader)
+
+
+def parse_groups(content):
+    return [n for n in content.decode().split('\n') if n]
+
+
+class HostFiles:
+    """Files of `username` served at `url`, read through a `PooledSession` with a `ResponseCache`.
+    `workers` is the number of files requested at once by `read_sources`.
+    """
+
+    def __init__(self, session, url, username, workers=8):
+        self.session = session
+        self.url = url
+        self.username = username
+        self.workers = workers
+        self.manifest = None  # Host's description of our files by section, see `data/host.py`; `None` if unknown
+        self.bundled_pools = {}  # Pool filename -> contents, for pools that came with the startup bundle
+
+    @property
+    def items_path(self):
+        return f'{self.username}/{self.username}.yaml'
+
+    @property
+    def journal_path(self):
+        return f'{self.username}/{self.username}.journal'
+
+    def refresh_manifest(self):
+        """Fetch the host's manifest; stays `None` for a host without one"""
+        body = self.session.fetch(f'{self.url}/{self.username}/{MANIFEST}')
+        self.manifest = json.loads(body) if body is not None else None
+        return self.manifest
+
+    def fetch(self, section, path):
+        """Body of the file at `path` on the host, or `None`.
+        Files the manifest lists are only downloaded if their hash changed, and files it leaves out aren't requested.
+        """
+        if self.manifest is None:
+            return self.session.fetch(f'{self.url}/{path}')
+        try:
+            digest = self.manifest[section][path]['sha1']
+        except KeyError:
+            return None
+        return self.session.fetch(f'{self.url}/{path}', digest)
+
+    def fetch_required(self, section, path):
+        """`fetch` for a file that can't be done without; raises `FileNotFoundError` if the host hasn't got it"""
+        body = self.fetch(section, path)
+        if body is None:
+            raise FileNotFoundError(f'Host at {self.url} has no {path}')
+        return body
+
+    def store_filenames(self):
+        """Store files named in the manifest, or else in the server's listing of the stores directory"""
+        if self.manifest is not None:
+            yield from (os.path.basename(path) for path in self.manifest['stores'] if is_store(path))
+            return
+        listing = self.session.get(f'{self.url}/stores').text
+        for line in listing.split('\n'):
+            if '.yaml' in line:
+                _, filename, _ = line.split('"')
+                if is_store(filename):
+                    yield filename
+
+    def read_store(self, filename):
+        """Fetch and parse one store file, returning its name and mapping"""
+        return parse_store(filename, self.fetch_required('stores', f'stores/{filename}'))
+
+    def read_groups(self):
+        return parse_groups(self.fetch_required('data', 'groups.txt'))
+
+    def read_items(self):
+        return yaml.load(self.fetch_required('data', self.items_path), Loader=yaml.Loader)
+
+    def read_journal(self):
+        """Changes saved since the database file was last written, if there are any"""
+        body = self.fetch('data', self.journal_path)
+        return body.decode() if body is not None else None
+
+    def read_sources(self):
+        """Groups, stores, items and the journal's text.
+        Every file is requested at once and parsed by the worker that fetched it, so loading takes about as long
+        as the slowest file rather than all of them in turn. With the host's manifest, unchanged files aren't
+        requested at all.
+        """
+        self.refresh_manifest()
+        with ThreadPoolExecutor(self.workers, thread_name_prefix='startup') as executor:
+            groups = executor.submit(self.read_groups)
+            items = executor.submit(self.read_items)
+            journal = executor.submit(self.read_journal)
+            stores = [executor.submit(self.read_store, filename) for filename in self.store_filenames()]
+            return groups.result(), dict(store.result() for store in stores), items.result(), journal.result()
+
+    def read_bundle(self):
+        """Groups, stores, items and the journal's text from the host's startup bundle, in one request.
+        Files are decompressed and parsed as they arrive, and kept in the response cache for later starts.
+        Returns `None` if the host has no bundle, or if it broke off or left out a file its manifest lists.
+        """
+        manifest, groups, stores, items, journal = None, None, {}, None, None
+        arrived = set()
+        with self.session.get(f'{self.url}/{self.username}/{BUNDLE}', stream=True) as r:
+            if not r.ok:
+                return None
+            try:
+                with tarfile.open(fileobj=r.raw, mode='r|gz') as bundle:
+                    for member in bundle:
+                        path = member.name
+                        content = bundle.extractfile(member).read()
+                        if etag := member.pax_headers.get(ETAG_HEADER):
+                            self.session.cache.store(f'{self.url}/{path}', content, etag)
+
+                        if path == f'{self.username}/{MANIFEST}':
+                            manifest = json.loads(content)
+                        elif path == 'groups.txt':
+                            groups = parse_groups(content)
+                        elif path.startswith('stores/') and is_store(path):
+                            name, mapping = parse_store(os.path.basename(path), content)
+                            stores[name] = mapping
+                        elif path == self.items_path:
+                            items = yaml.load(content, Loader=yaml.Loader)
+                        elif path == self.journal_path:
+                            journal = content.decode()
+                        elif path.startswith(f'{self.username}/pools/'):
+                            self.bundled_pools[os.path.basename(path)] = content
+                        arrived.add(path)
+            except Exception as e:  # Whatever broke the transfer off, reading the files one by one will show it again
+                logger.warning('Startup bundle cut short: %r', e)
+                return None
+            finally:
+                self.session.stats.fetched(r.raw.tell())
+
+        if manifest is None or groups is None or items is None:
+            return None
+        if missing := {*manifest['data'], *filter(is_store, manifest['stores'])} - arrived:
+            logger.warning('Startup bundle is missing %s', ', '.join(sorted(missing)))
+            return None
+        self.manifest = manifest
+        return groups, stores, items, journal
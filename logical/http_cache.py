@@ -0,0 +1,73 @@
+"""On-device copies of files served by the host, revalidated rather than downloaded again.
+
+Each body is stored under a name derived from its URL, next to an index of the `ETag` and `Last-Modified` values
+it was served with. Those are sent back as `If-None-Match` and `If-Modified-Since`, so a file that hasn't changed
+comes back as an empty `304 Not Modified` and is read from disk instead. The SHA-1 of each body is kept as well,
+so a file whose hash the host's manifest already lists needn't be requested at all.
+"""
+import hashlib
+import json
+import os
+import threading
+
+
+class ResponseCache:
+    """Response bodies kept in `directory` by URL, along with their validators"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.index_path = os.path.join(directory, 'index.json')
+        self._lock = threading.Lock()
+        try:
+            with open(self.index_path) as f:
+                self._index = json.load(f)  # URL -> {'etag': ..., 'last_modified': ..., 'sha1': ...}
+        except (OSError, ValueError):  # No cache yet, or a damaged index
+            self._index = {}
+
+    def _body_path(self, url):
+        return os.path.join(self.directory, hashlib.sha1(url.encode()).hexdigest())
+
+    def conditions(self, url):
+        """Request headers revalidating the cached copy of `url`; empty if there isn't one"""
+        entry = self._index.get(url)
+        if entry is None or not os.path.exists(self._body_path(url)):
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def digest(self, url):
+        """SHA-1 of the cached body of `url`, if there is one"""
+        entry = self._index.get(url)
+        if entry is not None and os.path.exists(self._body_path(url)):
+            return entry.get('sha1')
+
+    def load(self, url):
+        with open(self._body_path(url), 'rb') as f:
+            return f.read()
+
+    def store(self, url, body, etag=None, last_modified=None):
+        """Keep `body` for `url` if the server gave it a validator; otherwise forget any older copy"""
+        if not (etag or last_modified):
+            return self.discard(url)
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._body_path(url)
+        with open(path + '.tmp', 'wb') as f:
+            f.write(body)
+        os.replace(path + '.tmp', path)
+        with self._lock:
+            self._index[url] = {'etag': etag, 'last_modified': last_modified, 'sha1': hashlib.sha1(body).hexdigest()}
+            self._save()
+
+    def discard(self, url):
+        with self._lock:
+            if self._index.pop(url, None) is not None:
+                self._save()
+
+    def _save(self):
+        with open(self.index_path + '.tmp', 'w') as f:
+            json.dump(self._index, f)
+        os.replace(self.index_path + '.tmp', self.index_path)
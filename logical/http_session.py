@@ -0,0 +1,116 @@
+"""Keep-alive HTTP reads for `NetworkManager`.
+
+Every read from the host goes through one `requests.Session`, so requests to the same host reuse a pooled TCP
+connection rather than opening a new one each. Request counts and latencies are kept to show what a sequence of
+reads, such as startup, cost. With a `ResponseCache`, `fetch` revalidates files already on the device instead of
+downloading them again.
+"""
+import logging
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class RequestStats:
+    """Count and time of requests, with the slowest kept by URL"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.count = 0
+            self.revalidated = 0  # Files read from the cache, after a `304 Not Modified` or a manifest match
+            self.received = 0  # Body bytes downloaded by `fetch`
+            self.seconds = 0.0
+            self.timings = []  # (url, seconds), in order of completion
+
+    def record(self, url, seconds):
+        with self._lock:
+            self.count += 1
+            self.seconds += seconds
+            self.timings.append((url, seconds))
+
+    def fetched(self, size, revalidated=False):
+        with self._lock:
+            self.received += size
+            self.revalidated += revalidated
+
+    def summary(self, connections=None):
+        with self._lock:
+            slowest = max(self.timings, key=lambda timing: timing[1], default=(None, 0.0))
+            text = f'{self.count} request(s) in {self.seconds * 1000:.0f} ms'
+            if self.count:
+                text += f', mean {self.seconds / self.count * 1000:.0f} ms, slowest {slowest[1] * 1000:.0f} ms' \
+                        f' ({slowest[0]})'
+            if self.received or self.revalidated:
+                text += f'; {self.received} byte(s) received, {self.revalidated} file(s) unchanged'
+        if connections is not None:
+            text += f'; {connections} connection(s) opened in total'
+        return text
+
+
+class PooledSession:
+    """`requests.Session` with pooled keep-alive connections and default timeouts.
+    `timeout` is the `(connect, read)` pair passed to every request that doesn't give its own.
+    """
+
+    def __init__(self, timeout=(3.05, 30), pool_size=4, retries=1, cache=None):
+        self.timeout = timeout
+        self.cache = cache  # `ResponseCache` used by `fetch`
+        self.stats = RequestStats()
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retries)
+        self.session = requests.Session()
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+
+    def get(self, url, **kwargs):
+        """`requests.get` over the pooled connections; streamed bodies are timed up to their headers"""
+        kwargs.setdefault('timeout', self.timeout)
+        start = time.perf_counter()
+        try:
+            return self.session.get(url, **kwargs)
+        finally:
+            self.stats.record(url, time.perf_counter() - start)
+
+    def fetch(self, url, digest=None):
+        """Body of `url`, or `None` if the server doesn't have it.
+        A cached copy is reused without a request if its SHA-1 is `digest`, as listed by the host's manifest;
+        otherwise it is revalidated and reused when the server answers `304 Not Modified`.
+        """
+        if self.cache and digest and self.cache.digest(url) == digest:
+            self.stats.fetched(0, revalidated=True)
+            return self.cache.load(url)
+        r = self.get(url, headers=self.cache.conditions(url) if self.cache else None)
+        if self.cache and r.status_code == 304:
+            self.stats.fetched(0, revalidated=True)
+            return self.cache.load(url)
+        self.stats.fetched(len(r.content))
+        if not r.ok:
+            if self.cache:
+                self.cache.discard(url)
+            return None
+        if self.cache:
+            self.cache.store(url, r.content, r.headers.get('ETag'), r.headers.get('Last-Modified'))
+        return r.content
+
+    @property
+    def connections(self):
+        """Connections opened so far across the pools of every host"""
+        pools = self.adapter.poolmanager.pools
+        return sum(pools[key].num_connections for key in pools.keys())
+
+    def report(self, label):
+        """Log the requests made since the last report, then start counting afresh"""
+        summary = self.stats.summary(self.connections)
+        logger.info('%s: %s', label, summary)
+        self.stats.reset()
+        return summary
+
+    def close(self):
+        self.session.close()
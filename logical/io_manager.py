@@ -1,17 +1,26 @@
 """Separate networking tasks from app"""
 import os
+import re
 import smtplib
 import ssl
 import time
 from datetime import datetime
 from socket import socket
+from urllib.parse import unquote
 
-import requests
 import yaml
 from kivymd.app import MDApp
 
 from logical.database import Database
+from logical.export import ExportPipeline, ListExport
+from logical.host_files import HostFiles
+from logical.http_cache import ResponseCache
+from logical.http_session import PooledSession
+from logical.journal import ChangeJournal
+from logical.pool_index import PoolDirectory, PoolIndex
+from logical.pool_reader import PoolCache, read_pool_records
 from logical.pools_and_lists import ItemPool, ListWriter
+from logical.snapshot import LazySnapshot, SnapshotError, is_fresh, load_snapshot, write_snapshot
 from logical.state import ListState
 
 
@@ -27,15 +36,29 @@ class SettingsManager:
                  old_db_path=None,
                  lists_path=None,
                  db_path=None,
+                 snapshot_path=None,
+                 journal_path=None,
+                 sqlite_path=None,
+                 pool_index_path=None,
+                 http_cache_path=None,
                  default_store=None,
                  host='127.0.0.1',
                  read_port=42209,
                  write_port=42210,
                  rename_port=42211,
+                 connect_timeout=3.05,
+                 read_timeout=30,
+                 http_pool_size=8,
+                 use_bundle=True,
                  merge_always=None,
                  merge_once=None,
                  write_new_items=False,
                  low_spec=False,
+                 compact_catalog=False,
+                 lazy_catalog=False,
+                 use_journal=False,
+                 journal_limit=200,
+                 export_workers=4,
                  **kwargs
                  ):
 
@@ -50,6 +73,9 @@ class SettingsManager:
         self.read_port = read_port
         self.write_port = write_port
         self.rename_port = rename_port
+        self.http_timeout = connect_timeout, read_timeout  # Seconds, as passed to `requests`
+        self.http_pool_size = http_pool_size  # Keep-alive connections held open to the host
+        self.use_bundle = use_bundle  # Download everything in one request when nothing is cached yet
 
         # Can be replaced with custom path values or inferred using @property decorator
         self._credentials_path = credentials_path
@@ -57,10 +83,20 @@ class SettingsManager:
         self._old_db_path = old_db_path
         self._lists_path = lists_path
         self._db_path = db_path
+        self._snapshot_path = snapshot_path
+        self._journal_path = journal_path
+        self._sqlite_path = sqlite_path
+        self._pool_index_path = pool_index_path
+        self._http_cache_path = http_cache_path
 
         # Other advanced properties
         self._other_kwargs = kwargs
         self.low_spec = low_spec
+        self.compact_catalog = compact_catalog
+        self.lazy_catalog = lazy_catalog  # Load item headers only, reading defaults and notes from the snapshot
+        self.use_journal = use_journal  # Append changed items to a journal rather than rewriting the database
+        self.journal_limit = journal_limit  # Journal records allowed before folding them into the database
+        self.export_workers = export_workers  # Threads saving, printing and sending lists
         self.merge_always = merge_always
         self.merge_once = merge_once
         self.write_new_items = write_new_items
@@ -95,6 +131,36 @@ class SettingsManager:
             self._db_path = f'data/{self.username}/{self.username}.yaml'
         return self._db_path
 
+    @property
+    def snapshot_path(self):
+        if not self._snapshot_path:
+            self._snapshot_path = f'data/{self.username}/{self.username}.snapshot'
+        return self._snapshot_path
+
+    @property
+    def journal_path(self):
+        if not self._journal_path:
+            self._journal_path = f'data/{self.username}/{self.username}.journal'
+        return self._journal_path
+
+    @property
+    def sqlite_path(self):
+        if not self._sqlite_path:
+            self._sqlite_path = f'data/{self.username}/{self.username}.sqlite3'
+        return self._sqlite_path
+
+    @property
+    def pool_index_path(self):
+        if not self._pool_index_path:
+            self._pool_index_path = f'data/{self.username}/pools.index'
+        return self._pool_index_path
+
+    @property
+    def http_cache_path(self):
+        if not self._http_cache_path:
+            self._http_cache_path = f'data/{self.username}/http_cache'
+        return self._http_cache_path
+
     @property
     def db_save_location(self):
         new_filename = self.get_date(5) + self.username + '.yaml'
@@ -125,6 +191,13 @@ class SettingsManager:
 class IOManager(SettingsManager):
     """Common functionality for file managers"""
 
+    # Sinks for `export`: name -> (method taking a `ListExport`, sinks that have to finish first)
+    export_sinks = {'dump_pool': ('_save_pool', ()),
+                    'dump_list': ('_save_list', ()),
+                    'print_list': ('_print_list', ('dump_list',)),
+                    'send_email': ('_email_list', ('dump_list',)),
+                    }
+
     def __init__(self):
         kwargs = self.preload_settings('data/global_settings.yaml', {})
         if path_ := kwargs.get('user_settings_location'):
@@ -133,35 +206,56 @@ class IOManager(SettingsManager):
 
         self.writer = None  # List formatting object
         self.should_update = False  # Whether or not to update database with new values
+        self.journal = ChangeJournal(self.journal_path, self.journal_limit)
+        self.records = None  # Cached yaml-friendly form of every saved item, seeded from the parsed sources
+        self.pool_cache = PoolCache(self._read_pool_file)  # Resolved pool entries by file path
+        self._pool_index = None  # Pool filenames by date, created on first use
+        self.exports = ExportPipeline({name: (getattr(self, method), after)
+                                       for name, (method, after) in self.export_sinks.items()},
+                                      self.export_workers)
 
     def format_database(self, database):
-        """Convert information stored inside `Database` to yaml-friendly object"""
-        all_items = list(database.items.values())
-        if self.write_new_items:
-            all_items += list(database.new_items.values())
-        data = {}
-
-        for item in all_items:
-            name = item.name
-            uid = item.uid
-            group = item.group.uid
-
-            new_defaults = []
-            for time_, amount_ in item.defaults:
-                try:
-                    amount_ = int(amount_)
-                except (ValueError, TypeError):
-                    amount_ = None
-                new_defaults.append([int(round(time_)), amount_])
-
-            note = item.note
+        """Convert information stored inside `Database` to yaml-friendly object.
+        Cached records are reused, so only items marked dirty since the last save are formatted again.
+        """
+        if self.records is None:
+            all_items = list(database.items.values())
+            if self.write_new_items:
+                all_items += list(database.new_items.values())
+            self.records = {item.uid: self.format_item(item) for item in all_items}
+        else:
+            self.format_changes(database)
+        return self.records
 
-            data[uid] = {'group': group,
-                         'defaults': new_defaults,
-                         'note': note,
-                         'name': name,
-                         }
-        return data
+    @staticmethod
+    def format_item(item):
+        """Convert a single `GroceryItem` to a yaml-friendly record"""
+        new_defaults = []
+        for time_, amount_ in item.defaults:
+            try:
+                amount_ = int(amount_)
+            except (ValueError, TypeError):
+                amount_ = None
+            new_defaults.append([int(round(time_)), amount_])
+
+        return {'group': item.group.uid,
+                'defaults': new_defaults,
+                'note': item.note,
+                'name': item.name,
+                }
+
+    def format_changes(self, database):
+        """Records for the dirty items only, in the same format as `format_database`; updates the cache"""
+        tables = [database.items, database.new_items] if self.write_new_items else [database.items]
+        changes = {}
+        for uid in database.dirty:
+            for table in tables:
+                if uid in table:
+                    changes[uid] = self.format_item(table[uid])
+                    break
+        if self.records is not None:
+            ChangeJournal.apply(self.records, changes)
+        return changes
 
     def make_list(self, item_pool: ItemPool, store_name=None):
         """Map a store to items"""
@@ -170,11 +264,52 @@ class IOManager(SettingsManager):
 
         db = MDApp.get_running_app().db
         store = db.stores[store_name]
-        self.dump_pool(item_pool)
         if self.merge_always or self.merge_once:
             item_pool = self.mix_pools(item_pool)
         self.writer = ListWriter(item_pool, store)
         self.should_update = True
+        return self.writer
+
+    def export(self, item_pool: ItemPool, sinks, store_name=None):
+        """Save, print and/or send a pool in the background; `sinks` are names from `export_sinks`.
+        The pool is always saved, and the list is rendered once for every sink that needs it.
+        Returns a future of each sink's message by name.
+        Call from the UI thread: the list is mapped here, as merging pools can create and regroup displayed items;
+        only rendering and writing are left to the workers.
+        """
+        sinks = ['dump_pool', *(sink for sink in sinks if sink != 'dump_pool')]
+        writer = self.make_list(item_pool, store_name) if len(sinks) > 1 else None
+        return self.exports.run(lambda: ListExport(self.format_pool(item_pool), writer), sinks)
+
+    def _export_now(self, item_pool, sink):
+        return self.export(item_pool, [sink]).result()[sink]
+
+    def dump_pool(self, item_pool: ItemPool):
+        return self._export_now(item_pool, 'dump_pool')
+
+    def dump_list(self, item_pool: ItemPool):
+        return self._export_now(item_pool, 'dump_list')
+
+    def print_list(self, item_pool: ItemPool):
+        return self._export_now(item_pool, 'print_list')
+
+    def send_email(self, item_pool: ItemPool):
+        return self._export_now(item_pool, 'send_email')
+
+    def list_filename(self, export: ListExport):
+        return f'{self.get_date(3)}ShoppingList.{export.format.extension}'
+
+    def _save_pool(self, export: ListExport):
+        raise NotImplementedError
+
+    def _save_list(self, export: ListExport):
+        raise NotImplementedError
+
+    def _print_list(self, export: ListExport):
+        raise NotImplementedError
+
+    def _email_list(self, export: ListExport):
+        raise NotImplementedError
 
     @staticmethod
     def format_pool(pool: ItemPool):
@@ -197,53 +332,66 @@ class IOManager(SettingsManager):
     def format_email(self):
         """Done in list writer"""
 
-    @staticmethod
-    def _locate_pool_by_date(source, date):
-        """Helper method for finding pool by filename"""
-        for filename in source:
-            if date in filename:  # date matches the date of an item list
-                return filename
-
-    @staticmethod
-    def interpret_pool_data(raw_text):
+    @classmethod
+    def interpret_pool_data(cls, raw_text):
         """Create a set of items for construction of an `ItemPool` object.
         Lines in files should have the following format:
         `item_uid` OR `item.name`: [`amount`, `note`]
         Item object will be looked up via DB, if not found it is a new/unsorted item and created
         """
+        return set(cls.resolve_pool_records(read_pool_records(raw_text)))
+
+    @classmethod
+    def interpret_pool_entries(cls, generator_object):
+        """Resolve dicts of `key: [amount, note]` into pool triples"""
+        return set(cls.resolve_pool_records((key, *info) for dict_ in generator_object for key, info in dict_.items()))
 
-        generator_object = yaml.load_all(raw_text, Loader=yaml.Loader)
+    @staticmethod
+    def resolve_pool_records(records):
+        """Shared by all pool sources: yield `(item, amount, note)` for each `(key, amount, note)` record.
+        Known items are yielded as they arrive; items created during a previous program run are built in one
+        batch once the records run out.
+        """
         db = MDApp.get_running_app().db
-        pool = set()
+        new_items = []
         now = time.time()
 
-        for dict_ in generator_object:
-            for uid, info in dict_.items():
-                try:
-                    item = db.items[uid]
-                except KeyError:  # New item created during previous program run
-                    amount, note = info
-                    item_str, group = uid.split(';')
-                    name, uid = item_str.rsplit(' ', maxsplit=1)
-                    kwargs = {'name': name,
-                              'group': group,
-                              'defaults': [(now, amount)],
-                              'note': note,
-                              'uid': uid[1:-1],
-                              }
-                    item = db.add_new_item(kwargs)
-                else:
-                    amount, note = info
-                pool.add((item, amount, note))
-
-        return pool
-
-    def dump_pool(self, item_pool):
-        raise NotImplementedError
+        for uid, amount, note in records:
+            try:
+                item = db[uid]
+            except KeyError:  # New item created during previous program run
+                item_str, group = uid.split(';')
+                name, uid = item_str.rsplit(' ', maxsplit=1)
+                kwargs = {'name': name,
+                          'group': group,
+                          'defaults': [(now, amount)],
+                          'note': note,
+                          'uid': uid[1:-1],
+                          }
+                new_items.append((kwargs, amount, note))
+            else:
+                yield item, amount, note
+
+        created = db.add_new_items([kwargs for kwargs, _, _ in new_items])  # Allocate uids in one pass
+        for item, (_, amount, note) in zip(created, new_items):
+            yield item, amount, note
+
+    def _read_pool_file(self, path):
+        """Stream a pool file into resolved triples; used through `pool_cache`"""
+        with open(path, 'rb') as f:
+            return tuple(self.resolve_pool_records(read_pool_records(f)))
 
     def load_pool(self, **kwargs):
         raise NotImplementedError
 
+    def latest_pools(self, count):
+        """References to the newest `count` pools, newest first, in the form `load_pool` accepts"""
+        raise NotImplementedError
+
+    def pools_in_range(self, start, end):
+        """References to the pools dated from `start` to `end` inclusive, oldest first"""
+        raise NotImplementedError
+
     def mix_pools(self, base):
         raise NotImplementedError
 
@@ -251,113 +399,154 @@ class IOManager(SettingsManager):
 class NetworkManager(IOManager):
     """Network specific functionality"""
 
+    def __init__(self):
+        super().__init__()
+        self.session = PooledSession(self.http_timeout, self.http_pool_size,  # Shared by every read from the host
+                                     cache=ResponseCache(self.http_cache_path))
+        self.files = HostFiles(self.session, self.read_url, self.username, self.http_pool_size)
+
     def dump_database(self):
-        """Send updated data to server which will handle renaming old data and saving new data"""
+        """Send updated data to server.
+        In journal mode only changed items are appended to the journal on the server; once it grows past
+        `journal_limit` records the whole database is sent in the background and the journal is emptied.
+        """
         db = MDApp.get_running_app().db
-        data = self.format_database(db)
+        if not db.dirty:
+            return  # Nothing changed this session
+        if self.use_journal:
+            changes = self.format_changes(db)
+            self._send_file(self.journal_path, self.journal.encode(changes), append=True)
+            self.journal.length += len(changes)
+            if self.journal.needs_compaction:
+                data = self.format_database(db)
+                self.journal.compact(lambda: self._send_database(data))
+        else:
+            self._send_database(self.format_database(db))
+        db.clear_dirty()
+
+    def _send_database(self, data):
+        """Send updated data to server which will handle renaming old data and saving new data"""
         s0 = socket()
         s0.connect((self.host, self.rename_port))
         with s0.makefile(mode='w') as f:
             f.write('::'.join((self.db_path, self.db_save_location)))
 
-        s1 = socket()
-        s1.connect((self.host, self.write_port))
-        body = yaml.dump(data)
-        full_text = '::'.join((self.db_path, body))
-        with s1.makefile(mode='w') as f:
-            f.write(full_text)
-
-        s1.close()
+        self._send_file(self.db_path, yaml.dump(data))
+        self._send_file(self.journal_path, '')  # Everything journaled is now part of the database file
 
-    def dump_list(self):
-        ...  # TODO
-
-    def dump_pool(self, pool):
-        """Format pool before saving it to network destination"""
-        data = self.format_pool(pool)
+    def _send_file(self, path, body, append=False):
+        """Have the server write (or append, which is marked by a leading `+` on the path) text to a file"""
         s = socket()
         s.connect((self.host, self.write_port))
-
-        body = yaml.dump(data)
-        filename = os.path.join(self.pools_path, self.get_date(3) + 'itempool.yaml')
-        full_text = '::'.join((filename, body))
-
+        full_text = '::'.join(('+' + path if append else path, body))
         with s.makefile(mode='w') as f:
             f.write(full_text)
-
         s.close()
 
-    def send_email(self):
-        ...  # TODO
-
-    def _construct_store_pairs(self):
-        """Generate paired values for creating store objects from network location"""
-
-        stores_path = f'http://{self.host}:{self.read_port}/stores'
-        listing = ''.join(chunk.decode() for chunk in requests.get(stores_path))
-        lines = listing.split('\n')
-        for line in lines:
-            if '.yaml' in line:
-                _, filename, _ = line.split('"')
-                name, ext = filename.split('.')
-                with requests.get(f'{stores_path}/{filename}') as f:
-                    content = f.content.decode()
-                mapping = yaml.load(content, Loader=yaml.Loader)
-                yield name, mapping
+    def _save_list(self, export: ListExport):
+        """Have the server save the rendered list"""
+        self._send_file(os.path.join(self.lists_path, self.list_filename(export)), export.text)
+        return 'List Saved.'
 
-    def create_database(self):
-        """Get sources for groups, stores, and items via network; use them to construct `Database.`"""
+    def _save_pool(self, export: ListExport):
+        """Send the formatted pool to network destination"""
+        filename = os.path.join(self.pools_path, self.get_date(3) + 'itempool.yaml')
+        self._send_file(filename, yaml.dump(export.pool_data))
+        return 'Items saved to disk.'
 
-        groups_path = f'http://{self.host}:{self.read_port}/groups.txt'
-        r = requests.get(groups_path)
-        groups_raw = r.content.decode()
-        groupnames = [n for n in groups_raw.split('\n') if n]
+    @property
+    def read_url(self):
+        return f'http://{self.host}:{self.read_port}'
 
-        stores = {k: v for k, v in self._construct_store_pairs()}
+    @property
+    def manifest(self):
+        """Host's description of our files by section, see `data/host.py`; `None` if unknown"""
+        return self.files.manifest
+
+    def refresh_manifest(self):
+        return self.files.refresh_manifest()
+
+    def _apply_journal(self, items, text):
+        if text is not None:  # Changes saved since the database file was last written
+            if (complete := ChangeJournal.complete(text)) != text:
+                self._send_file(self.journal_path, complete)  # Cut off a record torn by a crash before appending
+                text = complete
+            self.journal.length = len(text.splitlines())
+            ChangeJournal.apply(items, self.journal.decode(text))
+        return items
 
-        db_path = f'http://{self.host}:{self.read_port}/{self.username}/{self.username}.yaml'
-        content = requests.get(db_path).content
-        items = yaml.load(content, Loader=yaml.Loader)
+    def create_database(self):
+        """Get sources for groups, stores, and items via network; use them to construct `Database.`
+        When nothing has been cached yet everything comes in a single bundle; otherwise only changed files are read.
+        """
+        sources = None
+        if self.use_bundle and self.session.cache.digest(f'{self.read_url}/groups.txt') is None:
+            sources = self.files.read_bundle()
+        groupnames, stores, items, journal = sources or self.files.read_sources()
+        items = self._apply_journal(items, journal)
+        self.records = items  # Parsed records double as the cache of saved item forms
+        self.session.report('Startup')
 
         return Database(groups=groupnames,
                         stores=stores,
                         items=items,
                         default_store=self.default_store,
+                        compact=self.compact_catalog,
                         )
 
-    def locate_pool(self, date=None, return_names=False,):
-        """Check a network location for a list in progress containing today's date"""
-
-        items = ''
-        pools_path = f'http://{self.host}:{self.read_port}/username/pools'
-        r = requests.get(pools_path)
+    @property
+    def pools_url(self):
+        return f'{self.read_url}/{self.username}/pools'
 
-        for file in r:
-            items += str(file.decode())
+    @property
+    def pool_index(self):
+        """Index of the pools listed by the server's manifest, or else its directory listing; fetched on every use"""
+        if self._pool_index is None:
+            self._pool_index = PoolIndex()
+        if self.refresh_manifest() is not None:
+            self._pool_index.update(os.path.basename(path) for path in self.manifest['pools'])
+        else:
+            r = self.session.get(self.pools_url + '/')
+            self._pool_index.update(unquote(href) for href in re.findall(r'href="([^"]+)"', r.text))
+        return self._pool_index
 
+    def locate_pool(self, date=None, return_names=False,):
+        """Check a network location for a list in progress containing today's date"""
+        index = self.pool_index
         if return_names:
-            return items
+            return self.pools_url, index.names
+        return index.for_date(date or self.get_date(3))
+
+    def latest_pools(self, count):
+        return [f'{self.pools_url}/{name}' for name in self.pool_index.latest(count)]
 
-        return self._locate_pool_by_date(items.split('\n'), date)
+    def pools_in_range(self, start, end):
+        return [f'{self.pools_url}/{name}' for name in self.pool_index.in_range(start, end)]
 
-    def load_pool(self, netpath=None, date=None):
+    def load_pool(self, netpath=None, date=None, filename=None):
         """If we receive a network path parameter, load that pool.
         If not, look for a pool matching the date provided, or today's date, if none is provided.
         If we find a matching pool in progress in the network location, load it.
+        `filename` is accepted as another name for `netpath`, as used by the pool picker.
+        A pool that came with the startup bundle is read from there the first time it is asked for.
         """
 
+        netpath = netpath or filename
         if netpath:
             network_path = netpath
         else:
             if not date:
                 date = self.get_date(3)
+            if (bundled := self.files.bundled_pools.pop(f'{date}itempool.yaml', None)) is not None:
+                pool_params = set(self.resolve_pool_records(read_pool_records(bundled)))
+                return ListState.instance.populate_from_pool(ItemPool(pool_params))
             if not (self.locate_pool(date)):
                 return  # No pool matching date
-            network_path = f'http://{self.host}:{self.read_port}/{self.username}/pools/{date}itempool.yaml'
+            network_path = f'{self.pools_url}/{date}itempool.yaml'
 
-        with requests.get(network_path) as req:
-            content = req.content.decode()
-        pool_params = self.interpret_pool_data(content)
+        with self.session.get(network_path, stream=True) as req:
+            req.raw.decode_content = True
+            pool_params = set(self.resolve_pool_records(read_pool_records(req.raw)))
         ListState.instance.populate_from_pool(ItemPool(pool_params))
 
     def mix_pools(self, base):
@@ -368,48 +557,54 @@ class LocalManager(IOManager):
     """Windows specific functionality"""
 
     def dump_database(self):
-        """Rename current database file before saving updated data to local filesystem"""
+        """Save updated data to local filesystem.
+        In journal mode only changed items are appended, and the journal is folded into the database file in
+        the background once it grows past `journal_limit` records.
+        """
         db = MDApp.get_running_app().db
-        data = self.format_database(db)
+        if not db.dirty:
+            return  # Nothing changed this session; leave the database file and its history alone
+        if self.use_journal:
+            self.journal.append(self.format_changes(db))
+            if self.journal.needs_compaction:
+                data = self.format_database(db)
+                self.journal.compact(lambda: self._write_database(data))
+        else:
+            self._write_database(self.format_database(db))
+            self.journal.clear()  # Everything journaled is now part of the database file
+        db.clear_dirty()
+
+    def _write_database(self, data):
+        """Rename current database file before saving updated data to local filesystem"""
         new_filename = self.db_save_location
         os.rename(self.db_path, new_filename)
         with open(self.db_path, 'w') as f:
             yaml.dump(data, f)
+        self.refresh_snapshot(self.db_path, items=data)
 
-    def dump_list(self, pool):
-        """Write list to plaintext format"""
-        self.make_list(pool)
-        self.writer.format_plaintext()
-
-        filename = self.get_date(3) + 'ShoppingList.txt'
-        write_destination = os.path.join(self.lists_path, filename)
-
+    def _save_list(self, export: ListExport):
+        """Write the rendered list to the lists folder"""
+        write_destination = os.path.join(self.lists_path, self.list_filename(export))
         with open(write_destination, 'w') as f:
-            f.write(self.writer.content)
+            f.write(export.text)
         return 'List Saved.'
 
-    def dump_pool(self, pool: ItemPool):
-        """Format pool before saving it to local filesystem"""
-        data = self.format_pool(pool)
+    def _save_pool(self, export: ListExport):
+        """Save the formatted pool to local filesystem"""
         filename = os.path.join(self.pools_path, self.get_date(3) + 'itempool.yaml')
         with open(filename, 'w') as f:
-            yaml.dump(data, f)
+            yaml.dump(export.pool_data, f)
 
         return 'Items saved to disk.'
 
-    def print_list(self, pool):
-        """Option to start printing (Windows only)."""
-        self.dump_list(pool)
-        filename = self.get_date(3) + 'ShoppingList.txt'
-        write_destination = os.path.join(self.lists_path, filename)
+    def _print_list(self, export: ListExport):
+        """Start printing the saved list (Windows only)."""
+        write_destination = os.path.join(self.lists_path, self.list_filename(export))
         os.startfile(write_destination, 'print')
         return 'List saved;\n printing in progress'
 
-    def send_email(self, pool):
+    def _email_list(self, export: ListExport):
         """Read login info from credentials and access server to send email"""
-        self.make_list(pool)
-        self.dump_list(pool)
-
         with open(self.credentials_path) as f:
             sender_email, receiver_email, password = [line.split(':')[1][:-1] for line in f]
 
@@ -417,7 +612,7 @@ class LocalManager(IOManager):
         context = ssl.create_default_context()  # Create a secure SSL context
         with smtplib.SMTP_SSL("smtp.gmail.com", port, context=context) as server:
             server.login(sender_email, password)
-            server.sendmail(sender_email, receiver_email, self.writer.email_content)
+            server.sendmail(sender_email, receiver_email, export.email)
 
         return 'List sent via Email.'
 
@@ -430,10 +625,8 @@ class LocalManager(IOManager):
                     mapping = yaml.load(file, Loader=yaml.Loader)
                     yield name, mapping
 
-    def create_database(self):
-        """Get sources for groups, stores, and items via local filesystem;
-        Use sources to construct `Database.`
-        """
+    def _read_sources(self):
+        """Parse groups, stores, and items from their text and YAML files"""
         with open(self.groups_path) as f:  # Build data for groups
             groups = f.read().split('\n')
 
@@ -442,19 +635,91 @@ class LocalManager(IOManager):
         with open(self.db_path) as f:  # Build data for items
             items = yaml.load(f, Loader=yaml.Loader)
 
+        return groups, stores, items
+
+    @property
+    def snapshot_sources(self):
+        """Files and directories a snapshot must be newer than in order to be used in place of them"""
+        sources = [self.groups_path, self.db_path]
+        for root, _, filenames in os.walk(os.path.join(os.getcwd(), self.stores_path)):  # As `_construct_store_pairs`
+            sources.append(root)
+            sources.extend(os.path.join(root, filename) for filename in filenames)
+        return sources
+
+    def refresh_snapshot(self, written, **changed):
+        """Recompile the snapshot after writing the YAML source `written`.
+        Sections not passed in `changed` come from the previous snapshot if it was current apart from that write,
+        otherwise from the YAML files.
+        """
+        others = [path for path in self.snapshot_sources
+                  if os.path.abspath(path) != os.path.abspath(written) and not os.path.isdir(path)]
+        try:
+            if not is_fresh(self.snapshot_path, others):
+                raise SnapshotError('Snapshot is older than its sources')
+            groups, stores, items = load_snapshot(self.snapshot_path)
+        except SnapshotError:
+            groups, stores, items = self._read_sources()
+
+        stores.update(changed.get('stores', {}))
+        self._write_snapshot(changed.get('groups', groups), stores, changed.get('items', items))
+
+    def _write_snapshot(self, groups, stores, items):
+        """Compile the snapshot; sources it can't hold (see `write_snapshot`) are left to be read as YAML"""
+        try:
+            write_snapshot(self.snapshot_path, groups, stores, items)
+        except SnapshotError:
+            if os.path.exists(self.snapshot_path):
+                os.remove(self.snapshot_path)  # Older than the sources by now, but don't leave it to chance
+
+    def create_database(self):
+        """Get sources for groups, stores, and items via local filesystem, preferring the compiled snapshot
+        when it is newer than all of them; Use sources to construct `Database.`
+        With `lazy_catalog` set, items are built from the snapshot's headers and read their records on first use.
+        """
+        lazy = None
+        try:
+            if not is_fresh(self.snapshot_path, self.snapshot_sources):
+                raise SnapshotError('Snapshot is older than its sources')
+            if self.lazy_catalog:
+                lazy = LazySnapshot(self.snapshot_path)
+                groups, stores, items = lazy.groups, lazy.stores, dict(lazy.headers)
+            else:
+                groups, stores, items = load_snapshot(self.snapshot_path)
+        except SnapshotError:
+            groups, stores, items = self._read_sources()  # Already fully parsed, so nothing is gained by laziness
+            self._write_snapshot(groups, stores, items)
+        self.journal.replay(items)  # Changes saved since the database file was last written
+        # Parsed records double as the cache of saved item forms; headers alone cannot, so a lazy catalog
+        # formats every item on its first full save
+        self.records = None if lazy else items
+
         return Database(groups=groups,
                         stores=stores,
                         items=items,
                         default_store=self.default_store,
+                        compact=self.compact_catalog,
+                        records=lazy,
                         )
 
+    @property
+    def pool_index(self):
+        """Date index of the pools directory, listed again only when the directory has changed"""
+        if self._pool_index is None:
+            self._pool_index = PoolDirectory(self.pools_path, self.pool_index_path)
+        return self._pool_index.refresh()
+
     def locate_pool(self, date=None, return_names=False, ):
         """Check local filesystem for a pool in progress"""
-
-        root, dirs, filenames = next(os.walk(self.pools_path))
+        index = self.pool_index
         if return_names:
-            return root, filenames
-        return self._locate_pool_by_date(filenames, date)
+            return self.pools_path, index.names
+        return index.for_date(date or self.get_date(3))
+
+    def latest_pools(self, count):
+        return [os.path.join(self.pools_path, name) for name in self.pool_index.latest(count)]
+
+    def pools_in_range(self, start, end):
+        return [os.path.join(self.pools_path, name) for name in self.pool_index.in_range(start, end)]
 
     def load_pool(self, filename=None, date=None):
         """If we receive a filename parameter, load that pool.
@@ -471,10 +736,7 @@ class LocalManager(IOManager):
                 return  # No pool matching date
             filepath = os.path.join(self.pools_path, file)
 
-        with open(filepath) as f:
-            content = f.read()
-            pool_params = self.interpret_pool_data(content)
-            return ItemPool(pool_params)
+        return ItemPool(self.pool_cache(filepath))  # Parsed once per version of the file
 
     def mix_pools(self, base: ItemPool):
         """Load and merge pools based on user settings"""
@@ -491,10 +753,7 @@ class LocalManager(IOManager):
                 os.remove(filepath)
         else:
             once_ = None
-        base += always_
-        base += once_
-
-        return base
+        return ItemPool.merge_many((base, always_, once_))
 
 
 class AccessManager(LocalManager):
@@ -508,6 +767,7 @@ class AccessManager(LocalManager):
         text = '\n'.join(names) + '\n'
         with open(self.groups_path, 'w') as f:
             f.write(text)
+        self.refresh_snapshot(self.groups_path, groups=text.split('\n'))
 
     def update_store_mappings(self, store):
         """Write store information to file"""
@@ -518,7 +778,7 @@ class AccessManager(LocalManager):
             uid_key = location.uid_short
             nested_dict = {'_is_special': location.is_special,
                            '_name': location.name,
-                           'items': [itm.uid for itm in location.items]
+                           'items': [getattr(itm, 'uid', itm) for itm in location.items]  # Usually uid strings
                            }
             data[uid_key] = nested_dict
 
@@ -526,6 +786,7 @@ class AccessManager(LocalManager):
         filepath = os.path.join(path, store.name.lower() + '.yaml')
         with open(filepath, 'w') as f:
             yaml.dump(data, f)
+        self.refresh_snapshot(filepath, stores={store.name.lower(): data})
 
 
 
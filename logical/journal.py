@@ -0,0 +1,101 @@
+"""Append-only journal of item changes kept beside the item database.
+
+Each line holds the complete, YAML-ready record of one changed item as JSON, so replaying is a matter of
+updating the parsed database with every line in order; replaying a record twice is harmless. Compaction folds the journal into the base file by rewriting it once, then truncating the journal.
+"""
+import json
+import os
+import threading
+
+
+class ChangeJournal:
+    """Journal of changed item records; `limit` is the number of records allowed before compaction is due"""
+
+    def __init__(self, path, limit=200):
+        self.path = path
+        self.limit = limit
+        self.length = 0  # Records currently in the journal, known after `replay` or `append`
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def encode(records):
+        """One JSON line per item record"""
+        return ''.join(json.dumps({uid: record}, ensure_ascii=False) + '\n' for uid, record in records.items())
+
+    @staticmethod
+    def decode(text):
+        """Parse journal lines into a uid -> record dict; a final line torn by a crash is skipped"""
+        records = {}
+        lines = text.splitlines()
+        for n, line in enumerate(lines):
+            try:
+                records.update(json.loads(line))
+            except ValueError:
+                if n != len(lines) - 1:
+                    raise
+        return records
+
+    @staticmethod
+    def complete(text):
+        """`text` up to its last newline, leaving out a final line torn by a crash"""
+        return text[:text.rfind('\n') + 1]
+
+    @staticmethod
+    def apply(items, records):
+        """Update parsed item data with changed records"""
+        items.update(records)
+        return items
+
+    @property
+    def needs_compaction(self):
+        return self.length >= self.limit
+
+    def append(self, records):
+        """Durably add records to the end of the journal"""
+        if not records:
+            return
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(self.encode(records))
+            f.flush()
+            os.fsync(f.fileno())
+            self.length += len(records)
+
+    def replay(self, items):
+        """Apply journaled records on top of the item data parsed from the base file.
+        A final line torn by a crash is cut off the file, so the next append starts on a line of its own.
+        """
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                text = f.read()
+        except FileNotFoundError:
+            return items
+        if (complete := self.complete(text)) != text:
+            with self._lock, open(self.path, 'r+b') as f:
+                f.truncate(len(complete.encode('utf-8')))
+            text = complete
+        self.length = len(text.splitlines())
+        return self.apply(items, self.decode(text))
+
+    def clear(self):
+        with self._lock:
+            self._truncate()
+
+    def _truncate(self):
+        if os.path.exists(self.path):
+            open(self.path, 'w').close()
+        self.length = 0
+
+    def compact(self, write_base, background=True):
+        """Fold the journal into the base file by calling `write_base`, then truncate the journal.
+        Appends wait for the compaction to finish so no record can be lost between the two steps.
+        """
+        def run():
+            with self._lock:
+                write_base()
+                self._truncate()
+
+        if not background:
+            return run()
+        thread = threading.Thread(target=run, name='journal-compaction')
+        thread.start()
+        return thread
@@ -0,0 +1,122 @@
+"""Output formats for `ListWriter`.
+
+A format writes a list to any file-like sink piece by piece, so nothing is assembled in memory first. Templates
+are turned into bound `str.format` methods once, when the format is created; the shared instances are kept in
+`FORMATS` by name.
+"""
+import html
+import json
+
+
+def _verbatim(text):
+    return text
+
+
+class ListFormat:
+    """Plain text, as printed and emailed by default"""
+
+    name = 'plaintext'
+    extension = 'txt'
+    content_type = 'text/plain'
+    escape = staticmethod(_verbatim)
+
+    # Templates
+    begin = '{title}\n'
+    notice = '{notice}\n'
+    section = '\n{location}:\n'  # No spaces for locations
+    section_end = ''
+    item = '  {name}{amount}\n{note}'  # Two spaces for items, amount on same line
+    amount = ': {amount}'
+    note = '    -{note}\n'  # Four spaces for notes
+    end = ''
+
+    _templates = ('begin', 'notice', 'section', 'section_end', 'item', 'amount', 'note', 'end')
+
+    def __init__(self):
+        for name in self._templates:
+            setattr(self, f'_{name}', getattr(self, name).format)
+
+    def render(self, writer, sink):
+        self.render_header(writer, sink)
+        self.render_body(writer, sink)
+        sink.write(self._end())
+
+    def render_header(self, writer, sink):
+        escape = self.escape
+        sink.write(self._begin(title=escape(writer.title)))
+        for notice in writer.notices:
+            sink.write(self._notice(notice=escape(notice)))
+
+    def render_body(self, writer, sink):
+        escape, write = self.escape, sink.write
+        for location, entries in writer.sections():
+            write(self._section(location=escape(location.name.capitalize())))
+            for item, amount, note in entries:
+                try:
+                    amount = self._amount(amount=int(amount))
+                except (TypeError, ValueError):
+                    amount = ''
+                write(self._item(name=escape(item.name),
+                                 amount=amount,
+                                 note=self._note(note=escape(note)) if note else '',
+                                 ))
+            write(self._section_end())
+
+
+class MarkdownFormat(ListFormat):
+    name = 'markdown'
+    extension = 'md'
+    content_type = 'text/markdown'
+
+    begin = '# {title}\n\n'
+    notice = '> {notice}\n'
+    section = '\n## {location}\n\n'
+    item = '- {name}{amount}\n{note}'
+    note = '  - *{note}*\n'
+
+
+class HTMLFormat(ListFormat):
+    name = 'html'
+    extension = 'html'
+    content_type = 'text/html'
+    escape = staticmethod(html.escape)
+
+    begin = ('<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>{title}</title></head><body>\n'
+             '<h1>{title}</h1>\n')
+    notice = '<p>{notice}</p>\n'
+    section = '<h2>{location}</h2>\n<ul>\n'
+    section_end = '</ul>\n'
+    item = '<li>{name}{amount}{note}</li>\n'
+    note = '<br><em>{note}</em>'
+    end = '</body></html>\n'
+
+
+class JSONFormat(ListFormat):
+    """One JSON object: `title`, `notices`, and `locations`, each with a `name` and its `items`"""
+
+    name = 'json'
+    extension = 'json'
+    content_type = 'application/json'
+
+    def render_header(self, writer, sink):
+        sink.write(f'{{"title": {json.dumps(writer.title)}, "notices": {json.dumps(writer.notices)}')
+
+    def render_body(self, writer, sink):
+        write = sink.write
+        write(', "locations": [')
+        for n, (location, entries) in enumerate(writer.sections()):
+            write(f'{", " if n else ""}{{"name": {json.dumps(location.name.capitalize())}, "items": ')
+            write(json.dumps([{'name': item.name,
+                               'amount': amount if isinstance(amount, int) else None,
+                               'note': note or '',
+                               } for item, amount, note in entries]))
+            write('}')
+        write(']')
+
+    def render(self, writer, sink):
+        self.render_header(writer, sink)
+        self.render_body(writer, sink)
+        sink.write('}\n')
+
+
+FORMATS = {fmt.name: fmt for fmt in (ListFormat(), MarkdownFormat(), HTMLFormat(), JSONFormat())}
@@ -0,0 +1,125 @@
+"""Pools sorted by date for bisect lookups.
+
+Pool files are named after the day they were written (`2020.02.23.itempool.yaml`), one per day, so dates in that
+form sort chronologically as plain strings.
+"""
+import bisect
+import json
+import os
+import re
+import time
+from datetime import date as date_type
+
+_DATED = re.compile(r'(\d{4}\.\d{2}\.\d{2})\.')
+_SETTLE_NS = 2 * 10 ** 9  # Directory mtimes more recent than this may still change within the same tick
+
+
+def pool_date(value):
+    """`2020.02.23` from a pool filename or path, a `get_date(3)` string or a `datetime.date`; `None` otherwise"""
+    if isinstance(value, date_type):
+        return value.strftime('%Y.%m.%d')
+    match = _DATED.match(os.path.basename(value) + '.')
+    return match.group(1) if match else None
+
+
+class PoolIndex:
+    """Pool filenames keyed by date"""
+
+    def __init__(self, names=()):
+        self._dates = []  # Sorted
+        self._names = {}  # date -> filename
+        self.update(names)
+
+    def __len__(self):
+        return len(self._dates)
+
+    @property
+    def names(self):
+        """Every indexed filename, oldest first"""
+        return [self._names[d] for d in self._dates]
+
+    def add(self, name):
+        date = pool_date(name)
+        if date is None:
+            return
+        if date not in self._names:
+            bisect.insort(self._dates, date)
+        self._names[date] = name
+
+    def discard(self, name):
+        date = pool_date(name)
+        if self._names.get(date) == name:
+            del self._names[date]
+            del self._dates[bisect.bisect_left(self._dates, date)]
+
+    def update(self, names):
+        """Bring the index in line with a full listing; only names added or removed since are touched"""
+        names = set(names)
+        for name in set(self._names.values()) - names:
+            self.discard(name)
+        for name in names:
+            if self._names.get(pool_date(name)) != name:
+                self.add(name)
+
+    def latest(self, count):
+        """Filenames of the newest `count` pools, newest first"""
+        return [self._names[d] for d in reversed(self._dates[max(len(self._dates) - count, 0):])]
+
+    def for_date(self, date):
+        """Filename of the pool written on `date`, if there is one"""
+        date = pool_date(date)
+        n = bisect.bisect_left(self._dates, date)
+        if n < len(self._dates) and self._dates[n] == date:
+            return self._names[date]
+
+    def in_range(self, start, end):
+        """Filenames of pools from `start` to `end` inclusive, oldest first"""
+        first = bisect.bisect_left(self._dates, pool_date(start))
+        last = bisect.bisect_right(self._dates, pool_date(end))
+        return [self._names[d] for d in self._dates[first:last]]
+
+
+class PoolDirectory(PoolIndex):
+    """`PoolIndex` of a directory, saved to `index_path` between runs.
+    The directory is only listed again once its modification time has changed.
+    """
+
+    def __init__(self, path, index_path=None):
+        super().__init__()
+        self.path = path
+        self.index_path = index_path
+        self._mtime = None  # Directory mtime the index was last brought up to date with
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_path) as f:
+                saved = json.load(f)
+        except (TypeError, OSError, ValueError):  # No index path, no saved index, or a damaged one
+            return
+        self.update(saved['names'])
+        self._mtime = saved['mtime']
+
+    def _save(self):
+        if not self.index_path:
+            return
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump({'mtime': self._mtime, 'names': self.names}, f)
+        os.replace(temp_path, self.index_path)
+
+    def refresh(self):
+        """List the directory again if it changed since the last refresh; returns the index"""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime is None or mtime != self._mtime:
+            self.update(os.listdir(self.path) if mtime is not None else ())
+            # A file added later in the same clock tick would leave the mtime unchanged, so recent ones aren't kept
+            if mtime is not None and time.time_ns() - mtime > _SETTLE_NS:
+                self._mtime = mtime
+                self._save()
+            else:
+                self._mtime = None
+        return self
@@ -0,0 +1,98 @@
+"""Incremental reading of pool files.
+
+Pools are flat YAML mappings of `key: [amount, note]`. Rather than building every document with the pure-Python
+loader, entries are assembled from parser events (using libyaml when it is available) and yielded one at a time.
+"""
+import os
+from collections import OrderedDict
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
+_NULLS = {'', '~', 'null', 'Null', 'NULL'}
+_resolver = yaml.resolver.Resolver()
+
+
+def _plain(event):
+    """Value of a scalar event; unquoted scalars resolve as with `yaml.safe_load`.
+    Nulls, integers and plain strings, which make up nearly all of a pool, are recognised without a loader.
+    """
+    if event.style:
+        return event.value
+    if event.value in _NULLS:
+        return None
+    try:
+        return int(event.value)
+    except ValueError:
+        pass
+    if _resolver.resolve(yaml.ScalarNode, event.value, event.implicit) == _resolver.DEFAULT_SCALAR_TAG:
+        return event.value
+    return yaml.load(event.value, Loader=_Loader)  # Booleans, floats, timestamps and other integer forms
+
+
+def read_pool_records(stream):
+    """Yield `(key, amount, note)` for every entry of a pool as soon as it has been parsed.
+    `stream` may be a string, bytes, or a file-like object; multiple documents are read in turn.
+    """
+    depth = 0
+    key = values = None
+    for event in yaml.parse(stream, Loader=_Loader):
+        if isinstance(event, yaml.ScalarEvent):
+            if values is not None:
+                values.append(_plain(event))
+            elif depth == 1 and key is None:
+                key = _plain(event)
+            else:
+                raise ValueError(f'Unexpected value {event.value!r} in pool')
+        elif isinstance(event, yaml.SequenceStartEvent):
+            if key is None or values is not None:
+                raise ValueError('Unexpected list in pool')
+            values = []
+        elif isinstance(event, yaml.SequenceEndEvent):
+            amount, note = values
+            yield key, amount, note
+            key = values = None
+        elif isinstance(event, yaml.MappingStartEvent):
+            depth += 1
+            if depth > 1:
+                raise ValueError('Unexpected mapping in pool')
+        elif isinstance(event, yaml.MappingEndEvent):
+            depth -= 1
+
+
+class PoolCache:
+    """Results of reading pool files, reused while a file's modification time and size are unchanged.
+    `read` is called with the path on a miss; at most `size` pools are kept.
+    """
+
+    def __init__(self, read, size=16):
+        self.read = read
+        self.size = size
+        self._entries = OrderedDict()  # path -> (stamp, result), least recently used first
+
+    def __call__(self, path):
+        stat = os.stat(path)
+        stamp = stat.st_mtime_ns, stat.st_size
+        path = os.path.abspath(path)
+
+        try:
+            cached_stamp, result = self._entries[path]
+        except KeyError:
+            pass
+        else:
+            if cached_stamp == stamp:
+                self._entries.move_to_end(path)
+                return result
+
+        result = self._entries[path] = stamp, self.read(path)
+        self._entries.move_to_end(path)
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+        return result[1]
+
+    def clear(self):
+        self._entries.clear()
@@ -1,20 +1,75 @@
+import io
+from datetime import date
 from operator import itemgetter
 
+from logical.bitsets import popcount
+from logical.list_formats import FORMATS
+from logical.pool_index import pool_date
+
 from logical.stores import Store
 
 
+PLACEHOLDER = '\u00B7'  # Amount shown for items without one
+
+
+def _coerce(amount):
+    try:
+        return int(amount)
+    except (ValueError, TypeError):
+        return PLACEHOLDER
+
+
+def _join_notes(note0, note1):
+    if not note0 or not note1:
+        return note0 if note0 else note1
+    return f'{note0} + {note1}'
+
+
+def combine_policy(amount0, note0, amount1, note1):
+    """Semantics of `ItemPool.__add__`: a missing (zero) amount defers to the other, two amounts are added, and an
+    amount added to the placeholder gives the placeholder. Notes are joined.
+    """
+    if not amount0 or not amount1:
+        amount = amount0 if amount0 else amount1
+    else:
+        try:
+            amount = amount0 + amount1
+        except TypeError:
+            amount = PLACEHOLDER
+    return amount, _join_notes(note0, note1)
+
+
+def sum_policy(amount0, note0, amount1, note1):
+    """Add amounts, ignoring placeholders; notes are joined"""
+    amounts = [a for a in (amount0, amount1) if a != PLACEHOLDER]
+    return (sum(amounts) if amounts else PLACEHOLDER), _join_notes(note0, note1)
+
+
+def max_policy(amount0, note0, amount1, note1):
+    """Keep the larger amount, ignoring placeholders; notes are joined"""
+    amounts = [a for a in (amount0, amount1) if a != PLACEHOLDER]
+    return (max(amounts) if amounts else PLACEHOLDER), _join_notes(note0, note1)
+
+
+def latest_policy(amount0, note0, amount1, note1):
+    """The entry from the later pool replaces the earlier one"""
+    return amount1, note1
+
+
 class ItemPool:
     """Pool of items wanted for a grocery list; unsorted, but may be loaded and/or merged with other pools"""
 
+    policies = {'combine': combine_policy,
+                'sum': sum_policy,
+                'max': max_policy,
+                'latest': latest_policy,
+                }
+
     def __init__(self, item_pool):
         self._items = {}
 
         for item, amount, note in item_pool:
-            try:
-                amount = int(amount)
-            except (ValueError, TypeError):
-                amount = '\u00B7'
-            self._items[item.uid] = item, amount, note
+            self._items[item.uid] = item, _coerce(amount), note
 
     def __getitem__(self, item):
         return self._items[item]
@@ -23,8 +78,7 @@ class ItemPool:
         return len(self._items)
 
     def __add__(self, other):
-        """Merge keys that exist in both dicts by iterating through items in `self`, then create a new dict
-         by merging into a copy of the dict `other`.
+        """Merge keys that exist in both pools into a new pool.
 
          This results in the following effects:
          - Values not present in `other` are added as new entries.
@@ -33,37 +87,41 @@ class ItemPool:
          """
         if other is None:
             return self
-
-        half_merged = {}
-        for key, value0 in self.items():
-            try:
-                value1 = other[key]
-            except KeyError:
-                half_merged[key] = value0
-            else:
-                item, amount0, note0 = value0
-                _, amount1, note1 = value1
-
-                if not amount0 or not amount1:
-                    amount2 = amount0 if amount0 else amount1
-                else:
-                    try:
-                        amount2 = amount0 + amount1
-                    except TypeError:
-                        amount2 = f'{amount0} + {amount1}'
-
-                if not note0 or not note1:
-                    note2 = note0 if note0 else note1
+        return self.merge_many((self, other))
+
+    @classmethod
+    def merge_many(cls, pools, policy='combine'):
+        """Merge any number of pools in one pass.
+        `policy` is the name of one of `ItemPool.policies`, or a callable taking the amount and note already
+        merged followed by the amount and note of a later pool, and returning the merged amount and note.
+        `None` entries in `pools` are skipped.
+        """
+        policy = cls.policies[policy] if isinstance(policy, str) else policy
+        merged = {}
+        for pool in pools:
+            if pool is None:
+                continue
+            for key, triple in pool.items():
+                try:
+                    item, amount0, note0 = merged[key]
+                except KeyError:
+                    merged[key] = triple
                 else:
-                    note2 = f'{note0} + {note1}'
-                half_merged[key] = (item, amount2, note2)
+                    _, amount1, note1 = triple
+                    amount, note = policy(amount0, note0, amount1, note1)
+                    merged[key] = item, _coerce(amount), note
 
-        full_merged = {**other.items_dict, **half_merged}  # Concise syntax for copying as described in docstring
-        return ItemPool(full_merged.values())
+        pool = cls.__new__(cls)  # Amounts are already coerced
+        pool._items = merged
+        return pool
 
     def items(self):
         return self._items.items()
 
+    def bitset(self, index):
+        """Members of the pool as a bitset of `index` (a catalog's `BitIndex`)"""
+        return index.bitset(self._items)
+
     @property
     def items_dict(self):
         return self._items
@@ -72,21 +130,29 @@ class ItemPool:
 class ListWriter:
     """Combine an unsorted pool of items with mapping from a given store to produce a sorted, readable list"""
 
-    def __init__(self, pool: ItemPool, store: Store):
+    def __init__(self, pool: ItemPool, store: Store, sections=None):
+        """`sections` (location uid -> set of pool entries) may be passed in when locations were resolved already,
+        as done for many stores at once by `batch_render.render_all`; unmapped items are then left out of the
+        store's mapping rather than moved to `Unsorted`.
+        """
 
         self.store = store
         self.subject = self.header = self.body = self.abs_path = None
+        self.title, self.notices = None, []
+        self.bits = pool.bitset(store.catalog.bits)
 
-        self.items = {}
-        for uid, triple in pool.items():  # item, num, note = triple
+        if sections is None:
+            sections = {}
+            for uid, triple in pool.items():  # item, num, note = triple
 
-            location_key = self.store[uid]
-            try:
-                loc_pool = self.items[location_key]
-            except KeyError:
-                loc_pool = set()
-                self.items[location_key] = loc_pool
-            loc_pool.add(triple)
+                location_key = self.store[uid]
+                try:
+                    loc_pool = sections[location_key]
+                except KeyError:
+                    loc_pool = set()
+                    sections[location_key] = loc_pool
+                loc_pool.add(triple)
+        self.items = sections
 
         self.build_header()
 
@@ -98,59 +164,61 @@ class ListWriter:
         If any special categories are needed, indicate this via key-value pairs in header and email subject.
         """
 
-        needed = []
-        do_build = False
-        for loc in sorted(self.store.specials):
-            try:
-                nested = self.items[loc.uid]
-            except KeyError:
-                needed.append(0)
-            else:
-                needed.append(len(nested))
-                do_build = True
+        unsorted = self.store.unsorted
+        needed = [popcount(self.store.unsorted_in(self.bits) if loc is unsorted else loc.bits & self.bits)
+                  for loc in sorted(self.store.specials)]
+        do_build = any(needed)
 
         self.subject = f"{self.store.name} grocery list: {self.get_date()}"
-        self.header = f"Grocery List: {self.get_date()} ({self.store.name})\n"
+        self.title = f"Grocery List: {self.get_date()} ({self.store.name})"
+        self.notices = []
 
         if do_build:
-            fstrings = [(lambda u: f"List contains {u} unsorted item(s).\n",
+            fstrings = [(lambda u: f"List contains {u} unsorted item(s).",
                          lambda u: f"UNS:{u}- "),
-                        (lambda w: f"List includes {w} Wal-mart items.\n",
+                        (lambda w: f"List includes {w} Wal-mart items.",
                          lambda u: 'WAL-'),
-                        (lambda d: f"List contains {d} Deli items-- deli closes at 8pm.\n",
+                        (lambda d: f"List contains {d} Deli items-- deli closes at 8pm.",
                          lambda _: 'DELI'),
                         ]
             self.subject += ': '
             for val, strings in zip(needed, fstrings):
                 if val:
                     _head, _subj = strings
-                    self.header += _head(val)
+                    self.notices.append(_head(val))
                     self.subject += _subj(val)
 
-    def format_plaintext(self):
-        """Convert a grouped-- but not yet sorted-- set of items into a list for humans to read"""
+        self.header = ''.join(line + '\n' for line in [self.title, *self.notices])
 
-        s = sorted([loc for loc in self.items])
+    def sections(self):
+        """Locations in list order, each with its entries sorted"""
+        for location_uid in sorted(self.items):
+            yield self.store.locations[location_uid], sorted(self.items[location_uid], key=itemgetter(0))
 
-        self.body = ''
-        for location_uid in s:
-            location = self.store.locations[location_uid]
-            location_name = location.name
+    def render(self, sink, fmt='plaintext'):
+        """Write the whole list to a file-like `sink` in one pass; `fmt` is a name from `FORMATS` or a format"""
+        fmt = FORMATS[fmt] if isinstance(fmt, str) else fmt
+        fmt.render(self, sink)
 
-            self.body += f'\n{location_name.capitalize()}:\n'  # No spaces for locations
-            section = sorted(list(self.items[location_uid]), key=itemgetter(0))  # Alphabetized
+    def render_email(self, sink, fmt='plaintext'):
+        """Write the list to `sink` as an email message, subject line included"""
+        fmt = FORMATS[fmt] if isinstance(fmt, str) else fmt
+        sink.write(self.email_head(fmt))
+        fmt.render(self, sink)
 
-            for triple in section:
-                item, amount, note = triple
-                item_line = f'  {item.name}'  # Two spaces for items, amount on same line
-                try:
-                    item_line += f': {int(amount)}'
-                except (TypeError, ValueError):
-                    pass
-                if note:
-                    item_line += f'\n    -{note}'  # Four spaces for notes
-                item_line += '\n'
-                self.body += item_line
+    def email_head(self, fmt='plaintext'):
+        """Email headers for the list in `fmt`, up to and including the blank line before the body"""
+        fmt = FORMATS[fmt] if isinstance(fmt, str) else fmt
+        head = f'Subject: {self.subject}\n'
+        if fmt.content_type != 'text/plain':
+            head += f'MIME-Version: 1.0\nContent-Type: {fmt.content_type}; charset="utf-8"\n'
+        return head + '\n'
+
+    def format_plaintext(self):
+        """Convert a grouped-- but not yet sorted-- set of items into a list for humans to read"""
+        body = io.StringIO()
+        FORMATS['plaintext'].render_body(self, body)
+        self.body = body.getvalue()
 
     @property
     def email_content(self):
@@ -163,5 +231,4 @@ class ListWriter:
 
     @staticmethod
     def get_date():
-        from logical.io_manager import IOManager
-        return IOManager.get_date(3)[:-1]
+        return pool_date(date.today())
@@ -0,0 +1,259 @@
+"""Compiled binary snapshot of the sources used to build a `Database`.
+
+Parsing YAML with the pure-Python loader dominates start-up, so the parsed groups, store mappings and items are
+also kept as flat typed arrays which load with a handful of `array.frombytes` calls. A snapshot is only a cache:
+YAML files remain the source of truth, and a snapshot older than any of them is ignored.
+
+Layout (little-endian): an 8-byte magic, a `uint16` version, then a fixed sequence of arrays, each stored as
+its typecode, its byte length and its raw bytes. Strings live in a single NUL-separated table and are
+referenced everywhere else by index.
+"""
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b'GROSNAP\x00'
+VERSION = 1
+NONE_AMOUNT = -1  # Stands in for an unspecified (`None`) amount
+_HEADER = struct.Struct('<8sH')
+_BLOCK = struct.Struct('<cQ')
+
+
+class SnapshotError(ValueError):
+    """Snapshot file is missing, unreadable or from another format version"""
+
+
+class _StringTable:
+    """Assigns each distinct string an index"""
+
+    def __init__(self):
+        self.ids = {}
+        self.strings = []
+
+    def __call__(self, string):
+        string = '' if string is None else str(string)
+        try:
+            return self.ids[string]
+        except KeyError:
+            self.ids[string] = n = len(self.strings)
+            self.strings.append(string)
+            return n
+
+
+def _write_array(f, arr):
+    if sys.byteorder != 'little':
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    data = arr.tobytes()
+    f.write(_BLOCK.pack(arr.typecode.encode(), len(data)))
+    f.write(data)
+
+
+def _read_array(f, typecode):
+    head = f.read(_BLOCK.size)
+    if len(head) != _BLOCK.size:
+        raise SnapshotError('Truncated snapshot')
+    code, length = _BLOCK.unpack(head)
+    if code.decode() != typecode:
+        raise SnapshotError(f'Expected array of {typecode!r}, found {code!r}')
+    arr = array(typecode)
+    arr.frombytes(f.read(length))
+    if sys.byteorder != 'little':
+        arr.byteswap()
+    return arr
+
+
+def write_snapshot(path, groups, stores, items):
+    """Compile database sources (as accepted by `Database`) into a snapshot file at `path`.
+    Raises `SnapshotError`, writing nothing, if an amount isn't a whole number or `None`.
+    """
+    sid = _StringTable()
+
+    group_ids = array('i', (sid(name) for name in groups))
+
+    store_names, loc_counts, loc_fields, loc_items = array('i'), array('i'), array('i'), array('i')
+    for store_name, mapping in stores.items():
+        store_names.append(sid(store_name))
+        loc_counts.append(len(mapping))
+        for uid, values in mapping.items():
+            members = [item for item in values['items'] or () if item is not None]  # Skip blank YAML entries
+            loc_fields.extend((sid(uid), sid(values['_name']), int(bool(values['_is_special'])), len(members)))
+            loc_items.extend(sid(item) for item in members)
+
+    item_fields, defaults = array('i'), array('q')
+    for uid, record in items.items():
+        pairs = record.get('defaults') or ()
+        item_fields.extend((sid(uid), sid(record['name']), sid(record['group']), sid(record.get('note')),
+                            len(pairs)))
+        for time_, amount in pairs:
+            try:
+                defaults.extend((int(time_), NONE_AMOUNT if amount is None else int(amount)))
+            except (TypeError, ValueError):
+                raise SnapshotError(f'Default {amount!r} of {uid} is not a whole number') from None
+
+    strings = array('b', '\x00'.join(sid.strings).encode())
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION))
+        for arr in (strings, group_ids, store_names, loc_counts, loc_fields, loc_items, item_fields, defaults):
+            _write_array(f, arr)
+    os.replace(temp_path, path)  # Never leave a half-written snapshot behind
+
+
+def _skip_array(f, typecode):
+    """Step over an array without reading it, returning the file offset of its data and its length in bytes"""
+    head = f.read(_BLOCK.size)
+    if len(head) != _BLOCK.size:
+        raise SnapshotError('Truncated snapshot')
+    code, length = _BLOCK.unpack(head)
+    if code.decode() != typecode:
+        raise SnapshotError(f'Expected array of {typecode!r}, found {code!r}')
+    offset = f.tell()
+    f.seek(length, os.SEEK_CUR)
+    return offset, length
+
+
+def _open_snapshot(path):
+    try:
+        f = open(path, 'rb')
+    except OSError as e:
+        raise SnapshotError(e) from e
+    head = f.read(_HEADER.size)
+    if len(head) != _HEADER.size:
+        f.close()
+        raise SnapshotError(f'Truncated snapshot {path}')
+    magic, version = _HEADER.unpack(head)
+    if magic != MAGIC or version != VERSION:
+        f.close()
+        raise SnapshotError(f'Unsupported snapshot {path} (version {version})')
+    return f
+
+
+def _read_sections(f):
+    """Read everything up to, but not including, the defaults array"""
+    strings = _read_array(f, 'b').tobytes().decode().split('\x00')
+    group_ids = _read_array(f, 'i')
+    store_names, loc_counts, loc_fields, loc_items = (_read_array(f, 'i') for _ in range(4))
+    item_fields = _read_array(f, 'i')
+
+    groups = [strings[n] for n in group_ids]
+
+    stores = {}
+    field, member = 0, 0
+    for store_sid, count in zip(store_names, loc_counts):
+        mapping = stores[strings[store_sid]] = {}
+        for _ in range(count):
+            uid, name, special, n_items = loc_fields[field:field + 4]
+            mapping[strings[uid]] = {'_name': strings[name],
+                                     '_is_special': bool(special),
+                                     'items': [strings[n] for n in loc_items[member:member + n_items]],
+                                     }
+            field += 4
+            member += n_items
+
+    return strings, groups, stores, item_fields
+
+
+def _unpack_defaults(defaults, start, count):
+    pairs = []
+    for m in range(start, start + 2 * count, 2):
+        amount = defaults[m + 1]
+        pairs.append([defaults[m], None if amount == NONE_AMOUNT else amount])
+    return pairs
+
+
+def load_snapshot(path):
+    """Read a snapshot back into `(groups, stores, items)` in the same shape YAML sources are parsed into"""
+    with _open_snapshot(path) as f:
+        strings, groups, stores, item_fields = _read_sections(f)
+        defaults = _read_array(f, 'q')
+
+    items = {}
+    pair = 0
+    for n in range(0, len(item_fields), 5):
+        uid, name, group, note, n_defaults = item_fields[n:n + 5]
+        items[strings[uid]] = {'name': strings[name],
+                               'group': strings[group],
+                               'note': strings[note],
+                               'defaults': _unpack_defaults(defaults, pair, n_defaults),
+                               }
+        pair += 2 * n_defaults
+
+    return groups, stores, items
+
+
+class LazySnapshot:
+    """Snapshot opened for a lazy catalog: groups, stores and item headers (name and group) are read up front,
+    while the defaults history of an item stays on disk until its record is first requested.
+
+    Calling an instance with an item uid returns that item's full record. Items are opened a group at a time in
+    the app, so the records of the whole group are read together and held until they are asked for.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.headers = {}  # uid -> {'name', 'group'}; the form `Database.build_items` accepts for lazy items
+        self._extents = {}  # uid -> (note, first defaults value, number of pairs)
+        self._members = {}  # group uid -> uids of its items
+        self._pending = {}  # Records read along with another member of their group
+        self._index()
+
+    def _index(self):
+        with _open_snapshot(self.path) as f:
+            strings, self.groups, self.stores, item_fields = _read_sections(f)
+            self._defaults_at, _ = _skip_array(f, 'q')
+            self._stamp = self._stat()
+
+        self.headers.clear()
+        self._extents.clear()
+        self._members.clear()
+        self._pending.clear()
+        pair = 0
+        for n in range(0, len(item_fields), 5):
+            uid, name, group, note, n_defaults = item_fields[n:n + 5]
+            uid, group = strings[uid], strings[group]
+            self.headers[uid] = {'name': strings[name], 'group': group}
+            self._extents[uid] = (strings[note], pair, n_defaults)
+            self._members.setdefault(group, []).append(uid)
+            pair += 2 * n_defaults
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError as e:
+            raise SnapshotError(e) from e
+        return stat.st_mtime_ns, stat.st_size
+
+    def __call__(self, uid):
+        try:
+            return self._pending.pop(uid)
+        except KeyError:
+            pass
+        if self._stat() != self._stamp:
+            self._index()  # Rewritten since it was opened; offsets are no longer valid
+        self._pending.update(self._read_group(self.headers[uid]['group']))
+        return self._pending.pop(uid)
+
+    def _read_group(self, group):
+        size = array('q').itemsize
+        records = {}
+        with open(self.path, 'rb') as f:
+            for uid in self._members[group]:
+                note, start, count = self._extents[uid]
+                f.seek(self._defaults_at + start * size)
+                defaults = array('q')
+                defaults.frombytes(f.read(2 * count * size))
+                if sys.byteorder != 'little':
+                    defaults.byteswap()
+                records[uid] = {'note': note, 'defaults': _unpack_defaults(defaults, 0, count)}
+        return records
+
+
+def is_fresh(path, sources):
+    """Whether the snapshot at `path` is newer than every file or directory in `sources`"""
+    try:
+        built = os.stat(path).st_mtime
+        return all(os.stat(source).st_mtime <= built for source in sources)
+    except OSError:
+        return False
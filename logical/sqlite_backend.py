@@ -0,0 +1,198 @@
+"""Tables and queries behind `SqliteManager`: the item database, store mappings and pools in one SQLite file.
+
+Pools are identified by date (`2020.02.23`, see `pool_index.pool_date`).
+"""
+import os
+import sqlite3
+from contextlib import closing
+
+import yaml
+
+from logical.pool_index import pool_date
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS groups (
+    uid TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    uid TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    group_uid TEXT NOT NULL,
+    note TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS defaults (
+    item_uid TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    amount INTEGER
+);
+CREATE INDEX IF NOT EXISTS defaults_by_item ON defaults (item_uid);
+CREATE TABLE IF NOT EXISTS locations (
+    store TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    name TEXT NOT NULL,
+    is_special INTEGER NOT NULL,
+    PRIMARY KEY (store, uid)
+);
+CREATE TABLE IF NOT EXISTS location_items (
+    store TEXT NOT NULL,
+    location TEXT NOT NULL,
+    item_uid TEXT NOT NULL,
+    PRIMARY KEY (store, item_uid)
+);
+CREATE INDEX IF NOT EXISTS location_items_by_location ON location_items (store, location);
+CREATE TABLE IF NOT EXISTS pool_entries (
+    date TEXT NOT NULL,
+    key TEXT NOT NULL,
+    amount INTEGER,
+    note TEXT,
+    PRIMARY KEY (date, key)
+);
+"""
+
+
+def read_pool_files(directory):
+    """Entries of every pool file directly inside `directory`, by pool date"""
+    pools = {}
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            entries = {}
+            with open(os.path.join(root, filename)) as f:
+                for data in yaml.load_all(f, Loader=yaml.Loader):
+                    entries.update(data or {})
+            pools[pool_date(filename)] = entries
+        break  # Pools are not nested
+    return pools
+
+
+class SqliteBackend:
+    """One SQLite file; each call opens its own connection, so a backend may be shared between threads"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path)
+        connection.executescript(SCHEMA)
+        return connection
+
+    def is_empty(self):
+        """Whether nothing has been imported yet"""
+        with closing(self._connect()) as con:
+            return not con.execute('SELECT 1 FROM groups UNION ALL SELECT 1 FROM items LIMIT 1').fetchone()
+
+    def read_sources(self):
+        """Groups, stores, and items in the shape their YAML sources are parsed into"""
+        with closing(self._connect()) as con:
+            rows = con.execute('SELECT position, name FROM groups ORDER BY position').fetchall()
+            groups = [''] * (rows[-1][0] + 1 if rows else 0)
+            for position, name in rows:
+                groups[position] = name
+
+            stores = {}
+            for store, uid, name, special in con.execute('SELECT store, uid, name, is_special FROM locations'):
+                stores.setdefault(store, {})[uid] = {'_name': name, '_is_special': bool(special), 'items': []}
+            for store, location, item_uid in con.execute('SELECT store, location, item_uid FROM location_items'):
+                stores[store][location]['items'].append(item_uid)
+
+            items = {}
+            for uid, name, group, note in con.execute('SELECT uid, name, group_uid, note FROM items'):
+                items[uid] = {'name': name, 'group': group, 'note': note, 'defaults': []}
+            for uid, time_, amount in con.execute('SELECT item_uid, time, amount FROM defaults ORDER BY time'):
+                items[uid]['defaults'].append([time_, amount])
+
+        return groups, stores, items
+
+    @staticmethod
+    def _write_items(con, records):
+        """Insert or replace item rows along with their defaults"""
+        con.executemany('DELETE FROM defaults WHERE item_uid = ?', [(uid,) for uid in records])
+        con.executemany('INSERT OR REPLACE INTO items (uid, name, group_uid, note) VALUES (?, ?, ?, ?)',
+                        ((uid, r['name'], r['group'], r.get('note') or '') for uid, r in records.items()))
+        con.executemany('INSERT INTO defaults (item_uid, time, amount) VALUES (?, ?, ?)',
+                        ((uid, int(time_), amount)
+                         for uid, r in records.items() for time_, amount in r.get('defaults') or ()))
+
+    def write_items(self, records):
+        with closing(self._connect()) as con, con:
+            self._write_items(con, records)
+
+    @staticmethod
+    def _write_pool(con, date, data):
+        con.execute('DELETE FROM pool_entries WHERE date = ?', (date,))
+        con.executemany('INSERT INTO pool_entries (date, key, amount, note) VALUES (?, ?, ?, ?)',
+                        ((date, key, amount, note) for key, (amount, note) in data.items()))
+
+    def write_pool(self, date, data):
+        """Replace the pool of a date with yaml-friendly entries (`key: [amount, note]`)"""
+        with closing(self._connect()) as con, con:
+            self._write_pool(con, pool_date(date), data)
+
+    def pool_entries(self, date):
+        """Entries of the pool of a date in the form pool files are parsed into; empty if there is none"""
+        with closing(self._connect()) as con:
+            rows = con.execute('SELECT key, amount, note FROM pool_entries WHERE date = ?', (pool_date(date),))
+            return {key: [amount, note] for key, amount, note in rows}
+
+    def has_pool(self, date):
+        with closing(self._connect()) as con:
+            found = con.execute('SELECT 1 FROM pool_entries WHERE date = ? LIMIT 1', (pool_date(date),))
+            return found.fetchone() is not None
+
+    def pool_dates(self):
+        """Dates of every pool, oldest first"""
+        with closing(self._connect()) as con:
+            return [d for d, in con.execute('SELECT DISTINCT date FROM pool_entries ORDER BY date')]
+
+    def latest_pool_dates(self, count):
+        """Dates of the newest `count` pools, newest first"""
+        with closing(self._connect()) as con:
+            return [d for d, in con.execute(
+                'SELECT DISTINCT date FROM pool_entries ORDER BY date DESC LIMIT ?', (count,))]
+
+    def pool_dates_in_range(self, start, end):
+        """Dates of the pools from `start` to `end` inclusive, oldest first"""
+        with closing(self._connect()) as con:
+            return [d for d, in con.execute(
+                'SELECT DISTINCT date FROM pool_entries WHERE date BETWEEN ? AND ? ORDER BY date',
+                (pool_date(start), pool_date(end)))]
+
+    @staticmethod
+    def _write_store(con, name, mapping):
+        con.executemany('INSERT INTO locations (store, uid, name, is_special) VALUES (?, ?, ?, ?)',
+                        ((name, uid, v['_name'], int(bool(v['_is_special']))) for uid, v in mapping.items()))
+        con.executemany('INSERT OR REPLACE INTO location_items (store, location, item_uid) VALUES (?, ?, ?)',
+                        ((name, uid, item) for uid, v in mapping.items() for item in v['items'] or () if item))
+
+    def replace_store(self, name, mapping):
+        """Replace the locations and item mappings of one store, given as in its YAML file"""
+        with closing(self._connect()) as con, con:
+            con.execute('DELETE FROM locations WHERE store = ?', (name,))
+            con.execute('DELETE FROM location_items WHERE store = ?', (name,))
+            self._write_store(con, name, mapping)
+
+    def replace_groups(self, groups):
+        """Replace group names and order with `(uid, position, name)` rows"""
+        with closing(self._connect()) as con, con:
+            con.execute('DELETE FROM groups')
+            con.executemany('INSERT INTO groups (uid, position, name) VALUES (?, ?, ?)', groups)
+
+    def items_in_location(self, store_name, location_uid):
+        """Uids of the items a store maps to one location (`l02`)"""
+        with closing(self._connect()) as con:
+            return [uid for uid, in con.execute('SELECT item_uid FROM location_items WHERE store = ? AND location = ?'
+                                                ' ORDER BY item_uid', (store_name.lower(), location_uid))]
+
+    def import_sources(self, groups, stores, items, pools):
+        """Replace everything with parsed YAML sources and pools (date -> entries)"""
+        with closing(self._connect()) as con, con:
+            for table in ('groups', 'items', 'defaults', 'locations', 'location_items', 'pool_entries'):
+                con.execute(f'DELETE FROM {table}')
+            con.executemany('INSERT INTO groups (uid, position, name) VALUES (?, ?, ?)',
+                            (('g' + str(n).zfill(2), n, name) for n, name in enumerate(groups) if name))
+            for name, mapping in stores.items():
+                self._write_store(con, name, mapping)
+            self._write_items(con, items)
+            for date, entries in pools.items():
+                self._write_pool(con, date, entries)
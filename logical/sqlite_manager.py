@@ -0,0 +1,105 @@
+"""`IOManager` backed by a single indexed SQLite file instead of loose YAML files"""
+import os
+
+from kivymd.app import MDApp
+
+from logical.database import Database
+from logical.export import ListExport
+from logical.io_manager import LocalManager
+from logical.pool_index import pool_date
+from logical.pools_and_lists import ItemPool
+from logical.sqlite_backend import SqliteBackend, read_pool_files
+
+
+class SqliteManager(LocalManager):
+    """Keeps the item database, store mappings and pools in one SQLite file (see `SqliteBackend`).
+    Lists, printing and email are still handled by `LocalManager`; the `data/` tree is imported by `migrate`, which
+    runs on its own the first time an empty file is opened.
+    Pools are identified by date (`2020.02.23`); `locate_pool` reports them with the usual pool filenames so the
+    file pickers work unchanged.
+    """
+
+    pool_suffix = 'itempool.yaml'
+
+    @property
+    def backend(self):
+        return SqliteBackend(self.sqlite_path)
+
+    def create_database(self):
+        """Query groups, stores, and items from SQLite; use them to construct `Database.`
+        A file nothing has been imported into yet is first filled from the YAML `data/` tree.
+        """
+        if self.backend.is_empty():
+            if not os.path.exists(self.db_path):
+                raise FileNotFoundError(f'Nothing has been migrated into {self.sqlite_path}, '
+                                        f'and there is no {self.db_path} to migrate from')
+            self.migrate()
+        groups, stores, items = self.backend.read_sources()
+        self.records = items  # Parsed records double as the cache of saved item forms
+        return Database(groups=groups,
+                        stores=stores,
+                        items=items,
+                        default_store=self.default_store,
+                        compact=self.compact_catalog,
+                        )
+
+    def dump_database(self):
+        """Write only the items changed this session"""
+        db = MDApp.get_running_app().db
+        if not db.dirty:
+            return
+        self.backend.write_items(self.format_changes(db))
+        db.clear_dirty()
+
+    def _save_pool(self, export: ListExport):
+        """Replace today's pool"""
+        self.backend.write_pool(self.get_date(3), export.pool_data)
+        return 'Items saved to disk.'
+
+    def locate_pool(self, date=None, return_names=False):
+        """Find the pool for a date; with `return_names`, list every pool as `('', filenames)`"""
+        if return_names:
+            return '', [f'{d}.{self.pool_suffix}' for d in self.backend.pool_dates()]
+        if self.backend.has_pool(date):
+            return f'{pool_date(date)}.{self.pool_suffix}'
+
+    def load_pool(self, filename=None, date=None):
+        """Load a pool by name (see `locate_pool`) or date, defaulting to today's pool.
+        Paths to existing pool files, such as one-time merges, are read from disk instead.
+        """
+        if filename and os.path.isfile(filename):
+            return super().load_pool(filename=filename)
+
+        entries = self.backend.pool_entries(filename or date or self.get_date(3))
+        if not entries:
+            return  # No pool matching date
+        return ItemPool(self.interpret_pool_entries([entries]))
+
+    def update_store_mappings(self, store):
+        """Replace the locations and item mappings of one store"""
+        self.backend.replace_store(store.name.lower(), {
+            location.uid_short: {'_name': location.name,
+                                 '_is_special': location.is_special,
+                                 'items': [getattr(itm, 'uid', itm) for itm in location.items],
+                                 } for location in store.locations.values()})
+
+    def update_display_groups(self):
+        """Replace group names and order"""
+        db = MDApp.get_running_app().db
+        self.backend.replace_groups((grp.uid, int(grp.uid[1:]), grp.name) for grp in db.groups.values())
+
+    def latest_pools(self, count):
+        return [f'{d}.{self.pool_suffix}' for d in self.backend.latest_pool_dates(count)]
+
+    def pools_in_range(self, start, end):
+        return [f'{d}.{self.pool_suffix}' for d in self.backend.pool_dates_in_range(start, end)]
+
+    def items_in_location(self, store_name, location_uid):
+        """Uids of the items a store maps to one location (`l02`)"""
+        return self.backend.items_in_location(store_name, location_uid)
+
+    def migrate(self):
+        """One-shot import of groups, stores, items (with journaled changes) and every pool file under `data/`"""
+        groups, stores, items = self._read_sources()
+        self.journal.replay(items)
+        self.backend.import_sources(groups, stores, items, read_pool_files(self.pools_path))
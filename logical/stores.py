@@ -1,4 +1,6 @@
 from logical import UIDRoot
+from logical.catalog import Catalog
+from logical.uids import UIDAllocator
 
 
 class Basket:
@@ -26,10 +28,25 @@ class Location(UIDRoot):
         self.is_special = special
         self.uid = uid
         self.items = items if items else set()
+        self.store = None  # Set when the location is added to a `Store`
+        self.bits = 0  # Bitset of `items`, kept by the store once the location is added to one
 
     def add_item(self, item):
+        """Map an item uid to this location, keeping the owning store's index in sync"""
+        if self.store is not None:
+            return self.store.move_item(item, self)
         return self.items.add(item)
 
+    def remove_item(self, item):
+        self.items.discard(item)
+        if self.store is not None:
+            bit = self.store.catalog.bits.bit(item)
+            self.bits &= ~bit
+            if self.store.index.get(item) is self:
+                del self.store.index[item]
+                self.store.mapped &= ~bit
+            self.store.version += 1
+
     @property
     def uid_short(self):
         return self.uid[-3:]
@@ -40,30 +57,32 @@ class Store(UIDRoot):
 
     default = None
 
-    def __init__(self, name: str, locations: set, uid=None, basket=None):
+    def __init__(self, name: str, locations: set, uid=None, basket=None, catalog=None):
 
         self.uid = uid
+        self.catalog = Catalog.resolve(catalog)
+        self.catalog.store_uids[self.uid] = self
         self.name = name.capitalize()
         self.locations = {}
         self.specials = set()
+        self.index = {}  # Item uid -> `Location`; maintained by `add_location` and `move_item`
+        self.mapped = 0  # Bitset of the items in `index`
+        self.version = 0  # Incremented whenever the mapping changes
+        self.location_uids = UIDAllocator(f'{self.uid}l', 2)
         self._basket = basket
 
         for loc in locations:
-            self.locations[loc.uid] = loc
-            if loc.is_special:
-                self.specials.add(loc)
+            self.add_location(loc)
 
         if f'{self.uid}l00' not in self.locations:
             self.create_unsorted()
 
     def __getitem__(self, item):
-        for location in self.locations.values():
-            if item in location.items:
-                return location.uid
-        else:
-            location = self.locations[f'{self.uid}l00']
-            location.items.add(item)
-            return location.uid
+        """Find the uid of the location an item is mapped to; unmapped items are placed in `Unsorted`"""
+        try:
+            return self.index[item].uid
+        except KeyError:
+            return self.move_item(item, self.unsorted)
 
     @property
     def basket(self):
@@ -74,9 +93,49 @@ class Store(UIDRoot):
             ...  # TODO
         return self._basket.index
 
-    def create_unsorted(self):
-        loc = Location('Unsorted', uid=self.uid+'l00', special=True)
-        self.specials.add(loc)
-        self.locations[loc.uid] = loc
+    @property
+    def unsorted(self):
+        return self.locations[f'{self.uid}l00']
 
+    def add_location(self, loc):
+        """Take ownership of a location and index the items already mapped to it"""
+        loc.store = self
+        self.location_uids.claim(loc.uid, exclusive=False)
+        self.locations[loc.uid] = loc
+        if loc.is_special:
+            self.specials.add(loc)
+        for item in loc.items:
+            self.index[item] = loc
+        loc.bits = self.catalog.bits.bitset(loc.items)
+        self.mapped |= loc.bits
+        self.version += 1
+
+    def move_item(self, item, location):
+        """Map an item uid to `location`, removing it from its previous location; return the new location uid"""
+        bit = self.catalog.bits.bit(item)
+        previous = self.index.get(item)
+        if previous is not None and previous is not location:
+            previous.items.discard(item)
+            previous.bits &= ~bit
+        location.items.add(item)
+        location.bits |= bit
+        self.mapped |= bit
+        self.index[item] = location
+        self.version += 1
+        return location.uid
+
+    def unmapped(self, bits):
+        """Members of a bitset which no location of this store covers"""
+        return bits & ~self.mapped
+
+    def unsorted_in(self, bits):
+        """Members of a bitset that would be listed as unsorted: unmapped, or mapped to `Unsorted`"""
+        return bits & (self.unsorted.bits | ~self.mapped)
+
+    def touched(self, bits):
+        """Locations holding at least one member of a bitset"""
+        return [loc for loc in self.locations.values() if loc.bits & bits]
 
+    def create_unsorted(self):
+        loc = Location('Unsorted', uid=self.uid+'l00', special=True)
+        self.add_location(loc)
@@ -0,0 +1,94 @@
+"""Allocation of zero-padded uids (`i000`, `g00`, `s00l01`) for catalog objects"""
+from heapq import heappop, heappush
+
+
+class UIDAllocator:
+    """Hands out uids for one kind of object in amortized O(1).
+    New numbers come from a monotonic counter which steps over numbers already claimed, so gaps left in data
+    files are filled as before; numbers given back with `release` go on a free-list and are reused first.
+    Uids read from data files are recorded with `claim`.
+    """
+
+    def __init__(self, prefix, width):
+        self.prefix = prefix
+        self.width = width
+        self._next = 0  # Counter; only ever moves forward
+        self._high = 0  # One past the largest number handed out or claimed
+        self._free = []  # Min-heap of released numbers
+        self._taken = set()
+        self._reserved = set()  # Handed out by `reserve` but not yet claimed
+
+    def __contains__(self, uid):
+        try:
+            return self.parse(uid) in self._taken
+        except ValueError:
+            return False
+
+    def __len__(self):
+        return len(self._taken)
+
+    def format(self, n):
+        return self.prefix + str(n).zfill(self.width)
+
+    def parse(self, uid):
+        """Number portion of a uid; bare numbers are accepted as well"""
+        if isinstance(uid, int):
+            return uid
+        uid = str(uid)
+        if uid.startswith(self.prefix):
+            uid = uid[len(self.prefix):]
+        return int(uid)
+
+    def allocate(self):
+        """Next free uid, preferring released numbers"""
+        while self._free:
+            n = heappop(self._free)
+            if n not in self._taken and n not in self._reserved:  # Skip numbers claimed again since release
+                self._taken.add(n)
+                return self.format(n)
+        n = self._next
+        while n in self._taken or n in self._reserved:
+            n += 1
+        self._next = n + 1
+        self._high = max(self._high, self._next)
+        self._taken.add(n)
+        return self.format(n)
+
+    def next_after_high(self):
+        """New uid numbered after everything handed out or claimed so far, ignoring gaps and released numbers.
+        Used where the number carries an order, such as locations (aisles) in a store.
+        """
+        n = self._high
+        while n in self._taken or n in self._reserved:
+            n += 1
+        self._high = n + 1
+        self._taken.add(n)
+        return self.format(n)
+
+    def claim(self, uid, exclusive=True):
+        """Record a specific uid as in use and return it.
+        If it is already taken, an `exclusive` claim allocates a new uid instead; otherwise the uid is shared.
+        """
+        n = self.parse(uid)
+        if n in self._reserved:
+            self._reserved.remove(n)
+        elif n in self._taken and exclusive:
+            return self.allocate()
+        else:
+            self._high = max(self._high, n + 1)
+        self._taken.add(n)
+        return uid if isinstance(uid, str) and uid.startswith(self.prefix) else self.format(n)
+
+    def reserve(self, count):
+        """Set aside a contiguous block of uids for a bulk import; each must then be passed to `claim`"""
+        block = range(self._high, self._high + count)
+        self._high += count
+        self._reserved.update(block)
+        return [self.format(n) for n in block]
+
+    def release(self, uid):
+        """Return a uid to the free-list"""
+        n = self.parse(uid)
+        self._taken.discard(n)
+        self._reserved.discard(n)
+        heappush(self._free, n)
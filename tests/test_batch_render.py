@@ -0,0 +1,62 @@
+import io
+
+from logical.batch_render import UNMAPPED, LocationMatrix, _sections, render_all
+from logical.catalog import Catalog
+from logical.database import Database
+from logical.pools_and_lists import ItemPool, ListWriter
+from logical.stores import Location, Store
+
+catalog = Catalog()
+aisle = Location('aisle', items={'i000', 'i001'}, uid='s01l01')
+deli = Location('deli', items={'i002'}, uid='s01l02')
+store0 = Store('matrixmart', {aisle, deli}, uid='s01', catalog=catalog)
+store1 = Store('othermart', {Location('bakery', items={'i001'}, uid='s02l01')}, uid='s02', catalog=catalog)
+
+
+class TestLocationMatrix:
+
+    def test_001_resolve(self):
+        matrix = LocationMatrix([store0, store1, store0], catalog.bits)
+        assert matrix.stores == [store0, store1]
+        positions = [catalog.bits.position(uid) for uid in ('i000', 'i002', 'i009')]
+        slots = matrix.resolve(positions, store0)
+        locations = matrix.locations['s01']
+        assert [locations[slot].uid for slot in slots[:2]] == ['s01l01', 's01l02'] and slots[2] == UNMAPPED
+        assert matrix.resolve(positions[2:], store1) == (UNMAPPED,)
+        assert matrix.resolve([], store1) == ()
+
+    def test_002_refresh(self):
+        matrix = LocationMatrix([store0, store1], catalog.bits)
+        i000 = catalog.bits.position('i000')
+        deli.add_item('i000')
+        assert matrix.locations['s01'][matrix.resolve([i000], store0)[0]] is aisle  # Stale until refreshed
+        matrix.refresh()
+        assert matrix.locations['s01'][matrix.resolve([i000], store0)[0]] is deli
+
+    def test_003_sections(self):
+        matrix = LocationMatrix([store0], catalog.bits)
+        entries = [('i001', 2, None), ('i008', None, 'fresh')]
+        slots = matrix.resolve([catalog.bits.position(uid) for uid, _, _ in entries], store0)
+        sections = _sections(entries, slots, store0, matrix.locations['s01'])
+        assert sections == {'s01l01': {entries[0]}, 's01l00': {entries[1]}}
+        assert 'i008' not in store0.index  # The store's mapping is left alone
+
+    def test_004_render_all(self):
+        db = Database(groups=['Produce'],
+                      stores={'one': {'l01': {'_name': 'fruit', '_is_special': False, 'items': ['i500', 'i501']}},
+                              'two': {'l01': {'_name': 'apples', '_is_special': False, 'items': ['i500']},
+                                      'l02': {'_name': 'deli', '_is_special': True, 'items': ['i502']}}},
+                      items={'i500': {'name': 'Apples', 'group': 'Produce'},
+                             'i501': {'name': 'Kiwi', 'group': 'Produce'},
+                             'i502': {'name': 'Ham', 'group': 'Produce'}},
+                      default_store='one')
+        pool = ItemPool({(db['i500'], 2, 'ripe'), (db['i501'], '·', ''), (db['i502'], 1, 'sliced')})
+        for workers in (None, 2):
+            lists, unsorted = render_all(pool, db.stores.values(), fmt='markdown', workers=workers)
+            assert set(lists) == {'One', 'Two'} and unsorted == {'One': 1, 'Two': 1}
+            assert 'i502' not in db['one'].index  # Mappings are left alone
+
+        for name in ('one', 'two'):  # Writers built one store at a time move unmapped items to `Unsorted`
+            sink = io.StringIO()
+            ListWriter(pool, db[name]).render(sink, 'markdown')
+            assert lists[name.capitalize()] == sink.getvalue()
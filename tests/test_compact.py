@@ -0,0 +1,96 @@
+import pytest
+
+from logical.compact import (NO_DEFAULT, PLACEHOLDER, CompactDisplayGroup, CompactGroceryItem, CompactItemPool,
+                             CompactLocation)
+from logical.catalog import Catalog, NoteTable
+from logical.database import Database
+from logical.groups_and_items import GroceryItem
+from logical.pools_and_lists import ItemPool
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    grp0 = CompactDisplayGroup('Compact', uid=40)
+    itm0 = CompactGroceryItem(name='Rice', uid='i800', group=grp0, defaults=[(10000, '2'), (20000, None)])
+    loc0 = CompactLocation('aisle 9', items={'i800'}, uid='s40l09')
+    return grp0, itm0, loc0
+
+
+class TestCompact:
+
+    def test_001_no_instance_dict(self, catalog):
+        for obj in catalog:
+            assert not hasattr(obj, '__dict__')
+
+    def test_002_attributes(self, catalog):
+        grp0, itm0, loc0 = catalog
+        assert grp0.uid == 'g40'
+        assert itm0.group is grp0
+        assert loc0.name == 'Aisle 9' and loc0.uid_short == 'l09'
+
+    def test_003_defaults(self, catalog):
+        _, itm0, _ = catalog
+        assert itm0.defaults == [(10000, 2), (20000, '·')]
+        itm0.defaults = itm0.defaults[1:] + [(30000, '4')]
+        assert itm0.defaults == [(20000, '·'), (30000, 4)]
+
+    def test_004_packed_defaults(self):
+        shared = Catalog()
+        grp = CompactDisplayGroup('Packed', catalog=shared)
+        beans, rice = (CompactGroceryItem(name=name, group=grp, defaults=[(1, 2), (2, None)], catalog=shared)
+                       for name in ('Beans', 'Rice'))
+        assert list(shared.packed_defaults) == [1, 2, 2, NO_DEFAULT] * 2
+        beans.defaults = [(3, 4)]  # Rewritten in place
+        assert len(shared.packed_defaults) == 8 and beans.defaults == [(3, 4)]
+        beans.defaults = [(3, 4), (5, 6), (7, 8)]  # Moved to the end
+        assert beans.defaults == [(3, 4), (5, 6), (7, 8)] and rice.defaults == [(1, 2), (2, '·')]
+        rice.defaults = [(1, 40000), (2, PLACEHOLDER)]  # Defaults aren't held to pool amounts
+        assert rice.defaults == [(1, 40000), (2, PLACEHOLDER)]
+
+    def test_005_group_object(self, catalog):
+        grp0, _, _ = catalog
+        item = GroceryItem(name='Beans', group=grp0, catalog=Catalog())  # Taken as is, not looked up by uid
+        assert item.group is grp0 and grp0.members['i000'] is item
+
+
+@pytest.fixture(scope='module')
+def pools():
+    db = Database(groups=['Dairy'], stores={},
+                  items={f'i{n}': {'name': f'Cheese {n}', 'group': 'Dairy'} for n in range(700, 706)})
+    pool0 = ItemPool({(db['i700'], '2', ''), (db['i701'], '·', 'sharp'), (db['i702'], 1, 'sliced')})
+    pool1 = ItemPool({(db['i702'], '3', ''), (db['i705'], 4, 'sharp')})
+    return db, pool0, pool1
+
+
+class TestCompactItemPool:
+
+    def test_001_round_trip(self, pools):
+        db, pool0, _ = pools
+        compact = CompactItemPool.from_pool(pool0, catalog=db.catalog)
+        assert list(compact.ids) == [700, 701, 702] and list(compact.amounts) == [2, PLACEHOLDER, 1]
+        assert compact.to_pool().items_dict == pool0.items_dict
+        assert 'i701' in compact and 'i703' not in compact
+
+    def test_002_set_operations(self, pools):
+        db, pool0, pool1 = pools
+        compact0 = CompactItemPool.from_pool(pool0, catalog=db.catalog)
+        compact1 = CompactItemPool.from_pool(pool1, catalog=db.catalog, note_table=NoteTable())
+        assert [uid for uid, _, _ in compact0 | compact1] == ['i700', 'i701', 'i702', 'i705']
+        assert list(compact0 & compact1) == [('i702', 1, 'sliced')]
+        assert [uid for uid, _, _ in compact0 - compact1] == ['i700', 'i701']
+        assert list(compact1 | compact0)[-1] == ('i705', 4, 'sharp')
+        assert list(compact1 | compact0)[2] == ('i702', 3, '')
+
+    def test_003_amount_range(self, pools):
+        db, _, _ = pools
+        compact = CompactItemPool([('i700', -1, ''), ('i701', 32767, '')], catalog=db.catalog)
+        assert list(compact) == [('i700', -1, ''), ('i701', 32767, '')]
+        for amount in (32768, PLACEHOLDER):
+            with pytest.raises(ValueError):
+                CompactItemPool([('i700', amount, '')], catalog=db.catalog)
+
+    def test_004_note_tables(self, pools):
+        db, pool0, _ = pools
+        compact = CompactItemPool.from_pool(pool0, catalog=db.catalog)
+        assert compact.note_table is db.catalog.notes and 'sharp' in db.catalog.notes.ids
+        assert 'sharp' not in Catalog().notes.ids
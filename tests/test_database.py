@@ -0,0 +1,81 @@
+import pytest
+
+from logical.database import Database
+from logical.pools_and_lists import ItemPool
+
+
+
+@pytest.fixture(scope='module')
+def db():
+    return Database(groups=['Frozen', 'Spices'],
+                    stores={'testmart': {'l01': {'_name': 'freezer', '_is_special': False, 'items': ['i900']}}},
+                    items={'i900': {'name': 'Peas', 'group': 'Frozen'},
+                           'i901': {'name': 'Cumin', 'group': 'Spices', 'note': 'ground'}},
+                    )
+
+
+class TestDatabase:
+
+    def test_001_typed_lookup(self, db):
+        assert db['i900'].name == 'Peas'
+        assert db['g01'].name == 'Spices'
+        assert db['testmart'].name == 'Testmart'
+        assert db[db['testmart'].uid] is db['testmart']
+
+    def test_002_missing_key(self, db):
+        with pytest.raises(KeyError):
+            _ = db['i999']
+        with pytest.raises(KeyError):
+            _ = db['nowhere']
+
+    def test_003_new_items(self, db):
+        item = db.add_new_item({'name': 'Saffron', 'group': 'Spices'})
+        assert db[item.uid] is item
+
+    def test_004_get_many(self, db):
+        peas, cumin, missing = db.get_many(['i900', 'i901', 'i999'], default=None)
+        assert (peas.name, cumin.note, missing) == ('Peas', 'ground', None)
+        with pytest.raises(KeyError):
+            db.get_many(['i900', 'i999'])
+
+    def test_005_bulk_new_items(self, db):
+        first, second = db.add_new_items([{'name': 'Thyme', 'group': 'Spices'},
+                                           {'name': 'Sage', 'group': 'Spices'}])
+        assert int(second.uid[1:]) == int(first.uid[1:]) + 1
+        assert db.get_many([first.uid, second.uid]) == [first, second]
+
+    def test_006_independent_catalogs(self, db):
+        other = Database(groups=['Frozen'], stores={}, items={'i900': {'name': 'Corn', 'group': 'Frozen'}})
+        assert other['i900'].name == 'Corn' and db['i900'].name == 'Peas'
+        assert other['i900'].group is other['g00'] and db['i900'].group is db['g00']
+        assert 'Corn' not in db.item_names
+
+    def test_007_dirty_tracking(self, db):
+        db.clear_dirty()
+        peas = db['i900']
+        db.set_new_defaults(ItemPool([(peas, '3', 'frozen')]))
+        assert db.dirty == {'i900'} and peas.dirty
+        assert not db['i901'].dirty
+        db.clear_dirty()
+        assert not db.dirty and not peas.dirty
+
+    def test_008_items_by_group(self):
+        other = Database(groups=['Frozen', 'Spices', 'Bakery'], stores={},
+                         items={'i900': {'name': 'Peas', 'group': 'Frozen'},
+                                'i901': {'name': 'Cumin', 'group': 'Spices'}})
+        frozen, spices, bakery = other['g00'], other['g01'], other['g02']
+        changes = []
+        other.catalog.group_listeners.append(lambda *args: changes.append(args))
+        assert set(other.items_by_group) == {frozen, spices}
+
+        peas = other['i900']
+        peas.group = 'Bakery'
+        assert changes == [(peas, frozen, bakery)]
+        assert set(other.items_by_group) == {spices, bakery}
+        assert list(other.items_by_group[bakery]) == [peas]
+
+        bread = other.add_new_item({'name': 'Bread', 'group': 'Bakery'})
+        assert changes[1:] == [(bread, None, bakery)]
+        assert other.items_by_group[bakery] == [peas]  # New items are left out
+        other.add_new_item({'name': 'Sorbet', 'group': 'Frozen'})
+        assert set(other.items_by_group) == {spices, bakery}
@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+
+from logical.export import ExportPipeline, ListExport
+
+
+class CountingWriter:
+    """Stands in for a `ListWriter`, counting how often it is rendered"""
+
+    def __init__(self):
+        self.renders = 0
+
+    def render(self, sink, fmt):
+        self.renders += 1
+        sink.write('Grocery List\n')
+
+    def email_head(self, fmt):
+        return 'Subject: test\n\n'
+
+
+class TestExportPipeline:
+
+    def test_001_single_render(self):
+        writer = CountingWriter()
+        export = ListExport({'i000': [1, None]}, writer)
+        assert writer.renders == 1
+        assert export.text == 'Grocery List\n' and export.email == 'Subject: test\n\nGrocery List\n'
+        assert ListExport({}).text is None
+
+    def test_002_order(self):
+        listed = threading.Event()
+        prepared = []
+
+        def save_list(export):
+            listed.set()
+            return 'saved'
+
+        def print_list(export):
+            assert listed.is_set()
+            return f'printed {export.text}'
+
+        pipeline = ExportPipeline({'save': (save_list, ()),
+                                   'print': (print_list, ('save',)),
+                                   'pool': (lambda export: 'pool', ()),
+                                   })
+        messages = pipeline.run(lambda: prepared.append(1) or ListExport({}, CountingWriter()),
+                                ['pool', 'print']).result(timeout=5)
+        assert list(messages) == ['pool', 'print'] and messages['print'] == 'printed Grocery List\n'
+        assert prepared == [1]
+        pipeline.shutdown()
+
+    def test_003_failure(self):
+        def fail(export):
+            raise OSError('no printer')
+
+        pipeline = ExportPipeline({'print': (fail, ()), 'email': (lambda export: 'sent', ('print',))}, workers=1)
+        with pytest.raises(OSError):
+            pipeline.run(lambda: ListExport({}), ['email']).result(timeout=5)
+        pipeline.shutdown()
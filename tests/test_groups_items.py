@@ -56,5 +56,10 @@ class TestGroceryItem:
     def test_005_item_sort(self):
         assert sorted({itm3, itm0, itm1, itm2}) == [itm0, itm2, itm3, itm1]
 
+    def test_006_item_hash(self):
+        assert hash(itm1) == hash('i099')
+        assert itm1 in {'i099'} and 'i099' in {itm1}
+        assert itm0 <= itm0 <= itm1 and not itm1 <= itm0
+
 
 
@@ -0,0 +1,83 @@
+import functools
+import hashlib
+import io
+import os
+import tarfile
+import threading
+import urllib.request
+from http import server
+
+import pytest
+
+from data.host import ChunkedWriter, MyHandler, build_manifest, bundle_paths, get_date
+
+
+class TestManifest:
+
+    def test_001_sections(self, tmp_path):
+        os.makedirs(tmp_path / 'stores')
+        os.makedirs(tmp_path / 'username' / 'pools')
+        (tmp_path / 'groups.txt').write_text('Produce\n')
+        (tmp_path / 'stores' / 'testmart.yaml').write_text('l01: {}\n')
+        (tmp_path / 'username' / 'pools' / '2020.02.23.itempool.yaml').write_text('i000: [1, null]\n')
+
+        manifest = build_manifest(str(tmp_path), 'username')
+        assert list(manifest['data']) == ['groups.txt']  # Missing database and journal are left out
+        assert list(manifest['stores']) == ['stores/testmart.yaml']
+        assert list(manifest['pools']) == ['username/pools/2020.02.23.itempool.yaml']
+        assert manifest['lists'] == {}
+        assert manifest['data']['groups.txt']['sha1'] == hashlib.sha1(b'Produce\n').hexdigest()
+        assert manifest['data']['groups.txt']['size'] == 8
+
+        (tmp_path / 'groups.txt').write_text('Produce\nDeli\n')
+        assert build_manifest(str(tmp_path), 'username')['data']['groups.txt']['size'] == 13
+
+    def test_002_bundle(self, tmp_path):
+        os.makedirs(tmp_path / 'stores')
+        os.makedirs(tmp_path / 'username' / 'pools')
+        (tmp_path / 'groups.txt').write_text('Produce\n')
+        (tmp_path / 'username' / 'username.yaml').write_text('{}\n')
+        (tmp_path / 'stores' / 'testmart.yaml').write_text('l01: {}\n')
+        (tmp_path / 'stores' / 'README.txt').write_text('One file per store\n')
+        (tmp_path / 'username' / 'pools' / '2020.02.23.itempool.yaml').write_text('i000: [1, null]\n')
+        (tmp_path / 'username' / 'pools' / f'{get_date(3)}itempool.yaml').write_text('i001: [1, null]\n')
+
+        assert bundle_paths(str(tmp_path), 'username') == ['groups.txt',
+                                                          'username/username.yaml',
+                                                          'stores/testmart.yaml',
+                                                          f'username/pools/{get_date(3)}itempool.yaml',
+                                                          ]
+
+
+class TestBundle:
+
+    def test_001_chunks(self):
+        out = io.BytesIO()
+        with ChunkedWriter(out) as chunked:
+            chunked.write(b'Produce\n')
+            chunked.write(b'')
+        assert out.getvalue() == b'8\r\nProduce\n\r\n0\r\n\r\n'
+
+        out = io.BytesIO()
+        with pytest.raises(OSError), ChunkedWriter(out) as chunked:
+            chunked.write(b'Produce\n')
+            raise OSError('File removed while sending')
+        assert out.getvalue() == b'8\r\nProduce\n\r\n'  # Left unterminated
+
+    def test_002_manifest_first(self, tmp_path):
+        os.makedirs(tmp_path / 'stores')
+        os.makedirs(tmp_path / 'username')
+        (tmp_path / 'groups.txt').write_text('Produce\n')
+        (tmp_path / 'username' / 'username.yaml').write_text('{}\n')
+        (tmp_path / 'stores' / 'testmart.yaml').write_text('l01: {}\n')
+
+        host = server.ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(MyHandler, directory=str(tmp_path)))
+        threading.Thread(target=host.serve_forever, daemon=True).start()
+        try:
+            url = f'http://127.0.0.1:{host.server_address[1]}/username/bundle.tar.gz'
+            with urllib.request.urlopen(url) as r, tarfile.open(fileobj=r, mode='r|gz') as bundle:
+                names = [member.name for member in bundle]
+        finally:
+            host.shutdown()
+            host.server_close()
+        assert names == ['username/manifest.json', *bundle_paths(str(tmp_path), 'username')]
@@ -0,0 +1,141 @@
+import hashlib
+import io
+import json
+import tarfile
+from types import SimpleNamespace
+
+import pytest
+
+from logical.host_files import HostFiles
+from logical.http_cache import ResponseCache
+
+URL = 'http://127.0.0.1:42209'
+files = {'groups.txt': b'Produce\nDeli\n',
+         'username/username.yaml': b'i000: {name: Apples, group: g00}\n',
+         'username/username.journal': b'{"i001": {"name": "Ham", "group": "g01"}}\n',
+         'stores/testmart.yaml': b'l01: {_name: produce, _is_special: false, items: [i000]}\n',
+         'stores/othermart.yaml': b'l01: {_name: deli, _is_special: false, items: [i001]}\n',
+         'username/pools/2020.02.23.itempool.yaml': b'i000: [2, null]\n',
+         }
+not_stores = {'stores/README.txt': b'One file per store\n', 'stores/giant.yaml.bak': b'l01: {\n'}
+
+
+def manifest_of(paths):
+    sections = {'data': {}, 'stores': {}, 'pools': {}, 'lists': {}}
+    for path in paths:
+        section = 'stores' if path.startswith('stores/') else 'pools' if '/pools/' in path else 'data'
+        sections[section][path] = {'sha1': hashlib.sha1({**files, **not_stores}[path]).hexdigest()}
+    return sections
+
+
+def bundle_of(paths, manifest):
+    body = io.BytesIO()
+    with tarfile.open(fileobj=body, mode='w|gz', format=tarfile.PAX_FORMAT) as bundle:
+        for path, content in [('username/manifest.json', json.dumps(manifest).encode()),
+                              *((path, {**files, **not_stores}[path]) for path in paths)]:
+            info = tarfile.TarInfo(path)
+            info.size = len(content)
+            info.pax_headers = {'GROCERIES.etag': f'"{len(content):x}"'}
+            bundle.addfile(info, io.BytesIO(content))
+    return body.getvalue()
+
+
+class Response:
+
+    def __init__(self, body):
+        self.ok = body is not None
+        self.raw = io.BytesIO(body or b'')
+        self.text = (body or b'').decode(errors='replace')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        pass
+
+
+class Session:
+    """Just what `HostFiles` uses of a `PooledSession`, serving `served` (URL -> body)"""
+
+    def __init__(self, served, cache):
+        self.served = served
+        self.cache = cache
+        self.stats = SimpleNamespace(fetched=lambda size, revalidated=False: None)
+        self.requested = []
+
+    def fetch(self, url, digest=None):
+        self.requested.append((url, digest))
+        return self.served.get(url)
+
+    def get(self, url, **_):
+        self.requested.append((url, None))
+        return Response(self.served.get(url))
+
+
+@pytest.fixture
+def host(tmp_path):
+    def make(served, **kwargs):
+        session = Session({f'{URL}/{path}': body for path, body in served.items()}, ResponseCache(str(tmp_path)))
+        return HostFiles(session, URL, 'username', **kwargs)
+    return make
+
+
+class TestHostFiles:
+
+    def test_001_fetch(self, host):
+        files_ = host(files)
+        assert files_.fetch('data', 'groups.txt') == files['groups.txt']
+        assert files_.session.requested == [(f'{URL}/groups.txt', None)]
+
+        files_.manifest = manifest_of(['groups.txt'])
+        assert files_.fetch('data', 'groups.txt') == files['groups.txt']
+        assert files_.session.requested[-1] == (f'{URL}/groups.txt', files_.manifest['data']['groups.txt']['sha1'])
+        assert files_.fetch('data', 'username/username.journal') is None  # Not listed, so not requested
+        assert len(files_.session.requested) == 2
+
+    def test_002_required(self, host):
+        files_ = host({'groups.txt': files['groups.txt']})
+        assert files_.read_groups() == ['Produce', 'Deli']
+        assert files_.read_journal() is None
+        with pytest.raises(FileNotFoundError, match='username/username.yaml'):
+            files_.read_items()
+
+    def test_003_read_sources(self, host):
+        paths = [path for path in files if '/pools/' not in path]
+        files_ = host({**files, 'username/manifest.json': json.dumps(manifest_of(paths)).encode()}, workers=2)
+        groups, stores, items, journal = files_.read_sources()
+        assert groups == ['Produce', 'Deli'] and set(stores) == {'testmart', 'othermart'}
+        assert stores['testmart']['l01']['items'] == ['i000']
+        assert items == {'i000': {'name': 'Apples', 'group': 'g00'}}
+        assert journal == files['username/username.journal'].decode()
+
+    def test_004_bundle(self, host):
+        paths = list(files)
+        files_ = host({'username/bundle.tar.gz': bundle_of(paths, manifest_of(paths))})
+        groups, stores, items, journal = files_.read_bundle()
+        assert groups == ['Produce', 'Deli'] and set(stores) == {'testmart', 'othermart'}
+        assert items == {'i000': {'name': 'Apples', 'group': 'g00'}} and journal.startswith('{"i001"')
+        assert files_.bundled_pools == {'2020.02.23.itempool.yaml': files['username/pools/2020.02.23.itempool.yaml']}
+        assert files_.manifest == manifest_of(paths)
+        assert files_.session.cache.load(f'{URL}/groups.txt') == files['groups.txt']
+        assert files_.session.requested == [(f'{URL}/username/bundle.tar.gz', None)]
+
+    def test_005_incomplete_bundle(self, host):
+        paths = list(files)
+        bundle = bundle_of(paths, manifest_of(paths))
+        for body in (bundle_of(paths[:-2], manifest_of(paths)),  # A listed store left out
+                     bundle_of(paths[1:], manifest_of(paths[1:])),  # No groups
+                     bundle[:len(bundle) // 2],  # Broken off
+                     None):  # No bundle on the host
+            files_ = host({'username/bundle.tar.gz': body})
+            assert files_.read_bundle() is None
+            assert files_.manifest is None
+
+    def test_006_not_stores(self, host):
+        paths = list(files)
+        listed = manifest_of([*paths, *not_stores])
+        for bundled in (paths, [*paths, *not_stores]):  # Other files of the stores directory needn't come along
+            files_ = host({'username/bundle.tar.gz': bundle_of(bundled, listed)})
+            groups, stores, items, journal = files_.read_bundle()
+            assert set(stores) == {'testmart', 'othermart'}
+        assert list(files_.store_filenames()) == ['testmart.yaml', 'othermart.yaml']
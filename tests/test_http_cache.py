@@ -0,0 +1,26 @@
+from logical.http_cache import ResponseCache
+
+URL = 'http://127.0.0.1:42209/groups.txt'
+
+
+class TestResponseCache:
+
+    def test_001_revalidate(self, tmp_path):
+        cache = ResponseCache(str(tmp_path / 'http_cache'))
+        assert cache.conditions(URL) == {}
+        cache.store(URL, b'Produce\n', etag='"1a-8"', last_modified='Sun, 23 Feb 2020 10:00:00 GMT')
+
+        reopened = ResponseCache(str(tmp_path / 'http_cache'))
+        assert reopened.conditions(URL) == {'If-None-Match': '"1a-8"',
+                                            'If-Modified-Since': 'Sun, 23 Feb 2020 10:00:00 GMT'}
+        assert reopened.load(URL) == b'Produce\n'
+        assert reopened.digest(URL) == '096fe547d5449e44d6c5e2c2b452d1f3ee0b48ed'
+
+    def test_002_forget(self, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        cache.store(URL, b'Produce\n', etag='"1a-8"')
+        cache.store(URL, b'Deli\n')  # Served without validators, so it can't be revalidated later
+        assert cache.conditions(URL) == {}
+        cache.store(URL, b'Deli\n', last_modified='Sun, 23 Feb 2020 10:00:00 GMT')
+        cache.discard(URL)
+        assert ResponseCache(str(tmp_path)).conditions(URL) == {}
@@ -0,0 +1,60 @@
+import hashlib
+
+import pytest
+
+requests = pytest.importorskip('requests')
+
+from logical.http_cache import ResponseCache  # noqa: E402
+from logical.http_session import PooledSession  # noqa: E402
+
+URL = 'http://127.0.0.1:42209/groups.txt'
+
+
+def response(status, body=b'', **headers):
+    r = requests.Response()
+    r.status_code, r._content = status, body
+    r.headers.update(headers)
+    return r
+
+
+@pytest.fixture
+def session(tmp_path):
+    session = PooledSession(cache=ResponseCache(str(tmp_path)))
+    session.responses, session.sent = [], []
+
+    def get(url, headers=None, **_):
+        session.sent.append(headers)
+        return session.responses.pop(0)
+    session.get = get
+    return session
+
+
+class TestPooledSession:
+
+    def test_001_store(self, session):
+        session.responses.append(response(200, b'Produce\n', ETag='"1a-8"'))
+        assert session.fetch(URL) == b'Produce\n'
+        assert session.sent == [{}]
+        assert session.cache.load(URL) == b'Produce\n'
+        assert session.stats.received == 8
+
+    def test_002_not_modified(self, session):
+        session.cache.store(URL, b'Produce\n', etag='"1a-8"')
+        session.responses.append(response(304))
+        assert session.fetch(URL) == b'Produce\n'
+        assert session.sent == [{'If-None-Match': '"1a-8"'}]
+        assert session.stats.revalidated == 1 and session.stats.received == 0
+
+    def test_003_digest(self, session):
+        session.cache.store(URL, b'Produce\n', etag='"1a-8"')
+        assert session.fetch(URL, hashlib.sha1(b'Produce\n').hexdigest()) == b'Produce\n'
+        assert session.sent == []  # Listed with the same hash, so not requested
+        session.responses.append(response(200, b'Deli\n', ETag='"1b-5"'))
+        assert session.fetch(URL, hashlib.sha1(b'Deli\n').hexdigest()) == b'Deli\n'
+        assert session.sent == [{'If-None-Match': '"1a-8"'}]
+
+    def test_004_missing(self, session):
+        session.cache.store(URL, b'Produce\n', etag='"1a-8"')
+        session.responses.append(response(404, b'Not found'))
+        assert session.fetch(URL) is None
+        assert session.cache.digest(URL) is None
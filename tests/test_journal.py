@@ -0,0 +1,46 @@
+from logical.journal import ChangeJournal
+
+apples = {'name': 'Apples', 'group': 'g00', 'note': '', 'defaults': [[1575308394, 2]]}
+plums = {'name': 'Plums', 'group': 'g00', 'note': 'ripe', 'defaults': [[1580954934, None]]}
+
+
+class TestChangeJournal:
+
+    def test_001_replay(self, tmp_path):
+        journal = ChangeJournal(str(tmp_path / 'db.journal'))
+        assert journal.replay({'i000': {}}) == {'i000': {}}
+        journal.append({'i000': apples})
+        journal.append({'i000': dict(apples, note='red'), 'i001': plums})
+
+        fresh = ChangeJournal(journal.path)
+        items = fresh.replay({'i000': {}, 'i002': {}})
+        assert items == {'i000': dict(apples, note='red'), 'i001': plums, 'i002': {}}
+        assert fresh.length == 3
+
+    def test_002_torn_record(self, tmp_path):
+        journal = ChangeJournal(str(tmp_path / 'db.journal'))
+        journal.append({'i000': apples})
+        with open(journal.path, 'a') as f:
+            f.write('{"i001": {"na')
+        assert journal.replay({}) == {'i000': apples}
+
+    def test_003_compact(self, tmp_path):
+        journal = ChangeJournal(str(tmp_path / 'db.journal'), limit=2)
+        base = {}
+        journal.append({'i000': apples, 'i001': plums})
+        assert journal.needs_compaction
+        journal.compact(lambda: journal.replay(base)).join()
+        assert base == {'i000': apples, 'i001': plums}
+        assert journal.length == 0 and journal.replay({}) == {}
+
+    def test_004_append_after_torn_record(self, tmp_path):
+        journal = ChangeJournal(str(tmp_path / 'db.journal'))
+        journal.append({'i000': apples})
+        with open(journal.path, 'a') as f:
+            f.write('{"i002": {"na')
+        assert journal.replay({}) == {'i000': apples}  # Cuts the torn line off the file
+        journal.append({'i001': plums})
+        journal.append({'i000': dict(apples, note='red')})
+        fresh = ChangeJournal(journal.path)
+        assert fresh.replay({}) == {'i000': dict(apples, note='red'), 'i001': plums}
+        assert fresh.length == 3
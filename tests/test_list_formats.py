@@ -0,0 +1,98 @@
+import io
+import json
+
+import pytest
+
+from logical.database import Database
+from logical.list_formats import FORMATS
+from logical.pools_and_lists import ItemPool, ListWriter
+
+
+class RenderedList:
+    """Just the parts of a `ListWriter` that formats read"""
+
+    def __init__(self, db):
+        self.title = 'Grocery List: 2020.02.23 (Testmart)'
+        self.notices = ['List contains 1 unsorted item(s).']
+        store = db['testmart']
+        self._sections = [(store.locations['s00l01'], [(db['i600'], 2, 'ripe'), (db['i601'], '·', '')]),
+                          (store.unsorted, [(db['i602'], 1, '')])]
+
+    def sections(self):
+        return iter(self._sections)
+
+
+@pytest.fixture(scope='module')
+def rendered():
+    db = Database(groups=['Produce'],
+                  stores={'testmart': {'l01': {'_name': 'produce', '_is_special': False, 'items': ['i600', 'i601']}}},
+                  items={'i600': {'name': 'Apples', 'group': 'Produce'},
+                         'i601': {'name': 'Kiwi', 'group': 'Produce'},
+                         'i602': {'name': 'Fish & Chips', 'group': 'Produce'}})
+    return RenderedList(db)
+
+
+def render(rendered, fmt):
+    sink = io.StringIO()
+    FORMATS[fmt].render(rendered, sink)
+    return sink.getvalue()
+
+
+class TestListFormats:
+
+    def test_001_plaintext(self, rendered):
+        assert render(rendered, 'plaintext') == ('Grocery List: 2020.02.23 (Testmart)\n'
+                                                 'List contains 1 unsorted item(s).\n'
+                                                 '\nProduce:\n  Apples: 2\n    -ripe\n  Kiwi\n'
+                                                 '\nUnsorted:\n  Fish & Chips: 1\n')
+
+    def test_002_markdown(self, rendered):
+        text = render(rendered, 'markdown')
+        assert text.startswith('# Grocery List') and '## Produce\n\n- Apples: 2\n  - *ripe*\n- Kiwi\n' in text
+
+    def test_003_html(self, rendered):
+        text = render(rendered, 'html')
+        assert '<li>Fish &amp; Chips: 1</li>' in text and text.endswith('</html>\n')
+
+    def test_004_json(self, rendered):
+        data = json.loads(render(rendered, 'json'))
+        assert data['notices'] == rendered.notices
+        assert data['locations'][0]['items'][1] == {'name': 'Kiwi', 'amount': None, 'note': ''}
+
+
+@pytest.fixture
+def writer():
+    db = Database(groups=['Produce'],
+                  stores={'testmart': {'l01': {'_name': 'produce', '_is_special': False, 'items': ['i600', 'i601']}}},
+                  items={'i600': {'name': 'Apples', 'group': 'Produce'},
+                         'i601': {'name': 'Kiwi', 'group': 'Produce'},
+                         'i602': {'name': 'Fish & Chips', 'group': 'Produce'}})
+    pool = ItemPool({(db['i600'], 2, 'ripe'), (db['i601'], '·', ''), (db['i602'], 1, '')})
+    return ListWriter(pool, db['testmart'])
+
+
+class TestListWriter:
+
+    def test_001_render(self, writer):
+        sink = io.StringIO()
+        writer.render(sink)
+        assert sink.getvalue() == (f'Grocery List: {writer.get_date()} (Testmart)\n'
+                                   'List contains 1 unsorted item(s).\n'
+                                   '\nUnsorted:\n  Fish & Chips: 1\n'
+                                   '\nProduce:\n  Apples: 2\n    -ripe\n  Kiwi\n')
+
+    def test_002_render_email(self, writer):
+        sink = io.StringIO()
+        writer.render_email(sink, 'html')
+        head, body = sink.getvalue().split('\n\n', 1)
+        assert head == (f'Subject: Testmart grocery list: {writer.get_date()}: UNS:1- \n'
+                        'MIME-Version: 1.0\nContent-Type: text/html; charset="utf-8"')
+        assert body.startswith('<!DOCTYPE html>') and '<li>Fish &amp; Chips: 1</li>' in body
+
+    def test_003_format_plaintext(self, writer):
+        writer.format_plaintext()
+        rendered, email = io.StringIO(), io.StringIO()
+        writer.render(rendered)
+        writer.render_email(email)
+        assert writer.content == rendered.getvalue()
+        assert writer.email_content == email.getvalue()
@@ -0,0 +1,43 @@
+import datetime
+import os
+
+from logical.pool_index import PoolDirectory, PoolIndex, pool_date
+
+names = [f'2020.{m:02}.{d:02}.itempool.yaml' for m in range(1, 13) for d in (1, 15)]
+
+
+class TestPoolIndex:
+
+    def test_001_dates(self):
+        assert pool_date('data/pools/2020.02.23.itempool.yaml') == '2020.02.23'
+        assert pool_date('2020.02.23.') == pool_date('2020.02.23') == '2020.02.23'
+        assert pool_date(datetime.date(2020, 2, 3)) == '2020.02.03'
+        assert pool_date('notes.txt') is None
+
+    def test_002_lookups(self):
+        index = PoolIndex(reversed(names + ['notes.txt']))
+        assert len(index) == 24 and index.names == names
+        assert index.latest(2) == ['2020.12.15.itempool.yaml', '2020.12.01.itempool.yaml']
+        assert index.latest(100) == names[::-1]
+        assert index.for_date('2020.03.15.') == '2020.03.15.itempool.yaml'
+        assert index.for_date('2020.03.14') is None
+        assert index.in_range('2020.02.02', datetime.date(2020, 3, 15)) == names[3:6]
+
+    def test_003_update(self):
+        index = PoolIndex(names)
+        index.update(names[1:] + ['2021.01.01.itempool.yaml'])
+        assert index.names == names[1:] + ['2021.01.01.itempool.yaml']
+
+    def test_004_directory(self, tmp_path):
+        pools, index_path = tmp_path / 'pools', str(tmp_path / 'pools.index')
+        pools.mkdir()
+        for name in names[:3]:
+            (pools / name).write_text('{}')
+        os.utime(pools, (0, 0))  # Settled, so the listing is saved along with the directory's mtime
+        assert PoolDirectory(str(pools), index_path).refresh().names == names[:3]
+
+        (pools / names[3]).write_text('{}')
+        os.utime(pools, (0, 0))  # Same mtime as the saved index: the directory isn't listed again
+        assert PoolDirectory(str(pools), index_path).refresh().names == names[:3]
+        os.utime(pools, (1, 1))
+        assert PoolDirectory(str(pools), index_path).refresh().names == names[:4]
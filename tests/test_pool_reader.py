@@ -0,0 +1,37 @@
+import os
+from pathlib import Path
+
+import yaml
+
+from logical.pool_reader import PoolCache, read_pool_records
+
+pool = {'i000': [2, ''], 'Bread (i123);g01': [None, 'sliced'], 'i002': [3, '123']}
+
+
+class TestPoolReader:
+
+    def test_001_records(self):
+        assert list(read_pool_records(yaml.dump(pool))) == [(k, *v) for k, v in sorted(pool.items())]
+        assert list(read_pool_records('{}')) == []
+
+    def test_002_documents(self):
+        text = yaml.dump({'i000': [2, '']}) + '---\n' + yaml.dump({'i009': [1, 'x']})
+        assert [key for key, _, _ in read_pool_records(text)] == ['i000', 'i009']
+
+    def test_003_cache(self, tmp_path):
+        path = tmp_path / 'itempool.yaml'
+        path.write_text(yaml.dump(pool))
+        reads = []
+        cache = PoolCache(lambda p: reads.append(p) or tuple(read_pool_records(Path(p).read_bytes())))
+        first = cache(str(path))
+        assert cache(str(path)) is first and len(reads) == 1
+
+        path.write_text(yaml.dump({'i000': [5, '']}))
+        os.utime(path, ns=(0, 0))
+        assert cache(str(path)) == (('i000', 5, ''),) and len(reads) == 2
+
+    def test_004_scalars(self):
+        text = "i000: [1.5, true]\ni001: [0x10, 'yes']\ni002: [~, 2020-02-23]\ni003: [2, on sale]\n"
+        assert list(read_pool_records(text)) == [(k, *v) for k, v in yaml.safe_load(text).items()]
+        assert list(read_pool_records(yaml.dump({'i000': [2, 'true'], 'i001': [None, '1.5']}))) == \
+            [('i000', 2, 'true'), ('i001', None, '1.5')]
@@ -1,3 +1,4 @@
+from logical.bitsets import BitIndex
 from logical.pools_and_lists import ItemPool, ListWriter
 from tests.test_groups_items import itm0, itm1, itm2, itm3
 
@@ -24,3 +25,23 @@ class TestItemPool:
 
 
 
+
+    def test_003_merge_many(self):
+        pool2 = ItemPool({(itm1, '3', 'big'), (itm3, '4', 'ripe')})
+        merged = ItemPool.merge_many((pool0, None, pool1, pool2))
+        assert len(merged) == 4 and merged[itm0.uid] == (itm0, '·', '')
+        assert merged[itm1.uid] == (itm1, 5, 'big') and merged[itm2.uid] == (itm2, 10, '')
+        assert merged[itm3.uid] == (itm3, '·', 'ripe')
+
+    def test_004_merge_policies(self):
+        pool2 = ItemPool({(itm1, '3', 'big'), (itm3, '4', 'ripe')})
+        assert ItemPool.merge_many((pool0, pool2), 'max')[itm1.uid][1] == 3
+        assert ItemPool.merge_many((pool0, pool1, pool2), 'sum')[itm3.uid][1] == 4
+        assert ItemPool.merge_many((pool2, pool0), 'latest')[itm1.uid] == (itm1, 2, '')
+        first_wins = ItemPool.merge_many((pool0, pool2), lambda a0, n0, a1, n1: (a0, n0))
+        assert first_wins[itm1.uid] == (itm1, 2, '')
+
+    def test_005_bitsets(self):
+        index = BitIndex()
+        both = pool0.bitset(index) & pool1.bitset(index)
+        assert index.members(both) == [itm2.uid]
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from logical.database import Database
+from logical.snapshot import LazySnapshot, SnapshotError, is_fresh, load_snapshot, write_snapshot
+
+groups = ['Produce', 'Deli', '']
+stores = {'testmart': {'l01': {'_name': 'Produce', '_is_special': False, 'items': ['i000', None]},
+                       'l02': {'_name': 'walmart', '_is_special': True, 'items': []}}}
+items = {'i000': {'name': 'Apples', 'group': 'g00', 'note': 'if ripe',
+                  'defaults': [[1575308394, 2], [1582000047, None]]},
+         'i001': {'name': 'Ham', 'group': 'g01', 'note': '', 'defaults': []}}
+
+
+class TestSnapshot:
+
+    def test_001_round_trip(self, tmp_path):
+        path = str(tmp_path / 'db.snapshot')
+        write_snapshot(path, groups, stores, items)
+        groups_, stores_, items_ = load_snapshot(path)
+        assert groups_ == groups
+        assert items_ == items
+        assert stores_['testmart']['l01']['items'] == ['i000']
+        assert stores_['testmart']['l02'] == stores['testmart']['l02']
+
+    def test_002_bad_file(self, tmp_path):
+        path = tmp_path / 'db.snapshot'
+        with pytest.raises(SnapshotError):
+            load_snapshot(str(path))
+        for content in (b'not a snapshot', b'GRO'):
+            path.write_bytes(content)
+            with pytest.raises(SnapshotError):
+                load_snapshot(str(path))
+
+    def test_003_freshness(self, tmp_path):
+        source, path = tmp_path / 'db.yaml', str(tmp_path / 'db.snapshot')
+        source.write_text('')
+        assert not is_fresh(path, [str(source)])
+        write_snapshot(path, groups, stores, items)
+        assert is_fresh(path, [str(source)])
+        os.utime(source, (os.stat(path).st_mtime + 10,) * 2)
+        assert not is_fresh(path, [str(source)])
+
+    def test_004_lazy_items(self, tmp_path):
+        path = str(tmp_path / 'db.snapshot')
+        write_snapshot(path, groups, stores, items)
+        lazy = LazySnapshot(path)
+        assert lazy.headers['i000'] == {'name': 'Apples', 'group': 'g00'}
+        db = Database(groups=lazy.groups, stores=lazy.stores, items=dict(lazy.headers), records=lazy)
+        apples, ham = db['i000'], db['i001']
+        assert not apples.loaded and apples.group.name == 'Produce'
+        assert apples.defaults == [(1575308394, 2), (1582000047, '\u00B7')]
+        assert apples.note == 'if ripe' and apples.loaded and not ham.loaded
+        ham.note = 'sliced'
+        assert ham.note == 'sliced' and len(ham.defaults) == 1
+
+    def test_005_lazy_after_rewrite(self, tmp_path):
+        path = str(tmp_path / 'db.snapshot')
+        write_snapshot(path, groups, stores, items)
+        lazy = LazySnapshot(path)
+        changed = dict(items, i000=dict(items['i000'], defaults=[[1600000000, 5]]))
+        write_snapshot(path, groups, stores, {'i002': items['i001'], **changed})
+        assert lazy('i000')['defaults'] == [[1600000000, 5]]
+
+    def test_006_unstorable_amount(self, tmp_path):
+        path = tmp_path / 'db.snapshot'
+        for amount in ('1 lb', '·'):
+            odd = {'i000': dict(items['i000'], defaults=[[1575308394, amount]])}
+            with pytest.raises(SnapshotError):
+                write_snapshot(str(path), groups, stores, odd)
+            assert not path.exists() and not (tmp_path / 'db.snapshot.tmp').exists()
@@ -0,0 +1,65 @@
+from logical.database import Database
+from logical.sqlite_backend import SqliteBackend, read_pool_files
+
+groups = ['Produce', 'Deli', '']
+stores = {'testmart': {'l01': {'_name': 'Produce', '_is_special': False, 'items': ['i000', 'i001']},
+                       'l02': {'_name': 'walmart', '_is_special': True, 'items': []}}}
+items = {'i000': {'name': 'Apples', 'group': 'g00', 'note': 'if ripe',
+                  'defaults': [[1575308394, 2], [1582000047, None]]},
+         'i001': {'name': 'Ham', 'group': 'g01', 'note': '', 'defaults': []}}
+
+
+def migrated(tmp_path):
+    pools = tmp_path / 'pools'
+    pools.mkdir()
+    (pools / '2020.02.23.itempool.yaml').write_text('i000: [2, null]\n---\ni001: [1, sliced]\n')
+    (pools / '2020.03.01.itempool.yaml').write_text('i001: [null, null]\n')
+    backend = SqliteBackend(str(tmp_path / 'db.sqlite3'))
+    backend.import_sources(groups, stores, items, read_pool_files(str(pools)))
+    return backend
+
+
+class TestSqliteBackend:
+
+    def test_001_migrate(self, tmp_path):
+        backend = SqliteBackend(str(tmp_path / 'db.sqlite3'))
+        assert backend.is_empty()
+        backend = migrated(tmp_path)
+        assert not backend.is_empty()
+        groups_, stores_, items_ = backend.read_sources()
+        assert groups_ == groups[:2]
+        assert stores_ == stores
+        assert items_ == items
+        assert backend.pool_entries('2020.02.23') == {'i000': [2, None], 'i001': [1, 'sliced']}
+
+    def test_002_database(self, tmp_path):
+        groups_, stores_, items_ = migrated(tmp_path).read_sources()
+        db = Database(groups=groups_, stores=stores_, items=items_, default_store='testmart')
+        assert db['i000'].group.name == 'Produce' and db['i001'].name == 'Ham'
+        assert db.stores['default'] is db.stores['testmart']
+
+    def test_003_pools(self, tmp_path):
+        backend = migrated(tmp_path)
+        assert backend.pool_dates() == ['2020.02.23', '2020.03.01']
+        assert backend.latest_pool_dates(1) == ['2020.03.01']
+        assert backend.pool_dates_in_range('2020.02.01', '2020.02.29.itempool.yaml') == ['2020.02.23']
+        assert backend.has_pool('2020.03.01.') and not backend.has_pool('2020.03.02')
+        backend.write_pool('2020.03.01.', {'i000': [3, None]})
+        assert backend.pool_entries('2020.03.01') == {'i000': [3, None]}
+
+    def test_004_items_in_location(self, tmp_path):
+        backend = migrated(tmp_path)
+        assert backend.items_in_location('Testmart', 'l01') == ['i000', 'i001']
+        backend.replace_store('testmart', {'l01': {'_name': 'Produce', '_is_special': False, 'items': ['i000']},
+                                           'l03': {'_name': 'Deli', '_is_special': False, 'items': ['i001']}})
+        assert backend.items_in_location('testmart', 'l01') == ['i000']
+        assert backend.items_in_location('testmart', 'l03') == ['i001']
+
+    def test_005_write_items(self, tmp_path):
+        backend = migrated(tmp_path)
+        backend.write_items({'i000': dict(items['i000'], defaults=[[3, 4]]),
+                             'i002': {'name': 'Bread', 'group': 'g00', 'defaults': [[1, 1]]}})
+        _, _, items_ = backend.read_sources()
+        assert items_ == {'i000': dict(items['i000'], defaults=[[3, 4]]),
+                          'i001': items['i001'],
+                          'i002': {'name': 'Bread', 'group': 'g00', 'note': '', 'defaults': [[1, 1]]}}
@@ -0,0 +1,50 @@
+from logical.bitsets import popcount
+from logical.catalog import Catalog
+from logical.stores import Location, Store
+
+loc0 = Location('produce', items={'i000', 'i001'}, uid='s09l01')
+loc1 = Location('deli', items={'i002'}, uid='s09l02', special=True)
+store0 = Store('testmart', {loc0, loc1}, uid='s09')
+
+
+class TestStore:
+
+    def test_001_unsorted(self):
+        assert store0.unsorted.uid == 's09l00'
+        assert store0.unsorted in store0.specials
+        assert loc1 in store0.specials
+
+    def test_002_lookup(self):
+        assert store0['i000'] == 's09l01'
+        assert store0['i002'] == 's09l02'
+
+    def test_003_unmapped_item(self):
+        assert store0['i500'] == 's09l00'
+        assert 'i500' in store0.unsorted.items
+        assert store0.index['i500'] is store0.unsorted
+
+    def test_004_add_item(self):
+        loc1.add_item('i001')
+        assert store0['i001'] == 's09l02'
+        assert 'i001' not in loc0.items
+
+    def test_005_remove_item(self):
+        loc0.remove_item('i000')
+        assert 'i000' not in store0.index
+        assert store0['i000'] == 's09l00'
+
+    def test_006_bitsets(self):
+        catalog = Catalog()
+        aisle, deli = Location('aisle', items={'i000', 'i001'}, uid='s01l01'), Location('deli', uid='s01l02')
+        store = Store('bitmart', {aisle, deli}, uid='s01', catalog=catalog)
+        bits = catalog.bits
+        wanted = bits.bitset(['i001', 'i002', 'i003'])
+        assert bits.members(store.unmapped(wanted)) == ['i002', 'i003']
+        assert store.touched(wanted) == [aisle]
+
+        deli.add_item('i001')
+        store['i003']  # Unmapped items are placed in `Unsorted`
+        assert aisle.bits == bits.bitset(['i000']) and popcount(deli.bits & wanted) == 1
+        assert bits.members(store.unsorted_in(wanted)) == ['i002', 'i003']
+        deli.remove_item('i001')
+        assert deli.bits == 0 and bits.members(store.unmapped(wanted)) == ['i001', 'i002']
@@ -0,0 +1,47 @@
+from logical.uids import UIDAllocator
+
+
+class TestUIDAllocator:
+
+    def test_001_allocate(self):
+        alloc = UIDAllocator('i', 3)
+        assert [alloc.allocate() for _ in range(3)] == ['i000', 'i001', 'i002']
+        assert 'i001' in alloc and 'i003' not in alloc
+
+    def test_002_claim(self):
+        alloc = UIDAllocator('i', 3)
+        assert alloc.claim('i001') == 'i001'
+        assert alloc.claim(5) == 'i005'
+        assert alloc.claim('i001') == 'i000'  # Already taken, so the first gap is used
+        assert alloc.allocate() == 'i002'
+
+    def test_003_free_list(self):
+        alloc = UIDAllocator('g', 2)
+        for _ in range(4):
+            alloc.allocate()
+        alloc.release('g01')
+        assert alloc.allocate() == 'g01'
+        assert alloc.allocate() == 'g04'
+
+    def test_004_reserve(self):
+        alloc = UIDAllocator('s00l', 2)
+        alloc.claim('s00l07')
+        block = alloc.reserve(3)
+        assert block == ['s00l08', 's00l09', 's00l10']
+        assert alloc.claim('s00l09') == 's00l09'
+        assert alloc.allocate() == 's00l00'
+        assert 's00l08' not in alloc
+
+    def test_005_no_recursion(self):
+        alloc = UIDAllocator('i', 3)
+        for n in range(5000):
+            alloc.claim(n)
+        assert alloc.allocate() == 'i5000'
+
+    def test_006_next_after_high(self):
+        alloc = UIDAllocator('s00l', 2)
+        for uid in ('s00l01', 's00l02', 's00l05'):
+            alloc.claim(uid, exclusive=False)
+        assert alloc.next_after_high() == 's00l06'  # Locations are ordered by uid, so gaps aren't filled
+        assert alloc.next_after_high() == 's00l07'
+        assert 's00l06' in alloc
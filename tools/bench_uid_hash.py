@@ -0,0 +1,45 @@
+"""Micro-benchmark: cost of building sets of `GroceryItem`s with uid-based hashing versus the previous
+`hash(repr(self))` implementation. Run from the repository root with `python -m tools.bench_uid_hash`.
+"""
+import timeit
+
+from logical import UIDRoot
+from logical.groups_and_items import DisplayGroup, GroceryItem
+
+CATALOG_SIZE = 50_000
+REPEAT = 5
+
+
+def legacy_hash(self):
+    return hash(self.__repr__())
+
+
+def build_catalog(n):
+    group = DisplayGroup('Benchmark', uid='g99')
+    return [GroceryItem(name=f'Item {i}', uid='i' + str(i).zfill(5), group=group,
+                        defaults=[(1580954934, 2), (1582000224, None), (1582646761, 3)], note='bench')
+            for i in range(n)]
+
+
+def time_set_building(items):
+    return min(timeit.repeat(lambda: set(items), number=1, repeat=REPEAT))
+
+
+def main():
+    items = build_catalog(CATALOG_SIZE)
+    current_hash = UIDRoot.__hash__
+
+    UIDRoot.__hash__ = legacy_hash
+    try:
+        before = time_set_building(items)
+    finally:
+        UIDRoot.__hash__ = current_hash
+    after = time_set_building(items)
+
+    print(f'set() of {CATALOG_SIZE} items, best of {REPEAT}:')
+    print(f'  hash(repr(self)): {before * 1000:8.2f} ms')
+    print(f'  hash(self.uid):   {after * 1000:8.2f} ms  ({before / after:.1f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
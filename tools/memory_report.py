@@ -0,0 +1,85 @@
+"""Compare memory held by the regular and compact representations of the catalog and of a pool.
+Each representation is built in a fresh process so one-time costs, such as interning uids, are not shared.
+
+Run from the repository root: `python -m tools.memory_report [scale]`, where `scale` repeats the catalog
+to approximate a larger household history.
+"""
+import sys
+import tracemalloc
+from multiprocessing import get_context
+
+import yaml
+
+from logical.compact import CompactItemPool
+from logical.database import Database
+from logical.pools_and_lists import ItemPool
+
+GROUPS_PATH = 'data/groups.txt'
+DB_PATH = 'data/username/username.yaml'
+
+
+def load_sources(scale):
+    with open(GROUPS_PATH) as f:
+        groups = f.read().split('\n')
+    with open(DB_PATH) as f:
+        items = yaml.load(f, Loader=yaml.Loader)
+
+    offset = max(int(uid[1:]) for uid in items) + 1
+    scaled = {}
+    for n in range(scale):
+        for uid, kwargs in items.items():
+            scaled['i' + str(n * offset + int(uid[1:])).zfill(3)] = dict(kwargs)
+    return groups, scaled
+
+
+def measure(compact, scale):
+    """Traced bytes retained by `Database.build_items` for one representation"""
+    groups, items = load_sources(scale)
+    db = Database(compact=compact, build_empty=True)
+    db.build_groups(groups)
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    db.build_items(items)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(db.items), after - before
+
+
+def measure_pool(compact, scale):
+    """Traced bytes retained by a pool holding every item of the catalog"""
+    groups, items = load_sources(scale)
+    db = Database(build_empty=True)
+    db.build_groups(groups)
+    db.build_items(items)
+    entries = [(item, n % 7 or '\u00B7', 'note' if n % 5 else '') for n, item in enumerate(db.items.values())]
+
+    source = ItemPool(entries) if compact else None  # Converted from, but not counted
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    pool = CompactItemPool.from_pool(source, catalog=db.catalog) if compact else ItemPool(entries)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(pool), after - before
+
+
+def main():
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    with get_context('spawn').Pool(1, maxtasksperchild=1) as pool:
+        count, regular = pool.apply(measure, (False, scale))
+        _, compact = pool.apply(measure, (True, scale))
+        _, pool_regular = pool.apply(measure_pool, (False, scale))
+        _, pool_compact = pool.apply(measure_pool, (True, scale))
+
+    print(f'Catalog of {count} items built by `Database.build_items`:')
+    print(f'  regular: {regular / 1024:9.1f} KiB  ({regular / count:6.0f} B/item)')
+    print(f'  compact: {compact / 1024:9.1f} KiB  ({compact / count:6.0f} B/item, {compact / regular:.0%} of regular)')
+    print(f'Pool of the same {count} items:')
+    print(f'  ItemPool:        {pool_regular / 1024:9.1f} KiB  ({pool_regular / count:6.0f} B/entry)')
+    print(f'  CompactItemPool: {pool_compact / 1024:9.1f} KiB  ({pool_compact / count:6.0f} B/entry, '
+          f'{pool_compact / pool_regular:.0%} of ItemPool)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,9 @@
+"""One-shot import of the YAML `data/` tree into the SQLite file used by `SqliteManager`.
+Run from the repository root: `python -m tools.migrate_to_sqlite`
+"""
+from logical.sqlite_manager import SqliteManager
+
+if __name__ == '__main__':
+    manager = SqliteManager()
+    manager.migrate()
+    print(f'Migrated data/{manager.username} into {manager.sqlite_path}')
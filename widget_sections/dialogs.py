@@ -183,17 +183,14 @@ class FilePickerDialog(GroceriesAppBaseDialog):
     options = NumericProperty()  # Number of visible widgets
 
     def __init__(self, **kwargs):
-        io = MDApp.get_running_app().io_manager
-        root, names = io.locate_pool(return_names=True)
-        filepaths = [os.path.join(root, n) for n in names]
         super().__init__(**kwargs)
-        self.display_options(filepaths)
+        io = MDApp.get_running_app().io_manager
+        self.display_options(io.latest_pools(self.options))
 
-    def display_options(self, names):
-        """Load the list of choices"""
-        sorted_names = sorted(names, reverse=True)
+    def display_options(self, filepaths):
+        """Load the list of choices, newest first"""
 
-        for filename in sorted_names:
+        for filename in filepaths:
             if FilePickerButton.instances >= self.options:
                 break
             btn = FilePickerButton(self, filename)
@@ -213,14 +210,14 @@ class SaveDialog(GroceriesAppBaseDialog):
         self.app = MDApp.get_running_app()
 
     def list_instructions(self, *args):
-        """Wrap some calls with administrative tasks related to saving"""
-        # self.item_pool.dump_yaml()
-        io = self.app.io_manager
-        for callable_ in args:
-            list_method = getattr(io, callable_)
-            result = list_method(self.item_pool)
+        """Save, print and/or send the pool in the background; the list is rendered once for all of `args`"""
+        exported = self.app.io_manager.export(self.item_pool, args)
         self.dismiss()
-        # noinspection PyUnboundLocalVariable
+        exported.add_done_callback(lambda done: Clock.schedule_once(lambda _: self.complete(done)))
+
+    def complete(self, done):
+        """Report the last step requested, back on the UI thread; errors from the export are raised here"""
+        *_, result = done.result().values()
         Factory.CompleteDialog(result, self.item_pool).open()
 
 
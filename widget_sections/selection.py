@@ -111,6 +111,7 @@ class DisplayGrid(GridLayout):
     def __init__(self, grp, items, **kwargs):
         super().__init__(**kwargs)
         self._scrollview_pos = None
+        self._count = 0
         self.toggles_list = []
         self.group = grp
         self.generate(items)
@@ -119,11 +120,26 @@ class DisplayGrid(GridLayout):
         """Pull information from database to use when constructing subsection"""
 
         items_ = sorted(items, key=lambda i: i.name, reverse=True)
+        self._count = len(items_)
 
         while items_:
             toggle = self.toggle_cls(items_.pop())
             self.toggles_list.append(toggle)
 
+    def regenerate(self, items):
+        """Rebuild this subsection alone after its group gained or lost items.
+        Toggles of items already on display are reused so that their selection state carries over.
+        """
+        toggles = ListState.instance.toggles_dict
+        self.clear_widgets()
+        self.toggles_list = []
+        for item in sorted(items, key=lambda i: i.name):
+            toggle = toggles.get(item.uid)
+            if toggle is None or toggle.parent is not None:  # Toggles still shown in another grid are not moved
+                toggle = self.toggle_cls(item)
+            self.toggles_list.append(toggle)
+        self._count = len(self.toggles_list)
+
     def populate(self):
         for widget in self.toggles_list:
             self.add_widget(widget)
@@ -142,7 +158,7 @@ class DisplayGrid(GridLayout):
 
     @property
     def grid_rows(self):
-        q, r = divmod(len(self.toggles_list) - 1, self.cols)
+        q, r = divmod(self._count - 1, self.cols)
         return q
 
     @property
@@ -159,7 +175,6 @@ class GroupDisplay(BoxLayout):
     """Widget placed in scrollview; holds `SectionHeaders` and `DisplayGrids` (which hold toggle buttons)"""
 
     instance = None
-    _heights_list = []
     _header_height = None
 
     def __init__(self, **kwargs):
@@ -169,23 +184,33 @@ class GroupDisplay(BoxLayout):
         self.app = MDApp.get_running_app()
         groups = self.app.db.items_by_group  # Values used for construction of display
         groups = sorted(groups.items(), key=lambda pair_: pair_[0].uid)
-        self.heightplaceholder = 0
+        self.grids = []  # In display order
 
         for pair in groups:
             group, items = pair
-            header = SectionHeader(group)
             gridlayout = DisplayGrid(group, items)
+            self.add_widget(SectionHeader(group))
+            self.add_widget(gridlayout)
+            self.grids.append(gridlayout)
 
+        self.layout()
+        for gridlayout in self.grids:
+            gridlayout.populate()
+
+        self.app.db.catalog.group_listeners.append(self.on_regrouped)
+
+    def layout(self):
+        """Size each `DisplayGrid` and record where it sits in the scrollview"""
+        self.heightplaceholder = 0
+        heights_list = []
+
+        for gridlayout in self.grids:
             top = self.heightplaceholder  # Top of grid section- pixels
             gridlayout.height = (gridlayout.grid_rows * self.app.item_row_height) \
                                   + gridlayout.spacers_height + self.header_height
             self.heightplaceholder += (self.header_height + gridlayout.height)  # Add height to running total
             gridlayout.set_position(top, self.heightplaceholder)
-
-            self.add_widget(header)
-            self.add_widget(gridlayout)
-            gridlayout.populate()
-            self._heights_list.append(
+            heights_list.append(
                 (gridlayout.group.name, gridlayout, self.heightplaceholder - gridlayout.height, self.heightplaceholder))
 
         self.height = self.heightplaceholder
@@ -194,7 +219,56 @@ class GroupDisplay(BoxLayout):
             x = args[0], (args[1], 1 - args[2] / self.height, 1 - args[3] / self.height)
             return x
 
-        self.heights = {k: v for k, v in (unpack(quad) for quad in self._heights_list)}
+        self.heights = {k: v for k, v in (unpack(quad) for quad in heights_list)}
+
+    def on_regrouped(self, item, old, new):
+        """Catalog listener; only the grids of the two groups involved are rebuilt, the rest are just moved.
+        New items aren't shown here, so their moves are ignored.
+        """
+        db = self.app.db
+        if item.uid not in db.items:
+            return
+        changed = []
+        for group in (old, new):  # The old group first, so that a moved toggle is free to be reused
+            if group is None:
+                continue
+            gridlayout = self._grid_for(group)
+            members = db.group_items(group)
+            if not members:
+                if gridlayout is not None:
+                    self._remove_section(gridlayout)
+            elif gridlayout is None:
+                gridlayout = self._add_section(group, members)
+                changed.append(gridlayout)
+            else:
+                gridlayout.regenerate(members)
+                changed.append(gridlayout)
+
+        self.layout()
+        for gridlayout in changed:
+            gridlayout.populate()
+
+    def _grid_for(self, group):
+        for gridlayout in self.grids:
+            if gridlayout.group is group:
+                return gridlayout
+
+    def _add_section(self, group, members):
+        """Insert a header and grid for a group that had no items when the display was built"""
+        position = sum(1 for gridlayout in self.grids if gridlayout.group.uid < group.uid)
+        gridlayout = DisplayGrid(group, members)
+        index = len(self.children) - 2 * position  # Kivy keeps children in reverse display order
+        self.add_widget(SectionHeader(group), index=index)
+        self.add_widget(gridlayout, index=index)
+        self.grids.insert(position, gridlayout)
+        return gridlayout
+
+    def _remove_section(self, gridlayout):
+        """Drop the header and grid of a group left without items"""
+        header = self.children[self.children.index(gridlayout) + 1]
+        self.remove_widget(header)
+        self.remove_widget(gridlayout)
+        self.grids.remove(gridlayout)
 
     @property
     def header_height(self):